@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Benchmark Chrome driver startup and page load, legacy options
+against utils.driver_factory
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'
+))
+
+from invicodatpy.utils.driver_factory import create_chrome_driver
+
+SIIF_URL = 'https://siif.cgpc.gob.ar/mainSiif/faces/login.jspx'
+
+
+# --------------------------------------------------
+def legacy_driver(invisible:bool) -> webdriver.Chrome:
+    """Driver as ConnectSIIF.init_driver used to build it"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    options = Options()
+    options.add_argument("--window-size=1920,1080")
+    if invisible:
+        options.add_argument("--headless")
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.maximize_window()
+    return driver
+
+# --------------------------------------------------
+def factory_driver(invisible:bool) -> webdriver.Chrome:
+    return create_chrome_driver(invisible=invisible)
+
+# --------------------------------------------------
+def time_driver(make_driver, url:str, invisible:bool) -> tuple:
+    """(startup, page load) seconds"""
+    start = time.perf_counter()
+    driver = make_driver(invisible)
+    started = time.perf_counter()
+    try:
+        driver.get(url)
+        loaded = time.perf_counter()
+    finally:
+        driver.quit()
+    return started - start, loaded - started
+
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Benchmark Chrome driver startup and page load",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        '-u', '--url',
+        default = SIIF_URL,
+        type=str,
+        help = "Page to load")
+
+    parser.add_argument(
+        '-r', '--repeat',
+        default = 3,
+        type=int,
+        help = "Repetitions (best time is reported)")
+
+    parser.add_argument('--invisible', action='store_true')
+    parser.add_argument('--visible', dest='invisible', action='store_false')
+    parser.set_defaults(invisible=True)
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    for name, make_driver in [('legacy', legacy_driver), ('factory', factory_driver)]:
+        timings = [
+            time_driver(make_driver, args.url, args.invisible)
+            for _ in range(args.repeat)
+        ]
+        startup = min(t[0] for t in timings)
+        page_load = min(t[1] for t in timings)
+        print(f"{name:8} startup: {startup:.3f} s   page load: {page_load:.3f} s")
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy root
+    # python benchmarks/bench_driver_startup.py -u https://gv.invico.gov.ar
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Benchmark import time of invicodatpy entry points (each one in a
+fresh interpreter) and report which heavy dependencies they drag in
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SRC_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'
+)
+
+# Statement timed -> what it stands for
+TARGETS = {
+    'import invicodatpy': 'package',
+    'from invicodatpy.sscc import BancoINVICO': 'sscc parser',
+    'from invicodatpy.siif import PptoGtosFteRf602': 'siif report',
+    'from invicodatpy.utils import parse_money': 'utils helper',
+    'import invicodatpy.all': 'everything (old behaviour)',
+}
+
+HEAVY_MODULES = (
+    'selenium', 'webdriver_manager', 'pywinauto', 'gspread', 'oauth2client',
+    'googleapiclient', 'requests', 'sqlalchemy', 'pandas',
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+seconds = time.perf_counter() - start
+heavy = [m for m in sys.argv[2].split(',') if m in sys.modules]
+print(json.dumps({'seconds': seconds, 'modules': len(sys.modules), 'heavy': heavy}))
+"""
+
+
+# --------------------------------------------------
+def time_import(statement:str) -> dict:
+    """Import statement in a fresh interpreter"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        path for path in (SRC_PATH, env.get('PYTHONPATH')) if path
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE, statement, ','.join(HEAVY_MODULES)],
+        capture_output=True, text=True, env=env
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        return {'error': error[-1] if error else 'failed'}
+    return json.loads(result.stdout)
+
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Benchmark invicodatpy import time",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        '-r', '--repeat',
+        default = 5,
+        type=int,
+        help = "Repetitions (best time is reported)")
+
+    parser.add_argument(
+        '-s', '--statement',
+        action = 'append',
+        default = None,
+        type=str,
+        help = "Import statement to time (default: the usual entry points)")
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    statements = args.statement or list(TARGETS)
+    for statement in statements:
+        runs = [time_import(statement) for _ in range(args.repeat)]
+        if 'error' in runs[0]:
+            print(f"{statement:50} error: {runs[0]['error']}")
+            continue
+        best = min(runs, key=lambda run: run['seconds'])
+        print(
+            f"{statement:50} {best['seconds']:.3f} s  "
+            f"{best['modules']:5} modules  heavy: {', '.join(best['heavy']) or '-'}"
+        )
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy root
+    # python benchmarks/bench_import_time.py -r 3
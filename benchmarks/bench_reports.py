@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Benchmark parse (read_xls / read_csv), transform_df, to_sql
+(replace and filtered), from_sql and every Join* class on synthetic
+reports (utils.fixtures) of several sizes; store the results as JSON
+baselines and compare runs against them
+"""
+
+import argparse
+import datetime as dt
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+BASELINES_PATH = os.path.join(BENCH_PATH, 'baselines')
+
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_PATH), 'src'))
+
+from invicodatpy.cli import JOINS, REPORTS
+from invicodatpy.utils.fixtures import FIXTURES, file_format, write_fixture
+
+
+# --------------------------------------------------
+def _version(package:str) -> str:
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+# --------------------------------------------------
+def _len(df) -> int:
+    return None if df is None else len(df)
+
+# --------------------------------------------------
+def measure(func, repeat:int, rows = None) -> dict:
+    """Best wall time of repeat calls of func (rows: int, or a callable
+    of func's result), after an untimed warm-up call (imports, caches,
+    sqlite's first open), and the process peak RSS so far (stages run in
+    order, so it includes the ones before)"""
+    from invicodatpy.utils.metrics import _process_peak_memory, metrics
+    func()
+    best = None
+    for _ in range(repeat):
+        with metrics.stage('bench', 'bench') as record:
+            result = func()
+        best = record if best is None or record.seconds < best.seconds else best
+    rows = rows(result) if callable(rows) else rows
+    return {
+        # Read here, not from the records: they hold tracemalloc's peak
+        # under INVICODAT_TRACE_MEMORY=1
+        'seconds': best.seconds, 'peak_rss': _process_peak_memory(), 'rows': rows,
+        'rows_per_second': rows / best.seconds if rows and best.seconds else None,
+    }
+
+# --------------------------------------------------
+def _read(report, path:str):
+    from invicodatpy.utils.handling_files import read_csv, read_xls
+    if path.endswith('.csv'):
+        # Reports reading csv with names get as many columns
+        names = {'resumen_rend_prov': 70, 'resumen_rend_obras': 70}.get(report)
+        return read_csv(path, names=None if names is None else list(range(names)))
+    return read_xls(path, header=0 if FIXTURES[report].header else None)
+
+# --------------------------------------------------
+def _transformed(name:str, path:str, raw):
+    """Report instance after from_external_report(path), reading raw
+    instead of the file"""
+    report = REPORTS[name].load()()
+    report.read_xls = report.read_csv = lambda *args, **kwargs: raw.copy()
+    report.from_external_report(path)
+    return report
+
+# --------------------------------------------------
+def load_report(name:str, size:int, dir_path:str, repeat:int = 1) -> tuple:
+    """Write, read, transform and load report name. Returns (report
+    instance holding the loaded df, {stage: measures})."""
+    path = write_fixture(name, dir_path, rows=size)
+    results = {}
+    results['read'] = measure(lambda: _read(name, path), repeat, _len)
+    # .xls fixtures are xlsx without xlwt: not comparable with xls reads
+    results['read']['format'] = file_format(path)
+    raw = _read(name, path)
+    results['transform'] = measure(
+        lambda: _transformed(name, path, raw), repeat,
+        lambda report: _len(report.df)
+    )
+    report = _transformed(name, path, raw)
+    sql_path = os.path.join(dir_path, REPORTS[name].system + '.sqlite')
+    results['to_sql_replace'] = measure(
+        lambda: report.to_sql(sql_path, replace=True), repeat, len(report.df)
+    )
+    if report._FILTER_COL:
+        results['to_sql_filtered'] = measure(
+            lambda: report.to_sql(sql_path), repeat, len(report.df)
+        )
+    reader = REPORTS[name].load()()
+    results['from_sql'] = measure(lambda: reader.from_sql(sql_path), repeat, _len)
+    return report, results
+
+# --------------------------------------------------
+def bench_report(name:str, size:int, repeat:int) -> list[dict]:
+    with tempfile.TemporaryDirectory() as dir_path:
+        _, results = load_report(name, size, dir_path, repeat)
+    return [
+        {'bench': name, 'stage': stage, 'size': size, **result}
+        for stage, result in results.items()
+    ]
+
+# --------------------------------------------------
+def bench_join(name:str, size:int, repeat:int) -> list[dict]:
+    from invicodatpy.pipeline import Pipeline
+    join = JOINS[name]
+    with tempfile.TemporaryDirectory() as dir_path:
+        for input_cls in join.load()()._INPUTS:
+            load_report(Pipeline.report_name(input_cls), size, dir_path)
+        sql_path = os.path.join(dir_path, join.system + '.sqlite')
+        result = measure(
+            lambda: join.load()().from_sql(sql_path), repeat, _len
+        )
+    return [{'bench': name, 'stage': 'join', 'size': size, **result}]
+
+# --------------------------------------------------
+def bench(name:str, size:int, repeat:int) -> list[dict]:
+    if name in JOINS:
+        return bench_join(name, size, repeat)
+    return bench_report(name, size, repeat)
+
+# --------------------------------------------------
+def run(names:list, sizes:list, repeat:int) -> dict:
+    """Each report / join and size in a fresh process, so that its peak
+    RSS is its own"""
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for size in sizes:
+        for name in names:
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                try:
+                    records = executor.submit(bench, name, size, repeat).result()
+                except Exception as e:
+                    print(f"Ocurrió un error: {e}, {type(e)}")
+                    continue
+            for record in records:
+                stage = record['stage']
+                if 'format' in record:
+                    stage += f" ({record['format']})"
+                print(
+                    f"{record['bench']:<34} {stage:<16} "
+                    f"{record['size']:>9} {record['seconds']:>9.4f} s "
+                    f"{(record['peak_rss'] or 0) / 2**20:>8.1f} MiB"
+                )
+            results.extend(records)
+    import numpy as np
+    import pandas as pd
+    return {
+        'created': dt.datetime.now().isoformat(timespec='seconds'),
+        'machine': {
+            'platform': platform.platform(), 'processor': platform.processor(),
+            'cpus': os.cpu_count(), 'python': platform.python_version(),
+            'pandas': pd.__version__, 'numpy': np.__version__,
+            'xlwt': _version('xlwt'),
+        },
+        'repeat': repeat,
+        'results': results,
+    }
+
+# --------------------------------------------------
+def baseline_path(name:str) -> str:
+    """A path, or the name of a baseline in benchmarks/baselines"""
+    if os.path.exists(name) or name.endswith('.json'):
+        return name
+    return os.path.join(BASELINES_PATH, name + '.json')
+
+# --------------------------------------------------
+def compare(
+    baseline:dict, current:dict, threshold:float = 0.2,
+    memory_threshold:float = 0.25, min_seconds:float = 0.05
+) -> list[dict]:
+    """Results of current slower (or heavier) than baseline by more than
+    threshold. Stages under min_seconds in the baseline are timer noise
+    and only their memory is compared. Reports read from another file
+    format (xls / xlsx) are not compared: neither their read time nor any
+    stage's peak RSS, which includes the read."""
+    previous = {
+        (r['bench'], r['stage'], r['size']): r for r in baseline['results']
+    }
+    formats = {
+        (r['bench'], r['size']): r.get('format')
+        for r in baseline['results'] if r['stage'] == 'read'
+    }
+    other_format = {
+        (r['bench'], r['size']) for r in current['results']
+        if r['stage'] == 'read'
+        and formats.get((r['bench'], r['size'])) != r.get('format')
+    }
+    regressions = []
+    for result in current['results']:
+        before = previous.get((result['bench'], result['stage'], result['size']))
+        if before is None:
+            continue
+        same_format = (result['bench'], result['size']) not in other_format
+        if result['stage'] == 'read' and not same_format:
+            continue
+        checks = [('peak_rss', memory_threshold)] if same_format else []
+        if before['seconds'] >= min_seconds:
+            checks.append(('seconds', threshold))
+        for key, limit in checks:
+            if not before[key] or result[key] is None:
+                continue
+            ratio = result[key] / before[key]
+            if ratio > 1 + limit:
+                regressions.append({
+                    'bench': result['bench'], 'stage': result['stage'],
+                    'size': result['size'], 'metric': key,
+                    'baseline': before[key], 'current': result[key],
+                    'ratio': ratio,
+                })
+    return regressions
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Benchmark report parsing, loading and joins",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser(
+        'run', help = "Run the benchmarks",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    run_parser.add_argument(
+        'names', nargs='*',
+        help = "Reports and joins (default: all): " + ', '.join(
+            [*[name for name in REPORTS if name in FIXTURES], *JOINS]
+        ))
+    run_parser.add_argument(
+        '-n', '--sizes', nargs='+', default=[1000, 10000], type=int,
+        help = "Data rows of each synthetic report")
+    run_parser.add_argument(
+        '-r', '--repeat', default=3, type=int,
+        help = "Repetitions (best time is reported)")
+    run_parser.add_argument(
+        '-o', '--output', default=None, type=str,
+        help = "JSON file to write the results to")
+    run_parser.add_argument(
+        '--save-baseline', default=None, type=str, metavar='NAME',
+        help = "Also store the results as benchmarks/baselines/NAME.json")
+
+    compare_parser = commands.add_parser(
+        'compare', help = "Flag regressions of a run against a baseline",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    compare_parser.add_argument(
+        'baseline', help = "Baseline name (benchmarks/baselines) or JSON file")
+    compare_parser.add_argument('current', help = "JSON file of bench run -o")
+    compare_parser.add_argument(
+        '-t', '--threshold', default=0.2, type=float,
+        help = "Slowdown flagged as a regression (0.2 = 20 %%)")
+    compare_parser.add_argument(
+        '-m', '--memory-threshold', default=0.25, type=float,
+        help = "Peak RSS growth flagged as a regression")
+    compare_parser.add_argument(
+        '--min-seconds', default=0.05, type=float,
+        help = "Baseline times below this are not compared")
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    if args.command == 'run':
+        names = args.names or [
+            *[name for name in REPORTS if name in FIXTURES], *JOINS
+        ]
+        report = run(names, args.sizes, args.repeat)
+        paths = [args.output] if args.output else []
+        if args.save_baseline:
+            os.makedirs(BASELINES_PATH, exist_ok=True)
+            paths.append(baseline_path(args.save_baseline))
+        for path in paths:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"Results written to {path}")
+        return
+    with open(baseline_path(args.baseline), encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+    regressions = compare(
+        baseline, current, args.threshold, args.memory_threshold, args.min_seconds
+    )
+    for r in regressions:
+        print(
+            f"REGRESSION {r['bench']} {r['stage']} ({r['size']} rows) "
+            f"{r['metric']}: {r['baseline']:.4g} -> {r['current']:.4g} "
+            f"(x{r['ratio']:.2f})"
+        )
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions against {args.baseline}")
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy root
+    # python benchmarks/bench_reports.py run -n 1000 10000 50000 -o bench.json
+    # python benchmarks/bench_reports.py run rcocc31 banco_invico --save-baseline local
+    # python benchmarks/bench_reports.py compare local bench.json -t 0.2
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Benchmark SIIF's rvicon03 transform on a synthetic chart of accounts
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'
+))
+
+from invicodatpy.siif.resumen_contable_cta_rvicon03 import (
+    ResumenContableCtaRvicon03,
+)
+
+TO_NUMERIC_COLS = [
+    'saldo_inicial', 'debe', 'haber', 'ajuste_debe', 'ajuste_haber', 
+    'fondos_debe', 'fondos_haber', 'saldo_final'
+]
+
+
+# --------------------------------------------------
+def synthetic_rvicon03(
+    n_niveles:int = 40, ctas_por_nivel:int = 250, 
+    ejercicio:str = '2024', seed:int = 0
+) -> pd.DataFrame:
+    """Raw rvicon03 xls as read by read_xls (18 header rows, 18 columns)"""
+    rng = np.random.default_rng(seed)
+    n_rows = 18 + n_niveles * (1 + ctas_por_nivel)
+    raw = np.full((n_rows, 18), '', dtype=object)
+    raw[3, 2] = 'Ejercicio ' + ejercicio
+    raw[7, 17] = 'rvicon03'
+    row = 18
+    for i in range(n_niveles):
+        nivel = str(1000 + i * 100)
+        raw[row, 2] = nivel + '    ' + 'NIVEL ' + nivel
+        row += 1
+        amounts = rng.integers(0, 1000000, size=(ctas_por_nivel, 8)) / 100
+        # Roughly one in four accounts has no movements at all
+        amounts[rng.random(ctas_por_nivel) < 0.25] = 0
+        for j in range(ctas_por_nivel):
+            raw[row, 2] = (
+                f'{nivel[:3]}{j % 10}-{j % 7}-{j}-CUENTA {j}--'
+                + ('SUB-' if j % 3 == 0 else '') + 'DESC '
+            )
+            raw[row, [6, 7, 8, 10, 11, 12, 13, 15]] = amounts[j].astype(str)
+            row += 1
+    return pd.DataFrame(raw, columns=[str(x) for x in range(18)])
+
+
+class LegacyRvicon03(ResumenContableCtaRvicon03):
+    """rvicon03 with the row-wise transform_df it used to run, as the
+    reference the real (vectorized) one is checked and timed against"""
+    def transform_df(self) -> pd.DataFrame:
+        df = self.df
+        df['ejercicio'] = df.iloc[3,2][-4:]
+        df = df.tail(-18)
+        df = df.loc[:,[
+            'ejercicio', '2', '6', '7', '8', 
+            '10', '11', '12', '13', '15'
+        ]]
+        df = df.replace(to_replace='', value=None)
+        df = df.dropna(subset=['2'])
+        df = df.rename(columns={
+            '2':'nivel_descripcion', '6':'saldo_inicial', '7':'debe', 
+            '8':'haber', '10':'ajuste_debe', '11':'ajuste_haber', 
+            '12':'fondos_debe', '13':'fondos_haber', '15':'saldo_final'
+        })
+        df['nivel'] = np.where(
+            df['saldo_inicial'].isnull(),
+            df['nivel_descripcion'].str[0:4],
+            None
+        )
+        df['nivel'] = df['nivel'].ffill()
+        df['nivel_desc'] = np.where(
+            df['saldo_inicial'].isnull(),
+            df['nivel_descripcion'].str[8:],
+            None
+        )
+        df['nivel_desc'] = df['nivel_desc'].ffill()
+        df = df.dropna(subset=['saldo_inicial'])
+
+        df['cta_contable'] = df['nivel_descripcion'].str.split(
+            '-', expand=True
+        ).iloc[:,:3].agg('-'.join, axis=1)
+        df['cta_contable_desc'] = df['nivel_descripcion'].apply(
+            lambda x: '-'.join(filter(None, x.split('-')[3:])) if x is not None else None
+        )
+        df = df.loc[:,[
+            'ejercicio', 'nivel', 'nivel_desc', 'cta_contable', 'cta_contable_desc',
+            'saldo_inicial', 'debe', 'haber', 'ajuste_debe', 'ajuste_haber', 
+            'fondos_debe', 'fondos_haber', 'saldo_final'
+        ]]
+        df[TO_NUMERIC_COLS] = df[TO_NUMERIC_COLS].apply(pd.to_numeric)
+        df = df[~df[TO_NUMERIC_COLS].apply(lambda x: (x == 0).all(), axis=1)]
+
+        self.df = df
+        return self.df
+
+
+# --------------------------------------------------
+def transformed(report_cls:type, raw:pd.DataFrame) -> pd.DataFrame:
+    report = report_cls()
+    report.df = raw.copy()
+    return report.transform_df()
+
+
+# --------------------------------------------------
+def best_of(func, repeat:int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Benchmark SIIF's rvicon03 transform",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        '-n', '--niveles', 
+        default = 40,
+        type=int,
+        help = "Number of nivel rows in the synthetic chart of accounts")
+
+    parser.add_argument(
+        '-c', '--cuentas', 
+        default = 250,
+        type=int,
+        help = "Number of accounts per nivel")
+
+    parser.add_argument(
+        '-r', '--repeat', 
+        default = 5,
+        type=int,
+        help = "Repetitions (best time is reported)")
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    raw = synthetic_rvicon03(args.niveles, args.cuentas)
+
+    # Also the untimed warm-up of both
+    legacy = transformed(LegacyRvicon03, raw)
+    current = transformed(ResumenContableCtaRvicon03, raw)
+    pd.testing.assert_frame_equal(legacy, current)
+
+    t_legacy = best_of(lambda: transformed(LegacyRvicon03, raw), args.repeat)
+    t_current = best_of(
+        lambda: transformed(ResumenContableCtaRvicon03, raw), args.repeat
+    )
+
+    print(f"Accounts: {args.niveles * args.cuentas} ({len(current)} with movements)")
+    print(f"transform_df, row-wise:   {t_legacy:.4f} s")
+    print(f"transform_df, vectorized: {t_current:.4f} s "
+          f"(x{t_legacy / t_current:.1f})")
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy root
+    # python benchmarks/bench_rvicon03.py -n 40 -c 250
@@ -29,7 +29,13 @@ setup(
         'oauth2client==4.1.3',
         'sqlalchemy-access==1.1.4',
         'selenium',
+        'requests',
+        'pypdf',
+        'pyarrow<20',
         'pywinauto',
         'webdriver-manager==4.0.0'
-    ]
+    ],
+    entry_points={
+        'console_scripts': ['invicodat = invicodatpy.cli:main'],
+    },
 )
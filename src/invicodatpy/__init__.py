@@ -1 +1,16 @@
-from .all import *
\ No newline at end of file
+from . import _lazy
+
+# Subpackages (and their report modules) are imported on first use of one
+# of their names: 'from invicodatpy import BancoINVICO' only imports sscc's
+# banco_invico. Import invicodatpy.all to load everything upfront.
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all', 'config', 'icaro', 'slave', 'models', 'sgf', 'sgo', 'sgv',
+        'siif', 'sscc', 'utils'
+    ],
+    star_modules=[
+        'icaro.migrate_icaro', 'slave.migrate_slave', 'models', 'sgf', 'sgo',
+        'sgv', 'siif', 'sscc', 'utils'
+    ],
+)
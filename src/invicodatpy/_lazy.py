@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Lazy loading of package attributes (PEP 562), so importing a
+parser does not import every connector (selenium, pywinauto, gspread, ...)
+"""
+
+__all__ = ['attach', 'public_names']
+
+import ast
+import importlib
+import os
+import sys
+
+
+# --------------------------------------------------
+def _top_level_names(body:list) -> list[str]:
+    names = []
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names.append(target.id)
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.append(node.target.id)
+        elif isinstance(node, ast.ImportFrom) and node.level > 0:
+            # Package internal re-exports
+            names.extend(
+                alias.asname or alias.name for alias in node.names
+                if alias.name != '*'
+            )
+        elif isinstance(node, (ast.If, ast.Try)):
+            names.extend(_top_level_names(node.body))
+            names.extend(_top_level_names(node.orelse))
+    return names
+
+# --------------------------------------------------
+def public_names(file_path:str) -> list[str]:
+    """Names 'from module import *' would bring, read from the module
+    source (without importing it)"""
+    with open(file_path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=file_path)
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == '__all__'
+                for target in node.targets
+            )
+        ):
+            try:
+                return list(ast.literal_eval(node.value))
+            except ValueError:
+                break
+    return [
+        name for name in dict.fromkeys(_top_level_names(tree.body))
+        if not name.startswith('_')
+    ]
+
+# --------------------------------------------------
+def attach(
+    package_name:str, submodules:list[str] = (), star_modules:list[str] = ()
+):
+    """__getattr__ and __dir__ for a package __init__.
+    :param submodules: modules (or packages) reachable as attributes, by
+    their last name ('siif.connect_siif' -> package.connect_siif).
+    :param star_modules: modules whose public names the package exposes, as
+    'from .module import *' used to (later modules win on clashes). A
+    package listed here exposes its own lazy names.
+    Nothing is imported until an attribute is first asked for.
+    """
+    modules = {name.rsplit('.', 1)[-1]: name for name in submodules}
+    exports = None
+
+    def load_exports() -> dict:
+        nonlocal exports
+        if exports is None:
+            package_path = sys.modules[package_name].__path__[0]
+            found = {}
+            for star_module in star_modules:
+                path = os.path.join(package_path, *star_module.split('.'))
+                if os.path.isdir(path):
+                    package = importlib.import_module(
+                        '.' + star_module, package_name
+                    )
+                    names = [
+                        name for name in dir(package) if not name.startswith('_')
+                    ]
+                else:
+                    names = public_names(path + '.py')
+                found.update(dict.fromkeys(names, star_module))
+            exports = found
+        return exports
+
+    def __getattr__(name:str):
+        if name in modules:
+            return importlib.import_module('.' + modules[name], package_name)
+        if name == '__all__':
+            return sorted(set(load_exports()) | set(modules))
+        if name.startswith('__'):
+            raise AttributeError(name)
+        module_name = load_exports().get(name)
+        if module_name is None:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            )
+        value = getattr(
+            importlib.import_module('.' + module_name, package_name), name
+        )
+        # Next lookups skip __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(
+            set(load_exports()) | set(modules)
+            | set(vars(sys.modules[package_name]))
+        )
+
+    return __getattr__, __dir__
@@ -0,0 +1,823 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: invicodat command line: download, ingest, join, export and bench
+every report from a single entry point
+"""
+
+__all__ = [
+    'REPORTS', 'JOINS', 'Report', 'download_jobs', 'read_report',
+    'read_report_recorded', 'read_reports', 'main'
+]
+
+import argparse
+import datetime as dt
+import glob
+import importlib
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from .config import settings
+from .utils.metrics import metrics
+from .utils.profiling import profiler
+
+# pandas, selenium and the report modules are imported by the subcommands
+# that need them, so 'invicodat --help' stays instant
+
+
+@dataclass(frozen=True)
+class Report():
+    """
+    :param target: 'module:Class', relative to invicodatpy.
+    :param file_name: file name (or glob pattern) of a period's report;
+    file_name('*') is the default ingest glob.
+    :param period_arg: download_report keyword taking the periods (None
+    when the report is not asked by period).
+    :param download_target: 'module:Class' downloading the files, when it
+    is not target itself.
+    """
+    system:str
+    target:str
+    file_name:object = None
+    period_arg:str = 'ejercicios'
+    download_target:str = None
+
+    # --------------------------------------------------
+    def load(self, download:bool = False) -> type:
+        target = self.download_target if download and self.download_target else self.target
+        module_name, class_name = target.split(':')
+        module = importlib.import_module('.' + module_name, __package__)
+        return getattr(module, class_name)
+
+    # --------------------------------------------------
+    @property
+    def pattern(self) -> str:
+        return None if self.file_name is None else self.file_name('*')
+
+    # --------------------------------------------------
+    @property
+    def downloadable(self) -> bool:
+        return hasattr(self.load(download=True), 'download_report')
+
+    # --------------------------------------------------
+    def files(self, dir_path:str, periods:list = None) -> list[str]:
+        """Existing report files of periods (every period if None)"""
+        if self.file_name is None:
+            return []
+        if periods is None or self.period_arg is None:
+            patterns = [self.pattern]
+        else:
+            patterns = [self.file_name(period) for period in periods]
+        return [
+            path for path in expand_paths(
+                [os.path.join(dir_path, pattern) for pattern in patterns]
+            ) if os.path.exists(path)
+        ]
+
+    # --------------------------------------------------
+    def jobs(
+        self, periods:list, params:dict = None, sql_path:str = None
+    ) -> list[dict]:
+        """download_report keyword arguments. SIIF gets one job per period
+        (spread over the session pool), the other systems one job with
+        every period. Reports with _INPUTS add their download_params, one
+        job per value of each list (per period and cta_contable for
+        rcocc31)."""
+        params = params or {}
+        if self.period_arg is None:
+            return [dict(params)]
+        report_cls = self.load(download=True)
+        if self.system != 'siif' and not report_cls._INPUTS:
+            return [{self.period_arg: periods, **params}]
+        jobs = []
+        for period in periods:
+            job = {self.period_arg: period, **params}
+            if not report_cls._INPUTS:
+                jobs.append(job)
+                continue
+            inputs = report_cls.download_params(period, sql_path)
+            values = [
+                value if isinstance(value, list) else [value]
+                for value in inputs.values()
+            ]
+            jobs.extend(
+                {**job, **dict(zip(inputs, combination))}
+                for combination in itertools.product(*values)
+            )
+        return jobs
+
+    # --------------------------------------------------
+    def expected_files(self, job:dict) -> list[str]:
+        """File names (or glob patterns) a download job leaves, None
+        when they are not known"""
+        report_cls = self.load(download=True)
+        if hasattr(report_cls, 'download_file_names'):
+            return report_cls.download_file_names(**job)
+        if self.file_name is None or self.period_arg is None:
+            return None
+        periods = job[self.period_arg]
+        if not isinstance(periods, list):
+            periods = [periods]
+        return [self.file_name(period) for period in periods]
+
+    # --------------------------------------------------
+    def stale_periods(self, name:str, dir_path:str, periods:list, freshness) -> list:
+        """Periods to download again according to freshness (every one when
+        the report's file names are not known upfront)"""
+        if not self.period_arg or not self.file_name or glob.has_magic(
+            self.file_name(periods[0])
+        ):
+            return periods
+        return freshness.select(name, dir_path, periods, self.file_name)
+
+    # --------------------------------------------------
+    def record_downloads(
+        self, name:str, dir_path:str, periods:list, freshness
+    ) -> None:
+        if not self.period_arg or not self.file_name:
+            return
+        for period in periods:
+            file_name = self.file_name(period)
+            if not glob.has_magic(file_name) and os.path.isfile(
+                os.path.join(dir_path, file_name)
+            ):
+                freshness.record(name, dir_path, period, file_name)
+
+
+def _named(suffix:str):
+    return lambda period: period + suffix
+
+def _fixed(file_name:str):
+    return lambda period: file_name
+
+
+REPORTS = {
+    # SIIF
+    'rcg01_uejp': Report(
+        'siif', 'siif.comprobantes_gtos_rcg01_uejp:ComprobantesGtosRcg01Uejp',
+        _named('-rcg01_uejp.xls')
+    ),
+    'rpa03g': Report(
+        'siif',
+        'siif.comprobantes_gtos_gpo_part_gto_rpa03g:ComprobantesGtosGpoPartGtoRpa03g',
+        _named('-gto_rpa03g (Gpo *00).xls')
+    ),
+    'rci02': Report(
+        'siif', 'siif.comprobantes_rec_rci02:ComprobantesRecRci02',
+        _named('-rci02.xls')
+    ),
+    'rog01': Report(
+        'siif', 'siif.detalle_partidas_rog01:DetallePartidasRog01',
+        _fixed('detalle_partidas.xls'), period_arg=None
+    ),
+    'rdeu012': Report(
+        'siif', 'siif.deuda_flotante_rdeu012:DeudaFlotanteRdeu012',
+        lambda mes: mes[0:4] + mes[-2:] + '-rdeu012.xls', period_arg='meses'
+    ),
+    'rdeu012b2_c': Report(
+        'siif', 'siif.deuda_flotante_rdeu012b2_c:DeudaFlotanteRdeu012b2C'
+    ),
+    'rfp_p605b': Report(
+        'siif', 'siif.form_gto_rfp_p605b:FormGtoRfpP605b',
+        _named('-rfp_p605b.xls')
+    ),
+    'rcocc31': Report(
+        'siif', 'siif.mayor_contable_rcocc31:MayorContableRcocc31',
+        _named('-rcocc31 (*).xls')
+    ),
+    'rf610': Report(
+        'siif', 'siif.ppto_gtos_desc_rf610:PptoGtosDescRf610',
+        _named('-rf610.xls')
+    ),
+    'rf602': Report(
+        'siif', 'siif.ppto_gtos_fte_rf602:PptoGtosFteRf602', _named('-rf602.xls')
+    ),
+    'ri102': Report(
+        'siif', 'siif.ppto_rec_ri102:PptoRecRi102', _named('-ri102.xls')
+    ),
+    'rvicon03': Report(
+        'siif', 'siif.resumen_contable_cta_rvicon03:ResumenContableCtaRvicon03',
+        _named('-rvicon03.xls')
+    ),
+    'rfondo07tp': Report(
+        'siif', 'siif.resumen_fdos_rfondo07tp:ResumenFdosRfondo07tp',
+        _named('-rfondo07tp (*).xls')
+    ),
+    # Gestion Viviendas
+    'barrios_nuevos': Report(
+        'sgv', 'sgv.barrios_nuevos:BarriosNuevos',
+        _named('-InformeBarriosNuevos.xlsx')
+    ),
+    'resumen_facturado': Report(
+        'sgv', 'sgv.resumen_facturado:ResumenFacturado',
+        _named('-InformeResumenFacturado.xlsx')
+    ),
+    'resumen_recaudado': Report(
+        'sgv', 'sgv.resumen_recaudado:ResumenRecaudado',
+        _named('-InformeResumenRecaudado.xlsx')
+    ),
+    'saldo_barrio': Report(
+        'sgv', 'sgv.saldo_barrio:SaldoBarrio',
+        _named('-InformeSaldosPorBarrio.xlsx')
+    ),
+    'saldo_barrio_variacion': Report(
+        'sgv', 'sgv.saldo_barrio_variacion:SaldoBarrioVariacion',
+        _named('-InformeEvolucionDeSaldosPorBarrio.xlsx')
+    ),
+    'saldo_motivo': Report(
+        'sgv', 'sgv.saldo_motivo:SaldoMotivo',
+        _named('-InformeEvolucionDeSaldosPorMotivos.xlsx')
+    ),
+    'saldo_motivo_por_barrio': Report(
+        'sgv', 'sgv.saldo_motivo_por_barrio:SaldoMotivoPorBarrio',
+        _named('-RecuperosInformeEvoSaldosPorMotivoPorBarrio.xlsx')
+    ),
+    'saldo_recuperos_cobrar_variacion': Report(
+        'sgv',
+        'sgv.saldo_recuperos_cobrar_variacion:SaldoRecuperosCobrarVariacion',
+        _named('-InformeVariacionSaldosRecuperosCobrar.xlsx')
+    ),
+    # Gestion Obras
+    'listado_obras': Report(
+        'sgo', 'sgo.listado_obras:ListadoObras',
+        _fixed('Obras Completo.xls'), period_arg=None
+    ),
+    'lotes_certificados': Report(
+        'sgo', 'sgo.lotes_certificados:LotesCertificados', period_arg=None
+    ),
+    'lotes_certificados_pdf': Report(
+        'sgo', 'sgo.lotes_certificados_pdf:LotesCertificadosPDF',
+        _fixed('lotecertificado-*.pdf'), period_arg=None,
+        download_target='sgo.lotes_certificados:LotesCertificados'
+    ),
+    # SGF
+    'resumen_rend_prov': Report(
+        'sgf', 'sgf.resumen_rend_prov:ResumenRendProv',
+        # Origenes (EPAM, OBRAS, ...) are upper case, unlike '... por Obra'
+        _named(' Resumen de Rendiciones *[A-Z].csv')
+    ),
+    'certificados_obras': Report(
+        'sgf', 'sgf.certificados_obras:CertificadosObras',
+        _named(' Informe para Contable.csv')
+    ),
+    'listado_prov': Report(
+        'sgf', 'sgf.listado_prov:ListadoProv',
+        _fixed('Listado de Proveedores.csv'), period_arg=None
+    ),
+    'resumen_rend_obras': Report(
+        'sgf', 'sgf.resumen_rend_obras:ResumenRendObras',
+        _named(' Resumen de Rendiciones * por Obra.csv')
+    ),
+    # SSCC
+    'banco_invico': Report(
+        'sscc', 'sscc.banco_invico:BancoINVICO',
+        _named(' - Bancos - Consulta General de Movimientos.csv')
+    ),
+    'ctas_ctes': Report(
+        'sscc', 'sscc.ctas_ctes:CtasCtes', _fixed('ctas_ctes.xlsx'),
+        period_arg=None
+    ),
+    'listado_imputaciones': Report(
+        'sscc', 'sscc.listado_imputaciones:ListadoImputaciones',
+        _fixed('Bancos - Listado de Imputaciones.csv'), period_arg=None
+    ),
+    'sdo_final_banco_invico': Report(
+        'sscc', 'sscc.sdo_final_banco_invico:SdoFinalBancoINVICO',
+        _named(' - saldos_sscc.csv')
+    ),
+}
+
+JOINS = {
+    'ppto_gtos_fte_desc': Report(
+        'siif', 'siif.join_ppto_gtos_fte_desc:JoinPptoGtosFteDesc'
+    ),
+    'comprobantes_gtos_gpo_part': Report(
+        'siif', 'siif.join_comprobantes_gtos_gpo_part:JoinComprobantesGtosGpoPart'
+    ),
+    'resumen_mayor_contable': Report(
+        'siif', 'siif.join_resumen_mayor_contable:JoinResumenMayorContable'
+    ),
+    'resumen_rend_prov_cuit': Report(
+        'sgf', 'sgf.join_resumen_rend_prov_cuit:JoinResumenRendProvCuit'
+    ),
+}
+
+
+# --------------------------------------------------
+def expand_periods(periods:list, period_arg:str) -> list[str]:
+    """'2019:2021' -> ['2019', '2020', '2021']. Defaults to the current
+    ejercicio (or month, for reports asked by meses)."""
+    if not periods:
+        now = dt.datetime.now()
+        return [now.strftime('%Y-%m') if period_arg == 'meses' else str(now.year)]
+    expanded = []
+    for period in periods:
+        if ':' in period:
+            start, stop = period.split(':')
+            expanded.extend(str(year) for year in range(int(start), int(stop) + 1))
+        else:
+            expanded.append(period)
+    return list(dict.fromkeys(expanded))
+
+# --------------------------------------------------
+def expand_paths(paths:list, pattern:str = None, dir_path:str = '.') -> list[str]:
+    """Files (or folders) matching paths, which may be glob patterns.
+    Without paths, the report's own file pattern in dir_path."""
+    if not paths:
+        if pattern is None:
+            return []
+        paths = [os.path.join(dir_path, pattern)]
+    found = []
+    for path in paths:
+        if glob.has_magic(path):
+            found.extend(sorted(glob.glob(path, recursive=True)))
+        else:
+            found.append(path)
+    return list(dict.fromkeys(found))
+
+# --------------------------------------------------
+def parse_params(params:list) -> dict:
+    """['ctas_contables=1112-2-6,2111-1-1'] -> download_report kwargs
+    (comma separated values become lists)"""
+    kwargs = {}
+    for param in params or []:
+        key, _, value = param.partition('=')
+        kwargs[key] = value.split(',') if ',' in value else value
+    return kwargs
+
+# --------------------------------------------------
+def write_df(df, path:str) -> None:
+    """Write df as csv, xlsx or parquet, by path's extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        df.to_csv(path, index=False)
+    elif extension == '.xlsx':
+        df.to_excel(path, index=False)
+    elif extension == '.parquet':
+        df.to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unknown output format {extension!r} (csv, xlsx, parquet)")
+
+
+# --------------------------------------------------
+def _download_siif(
+    report:Report, dir_path:str, jobs:list[dict], credentials:tuple,
+    sessions:int, visible:bool
+) -> None:
+    from .siif.siif_session_pool import SIIFSessionPool
+    size = max(min(sessions, len(jobs)), 1)
+    with SIIFSessionPool(*credentials, size=size, invisible=not visible) as pool:
+        failed = pool.download_reports(
+            report.load(download=True), dir_path, jobs,
+            expected=report.expected_files
+        )
+    for job in failed:
+        print(f"No se pudo descargar {report.target} {job}")
+
+# --------------------------------------------------
+def _download_sgv_sgo(
+    report:Report, dir_path:str, jobs:list[dict], credentials:tuple,
+    sessions:int, visible:bool
+) -> None:
+    if report.system == 'sgv':
+        from .sgv.connect_sgv import ConnectSGV as Connect
+    else:
+        from .sgo.connect_sgo import ConnectSGO as Connect
+    connection = Connect(*credentials, invisible=not visible)
+    try:
+        downloader = report.load(download=True)(**{report.system: connection})
+        for job in jobs:
+            downloader.download_report(dir_path, **job)
+    finally:
+        connection.disconnect()
+        connection.remove_html_files(dir_path)
+
+# --------------------------------------------------
+def _download_sgf_sscc(
+    report:Report, dir_path:str, jobs:list[dict], credentials:tuple,
+    sessions:int, visible:bool
+) -> None:
+    if report.system == 'sgf':
+        from .sgf.connect_sgf import ConnectSGF as Connect
+    else:
+        from .sscc.connect_sscc import ConnectSSCC as Connect
+    connection = Connect(*credentials)
+    try:
+        downloader = report.load(download=True)(**{report.system: connection})
+        if report.system == 'sgf':
+            downloader.connect()
+        for job in jobs:
+            downloader.download_report(dir_path, **job)
+    finally:
+        connection.quit()
+
+_DOWNLOADERS = {
+    'siif': _download_siif,
+    'sgv': _download_sgv_sgo,
+    'sgo': _download_sgv_sgo,
+    'sgf': _download_sgf_sscc,
+    'sscc': _download_sgf_sscc,
+}
+
+# --------------------------------------------------
+def download_jobs(
+    report:Report, dir_path:str, jobs:list[dict], credentials:tuple,
+    sessions:int = None, visible:bool = False
+) -> None:
+    """Run report's download_report(dir_path, **job) for every job, with
+    the system's connection (a session pool for SIIF)"""
+    _DOWNLOADERS[report.system](
+        report, dir_path, jobs, credentials,
+        sessions or settings.download_workers, visible
+    )
+
+# --------------------------------------------------
+def _credentials(system:str, args) -> tuple:
+    if args.username and args.password:
+        return args.username, args.password
+    username, password = settings.credentials(system, args.dir)
+    if not (username and password):
+        sys.exit(
+            f"Missing {system} credentials: use -u/-p, "
+            f"{system.upper()}_USERNAME/{system.upper()}_PASSWORD or {system} json file"
+        )
+    return username, password
+
+# --------------------------------------------------
+def download(args) -> None:
+    from .utils.freshness import FreshnessPolicy
+    os.makedirs(args.dir, exist_ok=True)
+    freshness = FreshnessPolicy()
+    for name in args.reports:
+        report = REPORTS[name]
+        periods = expand_periods(args.periods, report.period_arg)
+        if not args.force:
+            pending = report.stale_periods(name, args.dir, periods, freshness)
+            skipped = [period for period in periods if period not in pending]
+            if skipped:
+                print(f"{name}: {skipped} up to date, not downloaded")
+            periods = pending
+            if not periods:
+                continue
+        start = time.perf_counter()
+        try:
+            download_jobs(
+                report, args.dir,
+                report.jobs(
+                    periods, parse_params(args.param),
+                    args.sql or os.path.join(args.dir, report.system + '.sqlite')
+                ),
+                _credentials(report.system, args), args.sessions, args.visible
+            )
+        except Exception as e:
+            print(f"Ocurrió un error: {e}, {type(e)}")
+            continue
+        report.record_downloads(name, args.dir, periods, freshness)
+        print(f"{name}: downloaded in {time.perf_counter() - start:.1f} s")
+
+
+# --------------------------------------------------
+def read_report(target:str, path:str):
+    """One file read and transformed by its report (runs in worker
+    processes)"""
+    report = Report('', target).load()()
+    df = report.from_external_report(path)
+    # Some reports only leave the result in self.df
+    return report.df if df is None else df
+
+# --------------------------------------------------
+def read_report_recorded(target:str, path:str) -> tuple:
+    """read_report and the stage metrics it made, for the parent process
+    to add to its own"""
+    first = len(metrics.records)
+    df = read_report(target, path)
+    return df, metrics.since(first)
+
+# --------------------------------------------------
+def read_reports(target:str, paths:list, executor = None) -> list:
+    """read_report of every path (in executor, if given), keeping the
+    workers' metrics"""
+    if executor is None:
+        return [read_report(target, path) for path in paths]
+    dfs = []
+    for df, records in executor.map(
+        read_report_recorded, [target] * len(paths), paths
+    ):
+        metrics.add(records)
+        dfs.append(df)
+    return dfs
+
+# --------------------------------------------------
+def _ingest_log_path(sql_path:str) -> str:
+    return sql_path + '.ingested.json'
+
+# --------------------------------------------------
+def _file_stamp(path:str) -> list:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+# --------------------------------------------------
+def ingest(args) -> None:
+    import pandas as pd
+    report = REPORTS[args.report]
+    paths = expand_paths(args.paths, report.pattern, args.dir)
+    if not paths:
+        sys.exit(f"{args.report}: no files to ingest")
+    sql_path = args.sql or os.path.join(args.dir, report.system + '.sqlite')
+
+    # Files already loaded (same mtime and size) are skipped; folders are
+    # always read (their reports keep their own caches)
+    log_path = _ingest_log_path(sql_path)
+    log = {}
+    if os.path.isfile(log_path) and os.path.isfile(sql_path):
+        with open(log_path, encoding='utf-8') as f:
+            log = json.load(f)
+    done = log.setdefault(args.report, {})
+    if not args.force:
+        paths = [
+            path for path in paths
+            if not os.path.isfile(path)
+            or done.get(os.path.abspath(path)) != _file_stamp(path)
+        ]
+        if not paths:
+            print(f"{args.report}: nothing new to ingest")
+            return
+
+    start = time.perf_counter()
+    workers = min(args.workers or settings.workers, len(paths))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            dfs = read_reports(report.target, paths, executor)
+    else:
+        dfs = read_reports(report.target, paths)
+
+    read = [(path, df) for path, df in zip(paths, dfs) if df is not None]
+    for path in set(paths) - {path for path, _ in read}:
+        print(f"{args.report}: {path} is not a {args.report} report, skipped")
+    if not read:
+        return
+    # One delete + insert for the whole batch
+    writer = report.load()()
+    writer.df = pd.concat([df for _, df in read], ignore_index=True)
+    # Reports without a filter column (catalogues) are replaced whole
+    writer.to_sql(sql_path, replace=not writer._FILTER_COL)
+    writer.engine.dispose()
+
+    for path in filter(os.path.isfile, (path for path, _ in read)):
+        done[os.path.abspath(path)] = _file_stamp(path)
+    with open(log_path, 'w', encoding='utf-8') as f:
+        json.dump(log, f, indent=2, sort_keys=True)
+    print(
+        f"{args.report}: {len(read)} files, {len(writer.df)} rows into "
+        f"{sql_path} in {time.perf_counter() - start:.1f} s"
+    )
+
+# --------------------------------------------------
+def join(args) -> None:
+    joined = JOINS[args.join].load()()
+    joined.from_sql(args.sql)
+    if args.output:
+        write_df(joined.df, args.output)
+        print(f"{args.join}: {len(joined.df)} rows written to {args.output}")
+    else:
+        joined.print_tidyverse()
+
+# --------------------------------------------------
+def export(args) -> None:
+    import pandas as pd
+    from sqlalchemy import inspect
+
+    from .utils.sql_utils import sqlite_engine
+    engine = sqlite_engine(args.sql)
+    tables = args.tables or inspect(engine).get_table_names()
+    os.makedirs(args.dir, exist_ok=True)
+    try:
+        for table in tables:
+            df = pd.read_sql_table(table, engine)
+            path = os.path.join(args.dir, f'{table}.{args.format}')
+            write_df(df, path)
+            print(f"{table}: {len(df)} rows written to {path}")
+    finally:
+        engine.dispose()
+
+# --------------------------------------------------
+def bench(args) -> None:
+    """Time reading (not writing) files with a report"""
+    report = REPORTS[args.report]
+    paths = expand_paths(args.paths, report.pattern, args.dir)
+    if not paths:
+        sys.exit(f"{args.report}: no files to bench")
+    report.load()  # import cost is not part of the timing
+    for path in paths:
+        runs = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            df = read_report(report.target, path)
+            runs.append(time.perf_counter() - start)
+        rows = 0 if df is None else len(df)
+        best = min(runs)
+        print(
+            f"{os.path.basename(path):50} {best:.3f} s  {rows:8} rows  "
+            f"{rows / best if best else 0:10.0f} rows/s"
+        )
+
+
+# --------------------------------------------------
+def run(args) -> None:
+    from .pipeline import Pipeline
+    pipeline = Pipeline(
+        args.dir, args.targets, periods=args.periods, download=args.download,
+        sql_dir=args.sql_dir, output_format=args.format,
+        workers=args.workers, sessions=args.sessions, visible=args.visible
+    )
+    statuses = pipeline.run()
+    failed = [name for name, status in statuses.items() if status == 'failed']
+    if failed:
+        sys.exit(f"Failed stages: {', '.join(failed)}")
+
+
+# --------------------------------------------------
+def get_args(argv:list = None):
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        prog = 'invicodat',
+        description = "Download, ingest, join and export INVICO's reports",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument(
+        '--metrics-dir',
+        default = None,
+        type=str,
+        help = "Write stage metrics (invicodat_run.json and invicodat.prom) "
+        "here (default: INVICODAT_METRICS_DIR)")
+    parser.add_argument(
+        '--profile-dir',
+        default = None,
+        type=str,
+        help = "cProfile every transform_df, from_external_report, to_sql "
+        "and download_report call, dumps and a summary written here "
+        "(default: INVICODAT_PROFILE_DIR)")
+    parser.add_argument(
+        '--profile-top',
+        default = None,
+        type=int,
+        help = "Hot functions by report class in the profile summary "
+        "(default: INVICODAT_PROFILE_TOP or 20)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_dir(subparser):
+        subparser.add_argument(
+            '-d', '--dir',
+            default = '.',
+            type=str,
+            help = "Folder of the downloaded reports")
+
+    # download
+    parser_download = subparsers.add_parser(
+        'download', help = "Download reports (SIIF in parallel sessions)",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    parser_download.add_argument(
+        'reports', nargs='+', choices=list(REPORTS), metavar='report',
+        help = "Reports to download: " + ', '.join(REPORTS))
+    parser_download.add_argument(
+        '-e', '--periods', nargs='*', default=None,
+        help = "Ejercicios (2023, 2019:2023) or meses (2023-01) "
+        "(default: the current one)")
+    add_dir(parser_download)
+    parser_download.add_argument(
+        '-u', '--username', default='', type=str,
+        help = "Username (default: settings / credential json)")
+    parser_download.add_argument(
+        '-p', '--password', default='', type=str,
+        help = "Password (default: settings / credential json)")
+    parser_download.add_argument(
+        '--sql', default=None, type=str,
+        help = "Sqlite file reports with inputs (rcocc31) read from "
+        "(default: <system>.sqlite in --dir)")
+    parser_download.add_argument(
+        '--param', action='append', metavar='KEY=VALUE',
+        help = "Extra download_report argument (a,b for lists)")
+    parser_download.add_argument(
+        '-s', '--sessions', default=settings.download_workers, type=int,
+        help = "SIIF browser sessions")
+    parser_download.add_argument(
+        '--visible', action='store_true', help = "Show the browser")
+    parser_download.add_argument(
+        '--force', action='store_true',
+        help = "Download periods even if they are up to date")
+    parser_download.set_defaults(func=download)
+
+    # ingest
+    parser_ingest = subparsers.add_parser(
+        'ingest', help = "Read report files into their sqlite database",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    parser_ingest.add_argument('report', choices=list(REPORTS), metavar='report')
+    parser_ingest.add_argument(
+        'paths', nargs='*',
+        help = "Files, folders or glob patterns (default: the report's "
+        "downloaded files in --dir)")
+    add_dir(parser_ingest)
+    parser_ingest.add_argument(
+        '--sql', default=None, type=str,
+        help = "Sqlite file (default: <system>.sqlite in --dir)")
+    parser_ingest.add_argument(
+        '-w', '--workers', default=None, type=int,
+        help = "Parsing processes (default: INVICODAT_WORKERS or one per CPU)")
+    parser_ingest.add_argument(
+        '--force', action='store_true',
+        help = "Ingest files even if they were not modified")
+    parser_ingest.set_defaults(func=ingest)
+
+    # join
+    parser_join = subparsers.add_parser(
+        'join', help = "Join reports already in a sqlite database",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    parser_join.add_argument('join', choices=list(JOINS), metavar='join',
+        help = ', '.join(JOINS))
+    parser_join.add_argument('--sql', required=True, type=str)
+    parser_join.add_argument(
+        '-o', '--output', default=None, type=str,
+        help = "csv, xlsx or parquet file (default: print it)")
+    parser_join.set_defaults(func=join)
+
+    # export
+    parser_export = subparsers.add_parser(
+        'export', help = "Write sqlite tables as files",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    parser_export.add_argument(
+        'tables', nargs='*', help = "Tables (default: every one)")
+    parser_export.add_argument('--sql', required=True, type=str)
+    add_dir(parser_export)
+    parser_export.add_argument(
+        '-f', '--format', default='parquet', choices=['csv', 'xlsx', 'parquet'])
+    parser_export.set_defaults(func=export)
+
+    # bench
+    parser_bench = subparsers.add_parser(
+        'bench', help = "Time reading report files",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    parser_bench.add_argument('report', choices=list(REPORTS), metavar='report')
+    parser_bench.add_argument('paths', nargs='*')
+    add_dir(parser_bench)
+    parser_bench.add_argument(
+        '-r', '--repeat', default=3, type=int,
+        help = "Repetitions (best time is reported)")
+    parser_bench.set_defaults(func=bench)
+
+    # run
+    parser_run = subparsers.add_parser(
+        'run', help = "Download, parse, load and join as a dependency graph",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+    parser_run.add_argument(
+        'targets', nargs='+', choices=[*REPORTS, *JOINS], metavar='target',
+        help = "Reports and joins: " + ', '.join(JOINS))
+    parser_run.add_argument(
+        '-e', '--periods', nargs='*', default=None,
+        help = "Ejercicios (2023, 2019:2023) or meses (2023-01)")
+    add_dir(parser_run)
+    parser_run.add_argument(
+        '--no-download', dest='download', action='store_false',
+        help = "Use the files already in --dir")
+    parser_run.add_argument(
+        '--sql-dir', default=None, type=str,
+        help = "Folder of the sqlite databases (default: --dir)")
+    parser_run.add_argument(
+        '-f', '--format', default='parquet', choices=['csv', 'xlsx', 'parquet'],
+        help = "Format of the joins written to --dir")
+    parser_run.add_argument(
+        '-w', '--workers', default=None, type=int,
+        help = "Parsing processes (default: INVICODAT_WORKERS or one per CPU)")
+    parser_run.add_argument(
+        '-s', '--sessions', default=settings.download_workers, type=int,
+        help = "SIIF browser sessions per download")
+    parser_run.add_argument(
+        '--visible', action='store_true', help = "Show the browser")
+    parser_run.set_defaults(func=run)
+
+    return parser.parse_args(argv)
+
+# --------------------------------------------------
+def main(argv:list = None):
+    """Let's try it"""
+    args = get_args(argv)
+    if args.profile_dir:
+        profiler.enable(args.profile_dir, args.profile_top)
+    try:
+        args.func(args)
+    finally:
+        if args.metrics_dir:
+            metrics.export(args.metrics_dir)
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy/src
+    # python -m invicodatpy.cli download rf602 rf610 -e 2019:2023 -d ./data
+    # python -m invicodatpy.cli ingest rf602 './data/*-rf602.xls' --sql ./data/siif.sqlite
+    # python -m invicodatpy.cli join ppto_gtos_fte_desc --sql ./data/siif.sqlite -o ppto.xlsx
+    # python -m invicodatpy.cli run ppto_gtos_fte_desc resumen_rend_prov_cuit -e 2023 -d ./data
+    # Once installed: invicodat --help
@@ -1,18 +1,206 @@
-__all__ = ['SIIF_USERNAME', 'SIIF_PASSWORD']
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Lazy configuration: credentials and tuning settings resolved on
+first access from the environment, a .env file or the credential json files
+"""
 
+__all__ = ['Settings', 'settings', 'SQLITE_PROFILES']
 
+
+import json
 import os
+import threading
+from dataclasses import dataclass, field
+
+# Credential json file (next to each module's main) by system
+CREDENTIAL_FILES = {
+    'siif': 'siif_credentials.json',
+    'sgf': 'sgf_credentials.json',
+    'sscc': 'sscc_credentials.json',
+    'sgv': 'credentials.json',
+    'sgo': 'credentials.json',
+}
+
+# PRAGMAs for the local SQLite databases
+SQLITE_PROFILES = {
+    'default': {},
+    # Bulk loads: WAL, no fsync on every commit, bigger page cache
+    'fast': {
+        'journal_mode': 'WAL', 'synchronous': 'NORMAL',
+        'cache_size': -64000, 'temp_store': 'MEMORY',
+    },
+    'safe': {'journal_mode': 'DELETE', 'synchronous': 'FULL'},
+}
+
+_PACKAGE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# --------------------------------------------------
+def _as_bool(value:str) -> bool:
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+@dataclass
+class Settings():
+    """
+    Every value is looked up, the first time it is asked for, in: the
+    environment, then the .env file (python-dotenv, if installed), then
+    its default. Credentials also fall back to the json files main()
+    functions read. Nothing raises on import; missing credentials are None.
+    :param env_file: .env path (default: found from the working directory).
+    :param credentials_dir: where credential json files are looked for
+    first (default: INVICODAT_CREDENTIALS_DIR, then each system's folder).
+    """
+    env_file:str = None
+    credentials_dir:str = None
+    _values:dict = field(init=False, repr=False, default_factory=dict)
+    _dotenv:dict = field(init=False, repr=False, default=None)
+    _lock:threading.RLock = field(
+        init=False, repr=False, default_factory=threading.RLock
+    )
+
+    # --------------------------------------------------
+    def dotenv(self) -> dict:
+        """Values of the .env file (not exported to os.environ)"""
+        with self._lock:
+            if self._dotenv is None:
+                try:
+                    from dotenv import dotenv_values, find_dotenv
+                except ImportError:
+                    self._dotenv = {}
+                else:
+                    path = self.env_file or find_dotenv(usecwd=True)
+                    self._dotenv = dict(dotenv_values(path)) if path else {}
+            return self._dotenv
+
+    # --------------------------------------------------
+    def get(self, key:str, default=None, cast=str):
+        """Setting key (case insensitive name), cached after first use"""
+        with self._lock:
+            if key not in self._values:
+                value = None
+                for name in (key, key.lower(), key.upper()):
+                    value = os.environ.get(name) or self.dotenv().get(name)
+                    if value:
+                        break
+                self._values[key] = cast(value) if value else default
+            return self._values[key]
+
+    # --------------------------------------------------
+    def reload(self) -> None:
+        """Forget cached values (after changing env vars or files)"""
+        with self._lock:
+            self._values.clear()
+            self._dotenv = None
+
+    # --------------------------------------------------
+    def read_credentials_file(self, system:str, dir_path:str = None) -> dict:
+        file_name = CREDENTIAL_FILES[system]
+        dirs = [
+            self.credentials_dir or self.get('invicodat_credentials_dir'),
+            dir_path,
+            os.path.join(_PACKAGE_PATH, system),
+        ]
+        for folder in dirs:
+            if folder and os.path.isfile(os.path.join(folder, file_name)):
+                with open(os.path.join(folder, file_name)) as json_file:
+                    return json.load(json_file)
+        return {}
+
+    # --------------------------------------------------
+    def credentials(self, system:str, dir_path:str = None) -> tuple:
+        """(username, password) of system ('siif', 'sgv', 'sgo', 'sgf',
+        'sscc'), from {system}_username / {system}_password or its json
+        file. Missing values are None."""
+        key = f'credentials_{system}'
+        with self._lock:
+            if key not in self._values:
+                username = self.get(f'{system}_username')
+                password = self.get(f'{system}_password')
+                if not (username and password):
+                    data = self.read_credentials_file(system, dir_path)
+                    username = username or data.get('username')
+                    password = password or data.get('password')
+                self._values[key] = (username, password)
+            return self._values[key]
+
+    # --------------------------------------------------
+    @property
+    def workers(self) -> int:
+        """Processes for CPU bound work (parsing)"""
+        return self.get('invicodat_workers', os.cpu_count() or 1, int)
+
+    # --------------------------------------------------
+    @property
+    def download_workers(self) -> int:
+        """Concurrent downloads / browser sessions"""
+        return self.get('invicodat_download_workers', 4, int)
+
+    # --------------------------------------------------
+    @property
+    def download_timeout(self) -> float:
+        """Seconds to wait for a report download to finish"""
+        return self.get('invicodat_download_timeout', 300.0, float)
+
+    # --------------------------------------------------
+    @property
+    def cache_dir(self) -> str:
+        return self.get(
+            'invicodat_cache_dir',
+            os.path.join(os.path.expanduser('~'), '.cache', 'invicodatpy')
+        )
+
+    # --------------------------------------------------
+    @property
+    def metrics_dir(self) -> str:
+        """Where stage metrics are exported at exit (None: not exported)"""
+        return self.get('invicodat_metrics_dir')
+
+    # --------------------------------------------------
+    @property
+    def trace_memory(self) -> bool:
+        """Measure stage peak memory with tracemalloc (slower)"""
+        return self.get('invicodat_trace_memory', False, _as_bool)
+
+    # --------------------------------------------------
+    @property
+    def profile_dir(self) -> str:
+        """Where cProfile dumps of report methods are written (None: not
+        profiled)"""
+        return self.get('invicodat_profile_dir')
+
+    # --------------------------------------------------
+    @property
+    def profile_top(self) -> int:
+        """Hot functions listed by report class in the profile summary"""
+        return self.get('invicodat_profile_top', 20, int)
+
+    # --------------------------------------------------
+    @property
+    def sqlite_profile(self) -> str:
+        """One of SQLITE_PROFILES"""
+        profile = self.get('invicodat_sqlite_profile', 'default')
+        if profile not in SQLITE_PROFILES:
+            raise ValueError(
+                f"Unknown sqlite profile {profile!r}, use one of {list(SQLITE_PROFILES)}"
+            )
+        return profile
 
-from dotenv import load_dotenv
+    # --------------------------------------------------
+    @property
+    def sqlite_pragmas(self) -> dict:
+        return SQLITE_PROFILES[self.sqlite_profile]
 
-# Cargamos nuestras variables de entorno
-load_dotenv()
 
+settings = Settings()
 
-SIIF_USERNAME = os.getenv("siif_username")
-if not SIIF_USERNAME:
-    raise Exception("SIIF's login username string not found")
 
-SIIF_PASSWORD = os.getenv("siif_password")
-if not SIIF_PASSWORD:
-    raise Exception("SIIF's login password string not found")
\ No newline at end of file
+# --------------------------------------------------
+def __getattr__(name:str):
+    """SIIF_USERNAME and SIIF_PASSWORD, kept for old imports"""
+    if name == 'SIIF_USERNAME':
+        return settings.credentials('siif')[0]
+    if name == 'SIIF_PASSWORD':
+        return settings.credentials('siif')[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1 +1,2 @@
-from .__dotenv import *
\ No newline at end of file
+from .__dotenv import *
+from .__dotenv import __getattr__
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 import pandas as pd
 
 from ..models.icaro_model import IcaroModel
+from ..utils.periods import ejercicio_from, mes_from
 from ..utils.rpw_utils import RPWUtils
 
 
@@ -197,8 +198,8 @@ class MigrateIcaro(RPWUtils):
         self.df['fecha'] = pd.TimedeltaIndex(self.df['fecha'], unit='d') + dt.datetime(1970,1,1)
         self.df['id'] = self.df['nro_comprobante'] + 'C'
         self.df.loc[self.df['tipo'] == 'PA6', 'id'] = self.df['nro_comprobante'] + 'F'
-        self.df['ejercicio'] = self.df['fecha'].dt.year.astype(str)
-        self.df['mes'] = self.df['fecha'].dt.month.astype(str).str.zfill(2) + '/' +  self.df['ejercicio']
+        self.df['ejercicio'] = ejercicio_from(self.df['fecha'])
+        self.df['mes'] = mes_from(self.df['fecha'])
         self._TABLE_NAME = 'carga'      
         # # Imprimir los registros duplicados
         # duplicates = self.df[self.df.duplicated(subset='id', keep=False)]  
@@ -283,8 +284,8 @@ class MigrateIcaro(RPWUtils):
         self.df['mutual'] = 0
         self.df['cod_obra'] = self.df['obra'].str.split('-', n=1).str[0]
         self.df['fecha'] = pd.TimedeltaIndex(self.df['fecha'], unit='d') + dt.datetime(1970,1,1)
-        self.df['ejercicio'] = self.df['fecha'].dt.year.astype(str)
-        self.df['mes'] = self.df['fecha'].dt.month.astype(str).str.zfill(2) + '/' + self.df['ejercicio']
+        self.df['ejercicio'] = ejercicio_from(self.df['fecha'])
+        self.df['mes'] = mes_from(self.df['fecha'])
         self.df.loc[self.df['nro_comprobante'] != '', 'id_carga'] = self.df['nro_comprobante'] + 'C'
         self.df.loc[self.df['tipo'] == 'PA6', 'id_carga'] = self.df['nro_comprobante'] + 'F'
         self.df.drop(['nro_comprobante', 'tipo'], axis=1, inplace=True)
@@ -1,8 +1,25 @@
-from .icaro_model import *
-from .sgf_model import *
-from .sgf_model import *
-from .sgo_model import *
-from .sgv_model import *
-from .siif_model import *
-from .slave_model import *
-from .sscc_model import *
\ No newline at end of file
+from .. import _lazy
+
+# Modules are imported on first use of one of their names
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all',
+        'icaro_model',
+        'sgf_model',
+        'sgo_model',
+        'sgv_model',
+        'siif_model',
+        'slave_model',
+        'sscc_model'
+    ],
+    star_modules=[
+        'icaro_model',
+        'sgf_model',
+        'sgo_model',
+        'sgv_model',
+        'siif_model',
+        'slave_model',
+        'sscc_model'
+    ],
+)
@@ -10,7 +10,9 @@ import os
 from dataclasses import dataclass
 
 from sqlalchemy import (Boolean, Column, Date, Integer, MetaData, Numeric,
-                        String, Table, create_engine)
+                        String, Table)
+
+from ..utils.sql_utils import sqlite_engine
 
 
 @dataclass
@@ -78,10 +80,21 @@ class SGOModel():
             Column('mes_ultima_medicion', String(7)),
         )
 
+        self.lotes_certificados = Table(
+            'lotes_certificados', self.metadata,
+            Column('id', Integer(), autoincrement=True, primary_key=True),
+            Column('nro_lote', String(10)),
+            Column('cod_obra', String(9)),
+            Column('obra', String(200)),
+            Column('nro_certificado', String(4)),
+            Column('monto_certificado', Numeric(12,2)),
+            Column('importe_neto', Numeric(12,2)),
+        )
+
 
     def create_engine(self):
         """Create an SQLite DB engine"""
-        self.engine = create_engine(f'sqlite:///{self.sql_path}')
+        self.engine = sqlite_engine(self.sql_path)
 
     def create_database(self):
         """Create DataBase from engine"""
@@ -10,7 +10,9 @@ import os
 from dataclasses import dataclass
 
 from sqlalchemy import (Boolean, Column, Date, Integer, MetaData, Numeric,
-                        String, Table, create_engine)
+                        String, Table)
+
+from ..utils.sql_utils import sqlite_engine
 
 
 @dataclass
@@ -276,7 +278,7 @@ class SIIFModel():
 
     def create_engine(self):
         """Create an SQLite DB engine"""
-        self.engine = create_engine(f'sqlite:///{self.sql_path}')
+        self.engine = sqlite_engine(self.sql_path)
 
     def create_database(self):
         """Create DataBase from engine"""
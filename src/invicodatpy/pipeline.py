@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Run download -> parse -> load -> join of many reports as a
+dependency graph, independent stages in parallel
+"""
+
+__all__ = ['Stage', 'Pipeline']
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from dataclasses import dataclass, field
+
+from .cli import (JOINS, REPORTS, download_jobs, expand_periods, read_reports,
+                  write_df)
+from .config import settings
+from .utils.freshness import FreshnessPolicy
+from .utils.metrics import metrics
+
+DONE, SKIPPED, FAILED, BLOCKED = 'done', 'skipped', 'failed', 'blocked'
+
+
+# --------------------------------------------------
+def fingerprint(value) -> str:
+    return hashlib.sha1(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+# --------------------------------------------------
+def file_stamp(path:str) -> list:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+@dataclass
+class Stage():
+    """
+    One step of a report: download (its files), parse (files -> cached
+    DataFrame), load (DataFrame -> sqlite table) or join (tables -> file).
+    :param key: fingerprint of what the stage read; a stage whose key did
+    not change since its last successful run is skipped.
+    """
+    name:str
+    kind:str
+    report:str
+    deps:list = field(default_factory=list)
+    status:str = 'pending'
+    key:str = None
+    seconds:float = 0.0
+    error:str = None
+
+
+@dataclass
+class Pipeline():
+    """
+    Build the stages graph of targets from what report classes declare:
+    _TABLE_NAME/_SQL_MODEL (what a load writes) and _INPUTS (tables a join,
+    or a download like rcocc31's, reads first). Then run it: downloads in
+    threads (download_workers at once), parsing in a process pool (workers)
+    and loads / joins one at a time per database.
+    :param targets: cli.REPORTS and cli.JOINS names.
+    :param periods: ejercicios / meses (default: the current one).
+    :param params: report name -> extra download_report arguments.
+    """
+    dir_path:str
+    targets:list
+    periods:list = None
+    download:bool = True
+    sql_dir:str = None
+    params:dict = field(default_factory=dict)
+    output_format:str = 'parquet'
+    download_workers:int = None
+    workers:int = None
+    sessions:int = None
+    visible:bool = False
+    state_name:str = '.pipeline_state.json'
+    stages:dict = field(init=False, repr=False, default_factory=dict)
+    state:dict = field(init=False, repr=False, default_factory=dict)
+    freshness:FreshnessPolicy = field(
+        init=False, repr=False, default_factory=FreshnessPolicy
+    )
+    _lock:threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _db_locks:dict = field(init=False, repr=False, default_factory=dict)
+    _download_slots:threading.BoundedSemaphore = field(
+        init=False, repr=False, default=None
+    )
+    _processes:ProcessPoolExecutor = field(init=False, repr=False, default=None)
+
+    # --------------------------------------------------
+    @staticmethod
+    def report_name(report_cls:type) -> str:
+        """REPORTS name of a report class"""
+        target = (
+            report_cls.__module__.removeprefix(__package__ + '.') + ':'
+            + report_cls.__name__
+        )
+        for name, report in REPORTS.items():
+            if target in (report.target, report.download_target):
+                return name
+        raise KeyError(f"{report_cls.__name__} is not in cli.REPORTS")
+
+    # --------------------------------------------------
+    def add(self, stage:Stage) -> str:
+        self.stages[stage.name] = stage
+        return stage.name
+
+    # --------------------------------------------------
+    def add_report(self, name:str) -> str:
+        """download / parse / load stages of a report. Returns the load."""
+        if f'load:{name}' in self.stages:
+            return f'load:{name}'
+        report = REPORTS[name]
+        parse_deps = []
+        if self.download and report.downloadable:
+            download_deps = [
+                self.add_report(self.report_name(input_cls))
+                for input_cls in report.load(download=True)._INPUTS
+            ]
+            parse_deps.append(
+                self.add(Stage(f'download:{name}', 'download', name, download_deps))
+            )
+        parse = self.add(Stage(f'parse:{name}', 'parse', name, parse_deps))
+        return self.add(Stage(f'load:{name}', 'load', name, [parse]))
+
+    # --------------------------------------------------
+    def add_join(self, name:str) -> str:
+        deps = [
+            self.add_report(self.report_name(input_cls))
+            for input_cls in JOINS[name].load()._INPUTS
+        ]
+        return self.add(Stage(f'join:{name}', 'join', name, deps))
+
+    # --------------------------------------------------
+    def build(self) -> dict:
+        for name in self.targets:
+            if name in JOINS:
+                self.add_join(name)
+            elif name in REPORTS:
+                self.add_report(name)
+            else:
+                raise KeyError(f"Unknown report or join {name!r}")
+        return self.stages
+
+    # --------------------------------------------------
+    def sql_path(self, system:str) -> str:
+        return os.path.join(self.sql_dir or self.dir_path, system + '.sqlite')
+
+    # --------------------------------------------------
+    def parsed_path(self, name:str) -> str:
+        return os.path.join(self.dir_path, '.pipeline', name + '.pkl')
+
+    # --------------------------------------------------
+    def db_lock(self, sql_path:str) -> threading.Lock:
+        with self._lock:
+            return self._db_locks.setdefault(
+                os.path.abspath(sql_path), threading.Lock()
+            )
+
+    # --------------------------------------------------
+    def read_state(self) -> None:
+        path = os.path.join(self.dir_path, self.state_name)
+        if os.path.isfile(path):
+            with open(path, encoding='utf-8') as f:
+                self.state = json.load(f)
+
+    # --------------------------------------------------
+    def save_key(self, stage:Stage) -> None:
+        path = os.path.join(self.dir_path, self.state_name)
+        with self._lock:
+            self.state[stage.name] = stage.key
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=2, sort_keys=True)
+            os.replace(path + '.tmp', path)
+
+    # --------------------------------------------------
+    def unchanged(self, stage:Stage, output:str) -> bool:
+        return self.state.get(stage.name) == stage.key and os.path.exists(output)
+
+    # --------------------------------------------------
+    def run_download(self, stage:Stage) -> str:
+        report = REPORTS[stage.report]
+        periods = expand_periods(self.periods, report.period_arg)
+        pending = report.stale_periods(
+            stage.report, self.dir_path, periods, self.freshness
+        )
+        if not pending:
+            return SKIPPED
+        credentials = settings.credentials(report.system, self.dir_path)
+        if not all(credentials):
+            raise ValueError(f"Missing {report.system} credentials")
+        sql_path = self.sql_path(report.system)
+        with self.db_lock(sql_path):
+            jobs = report.jobs(pending, self.params.get(stage.report), sql_path)
+        with self._download_slots:
+            download_jobs(
+                report, self.dir_path, jobs, credentials,
+                self.sessions, self.visible
+            )
+        report.record_downloads(stage.report, self.dir_path, pending, self.freshness)
+        return DONE
+
+    # --------------------------------------------------
+    def run_parse(self, stage:Stage) -> str:
+        import pandas as pd
+        report = REPORTS[stage.report]
+        paths = report.files(
+            self.dir_path, expand_periods(self.periods, report.period_arg)
+        )
+        if not paths:
+            raise FileNotFoundError(f"No {stage.report} files in {self.dir_path}")
+        stage.key = fingerprint(
+            [[os.path.abspath(path), file_stamp(path)] for path in paths]
+        )
+        output = self.parsed_path(stage.report)
+        if self.unchanged(stage, output):
+            return SKIPPED
+        dfs = [
+            df for df in read_reports(report.target, paths, self._processes)
+            if df is not None
+        ]
+        if not dfs:
+            raise ValueError(f"None of {paths} is a {stage.report} report")
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        pd.concat(dfs, ignore_index=True).to_pickle(output)
+        self.save_key(stage)
+        return DONE
+
+    # --------------------------------------------------
+    def run_load(self, stage:Stage) -> str:
+        import pandas as pd
+        report = REPORTS[stage.report]
+        sql_path = self.sql_path(report.system)
+        stage.key = fingerprint(
+            [self.stages[dep].key for dep in stage.deps] + [os.path.abspath(sql_path)]
+        )
+        if self.unchanged(stage, sql_path):
+            return SKIPPED
+        writer = report.load()()
+        writer.df = pd.read_pickle(self.parsed_path(stage.report))
+        with self.db_lock(sql_path):
+            # Reports without a filter column (catalogues) are replaced whole
+            writer.to_sql(sql_path, replace=not writer._FILTER_COL)
+            writer.engine.dispose()
+        self.save_key(stage)
+        return DONE
+
+    # --------------------------------------------------
+    def run_join(self, stage:Stage) -> str:
+        join = JOINS[stage.report]
+        sql_path = self.sql_path(join.system)
+        stage.key = fingerprint([self.stages[dep].key for dep in stage.deps])
+        output = os.path.join(self.dir_path, f'{stage.report}.{self.output_format}')
+        if self.unchanged(stage, output):
+            return SKIPPED
+        joined = join.load()()
+        with self.db_lock(sql_path):
+            joined.from_sql(sql_path)
+        if joined.df is None:
+            # Joins whose join_df is not written yet; its key is not saved
+            # so that it runs once it is
+            print(f"{stage.report}: the join returned nothing, no output written")
+            return SKIPPED
+        write_df(joined.df, output)
+        self.save_key(stage)
+        return DONE
+
+    # --------------------------------------------------
+    def run_stage(self, stage:Stage) -> None:
+        start = time.perf_counter()
+        try:
+            with metrics.stage(stage.report, 'pipeline_' + stage.kind):
+                stage.status = getattr(self, 'run_' + stage.kind)(stage)
+        except Exception as e:
+            print(f"Ocurrió un error: {e}, {type(e)}")
+            stage.status, stage.error = FAILED, f'{type(e).__name__}: {e}'
+        stage.seconds = time.perf_counter() - start
+        print(f"{stage.name}: {stage.status} ({stage.seconds:.1f} s)")
+
+    # --------------------------------------------------
+    def ready(self, running:set) -> list[Stage]:
+        """Pending stages whose dependencies finished; stages after a
+        failed one are blocked"""
+        changed = True
+        while changed:
+            changed = False
+            for stage in self.stages.values():
+                if stage.status == 'pending' and any(
+                    self.stages[dep].status in (FAILED, BLOCKED)
+                    for dep in stage.deps
+                ):
+                    stage.status, changed = BLOCKED, True
+        return [
+            stage for stage in self.stages.values()
+            if stage.status == 'pending' and stage.name not in running
+            and all(
+                self.stages[dep].status in (DONE, SKIPPED) for dep in stage.deps
+            )
+        ]
+
+    # --------------------------------------------------
+    def run(self) -> dict:
+        """Run every stage. Returns {stage name: status}"""
+        if not self.stages:
+            self.build()
+        os.makedirs(self.dir_path, exist_ok=True)
+        self.read_state()
+        self._download_slots = threading.BoundedSemaphore(
+            self.download_workers or settings.download_workers
+        )
+        with ThreadPoolExecutor(max_workers=len(self.stages) or 1) as threads, \
+            ProcessPoolExecutor(max_workers=self.workers or settings.workers) \
+                as self._processes:
+            running = {}
+            while True:
+                for stage in self.ready(set(running.values())):
+                    running[threads.submit(self.run_stage, stage)] = stage.name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    running.pop(future)
+        return {name: stage.status for name, stage in self.stages.items()}
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Run download, parse, load and join of many reports",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        'targets', nargs='+',
+        help = "Reports and joins: " + ', '.join([*REPORTS, *JOINS]))
+
+    parser.add_argument(
+        '-e', '--periods', nargs='*', default=None,
+        help = "Ejercicios (2023, 2019:2023) or meses (2023-01)")
+
+    parser.add_argument(
+        '-d', '--dir',
+        default = '.',
+        type=str,
+        help = "Folder of the downloaded reports and the pipeline state")
+
+    parser.add_argument('--no-download', dest='download', action='store_false')
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    pipeline = Pipeline(
+        args.dir, args.targets, periods=args.periods, download=args.download
+    )
+    print(pipeline.run())
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy/src
+    # python -m invicodatpy.pipeline ppto_gtos_fte_desc -e 2022:2024 -d ./data
+    # python -m invicodatpy.pipeline comprobantes_gtos_gpo_part --no-download
@@ -1,9 +1,26 @@
-from .connect_sgf import *
-from .resumen_rend_prov import *
-from .listado_prov import *
-from .certificados_obras import *
-from .resumen_rend_obras import *
-from .join_resumen_rend_prov_cuit import *
+from .. import _lazy
 
 __all__ = ['certificados_obras', 'listado_prov', 
-        'resumen_rend_obras', 'resumen_rend_prov', 'connect_sgf']
\ No newline at end of file
+        'resumen_rend_obras', 'resumen_rend_prov', 'connect_sgf']
+
+# Modules are imported on first use of one of their names
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all',
+        'certificados_obras',
+        'connect_sgf',
+        'join_resumen_rend_prov_cuit',
+        'listado_prov',
+        'resumen_rend_obras',
+        'resumen_rend_prov'
+    ],
+    star_modules=[
+        'connect_sgf',
+        'resumen_rend_prov',
+        'listado_prov',
+        'certificados_obras',
+        'resumen_rend_obras',
+        'join_resumen_rend_prov_cuit'
+    ],
+)
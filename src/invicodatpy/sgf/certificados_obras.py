@@ -13,6 +13,7 @@ import os
 import pandas as pd
 
 from ..models.sgf_model import SGFModel
+from ..utils.money import parse_money
 from ..utils.rpw_utils import RPWUtils
 
 
@@ -65,8 +66,7 @@ class CertificadosObras(RPWUtils):
             'suss', 'gcias', 'invico',
             'retenciones', 'importe_neto',
         ]
-        df[to_numeric_cols] = df[to_numeric_cols].apply(
-            lambda x: x.str.replace(',', '').astype(float))
+        df[to_numeric_cols] = parse_money(df[to_numeric_cols], decimal='.')
         df[['cod_obra', '_']] = df['obra'].str.split(
             pat = '-', n=1, expand=True
         )
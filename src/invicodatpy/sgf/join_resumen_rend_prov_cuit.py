@@ -20,6 +20,8 @@ from .resumen_rend_prov import ResumenRendProv
 class JoinResumenRendProvCuit():
     """Join Resumen Rend Prov y Listado Proveedores SGF"""
     df:pd.DataFrame = None
+    # Reports whose tables from_sql reads
+    _INPUTS = (ResumenRendProv, ListadoProv)
     
     # --------------------------------------------------
     def from_external_report(
@@ -14,6 +14,8 @@ import os
 import pandas as pd
 
 from ..models.sgf_model import SGFModel
+from ..utils.money import parse_money
+from ..utils.periods import ejercicio_from, mes_from, parse_dates
 from ..utils.rpw_utils import RPWUtils
 
 
@@ -63,20 +65,17 @@ class ResumenRendObras(RPWUtils):
             retenciones = '0',
             importe_neto = df['30'].where(df['55'] == '', df['41']),
         )
-        df['ejercicio'] = df['fecha'].str[-4:]
-        df['mes'] = df['fecha'].str[3:5] + '/' + df['ejercicio']
+        df['fecha'] = parse_dates(df['fecha'], format='%d/%m/%Y')
+        df['ejercicio'] = ejercicio_from(df['fecha'])
+        df['mes'] = mes_from(df['fecha'])
         df[['cod_obra', '_']] = df['obra'].str.split(pat = '-', n=1, expand=True)
-        df['fecha'] = pd.to_datetime(
-            df['fecha'], format='%d/%m/%Y'
-        )
         df = df.replace(to_replace='', value='0')
         df['cod_obra'] = df['cod_obra'].str.strip()
         to_numeric_cols = [
             'importe_bruto', 'gcias', 'sellos', 'lp', 'iibb', 'suss',
             'seguro', 'salud', 'mutual', 'importe_neto'
         ]
-        df[to_numeric_cols] = df[to_numeric_cols].apply(
-            lambda x: x.str.replace(',', '').astype(float))
+        df[to_numeric_cols] = parse_money(df[to_numeric_cols], decimal='.')
         cols_to_sum = [col for col in to_numeric_cols if col not in [
             'importe_neto', 'importe_bruto'
         ]]
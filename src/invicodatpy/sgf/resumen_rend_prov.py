@@ -14,14 +14,18 @@ import json
 import os
 import time
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from pywinauto import findwindows, keyboard, mouse
 
 from ..models.sgf_model import SGFModel
+from ..utils.money import parse_money
+from ..utils.periods import ejercicio_from, mes_from, parse_dates
 from ..utils.rpw_utils import RPWUtils
-from .connect_sgf import ConnectSGF
+
+if TYPE_CHECKING:
+    from .connect_sgf import ConnectSGF
 
 
 @dataclass
@@ -49,7 +53,7 @@ class ResumenRendProv(RPWUtils):
     _SQL_MODEL:SGFModel = field(
         init=False, repr=False, default=SGFModel
     )
-    sgf:ConnectSGF = field(
+    sgf:'ConnectSGF' = field(
         init=True, repr=False, default=None
     )
 
@@ -63,6 +67,9 @@ class ResumenRendProv(RPWUtils):
         ejercicios:list = str(dt.datetime.now().year),
         origenes:list = ['EPAM', 'OBRAS', 'FUNCIONAMIENTO']
     ):
+        # pywinauto (Windows only) is imported when a download is asked for
+        from pywinauto import findwindows, keyboard, mouse
+
         try:
             if not isinstance(origenes, list):
                 origenes = [origenes]
@@ -231,8 +238,9 @@ class ResumenRendProv(RPWUtils):
             })
             df['otras'] = '0'
 
-        df['ejercicio'] = df['fecha'].str[-4:]
-        df['mes'] = df['fecha'].str[3:5] + '/' + df['ejercicio']
+        df['fecha'] = parse_dates(df['fecha'], format='%d/%m/%Y')
+        df['ejercicio'] = ejercicio_from(df['fecha'])
+        df['mes'] = mes_from(df['fecha'])
         df['cta_cte'] = np.where(
             df['beneficiario'] == 'CREDITO ESPECIAL',
             '130832-07', 
@@ -247,8 +255,8 @@ class ResumenRendProv(RPWUtils):
             'importe_neto'
         ]]
         
-        df.loc[:, 'importe_bruto':] = df.loc[:, 'importe_bruto':].apply(
-            lambda x: x.str.replace(',', '').astype(float)
+        df.loc[:, 'importe_bruto':] = parse_money(
+            df.loc[:, 'importe_bruto':], decimal='.'
         )
         # df.loc[:,'importe_bruto':] = df.loc[:,'importe_bruto':].stack(
         # ).str.replace(',','').unstack()
@@ -269,18 +277,6 @@ class ResumenRendProv(RPWUtils):
 
         # Reindexa el DataFrame con las nuevas columnas
         df = df.reindex(columns=new_columns, copy=False)
-        
-        df['ejercicio'] = df['fecha'].str[-4:]
-        df['mes'] = df['fecha'].str[3:5] + '/' + df['ejercicio']
-        df['cta_cte'] = np.where(
-            df['beneficiario'] == 'CREDITO ESPECIAL',
-            '130832-07', 
-            df['cta_cte']
-        )
-
-        df['fecha'] = pd.to_datetime(
-            df['fecha'], format='%d/%m/%Y'
-        )
 
         self.df = df
         return self.df
@@ -349,6 +345,7 @@ def main():
         origenes = [args.origen]
 
     if args.download:
+        from .connect_sgf import ConnectSGF
         json_path = dir_path + '/sgf_credentials.json'
         if args.username != '' and args.password != '':
             sgf_connection = ConnectSGF(args.username, args.password)
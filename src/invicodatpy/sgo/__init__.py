@@ -1 +1,24 @@
-__all__ = ['connect_sgo', 'listado_obras', 'lotes_certificados']
\ No newline at end of file
+from .. import _lazy
+
+__all__ = ['connect_sgo', 'listado_obras', 'lotes_certificados',
+           'lotes_certificados_pdf', 'lotes_harvester']
+
+# Modules are imported on first use of one of their names
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all',
+        'connect_sgo',
+        'listado_obras',
+        'lotes_certificados',
+        'lotes_certificados_pdf',
+        'lotes_harvester'
+    ],
+    star_modules=[
+        'listado_obras',
+        'lotes_certificados',
+        'lotes_certificados_pdf',
+        'lotes_harvester',
+        'connect_sgo'
+    ],
+)
@@ -1,3 +1,5 @@
 from .listado_obras import *
 from .lotes_certificados import *
+from .lotes_certificados_pdf import *
+from .lotes_harvester import *
 from .connect_sgo import *
\ No newline at end of file
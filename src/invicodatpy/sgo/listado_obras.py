@@ -18,6 +18,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgo_model import SGOModel
+from ..utils.periods import parse_dates
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgo import ConnectSGO
 
@@ -78,11 +79,11 @@ class ListadoObras(RPWUtils):
             btn_exportar_completo.click()
             time.sleep(1)
             self.sgo.wait.until(EC.number_of_windows_to_be(1))
-            time.sleep(5)
             self.sgo.rename_report(
                 dir_path, 
                 'ObrasCompleto*.xls', 
-                'Obras Completo.xls'
+                'Obras Completo.xls',
+                report=self._TABLE_NAME
             )
             # self.sgo.driver.close()
 
@@ -229,7 +230,8 @@ class ListadoObras(RPWUtils):
             'fecha_fin_ampl_est', 'fecha_ultimo_certif'
 
         ]
-        df[to_date_cols] = df[to_date_cols].apply(pd.to_datetime)
+        for col in to_date_cols:
+            df[col] = parse_dates(df[col])
 
         self.df = df
         return self.df
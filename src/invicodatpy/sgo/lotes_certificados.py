@@ -20,8 +20,10 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgo_model import SGOModel
+from ..utils.periods import parse_dates
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgo import ConnectSGO
+from .lotes_harvester import LotesHarvester
 
 @dataclass
 class LotesCertificados(RPWUtils):
@@ -49,11 +51,12 @@ class LotesCertificados(RPWUtils):
 
     # --------------------------------------------------
     def download_report(
-        self, dir_path:str, pages:str = 'all'
+        self, dir_path:str, pages:str = 'all', max_workers:int = 4
     ):
         """
-        Download the 'Informe de Evolución Saldos Por Motivos' report from Sistema Recuperos.
-
+        Download every lote PDF of the Lotes Certificados grid. Lotes are
+        enumerated first and then downloaded concurrently (see 
+        LotesHarvester); lotes already downloaded are skipped.
         """
         try:
             # Path de salida
@@ -73,59 +76,12 @@ class LotesCertificados(RPWUtils):
                 By.XPATH, "//*[@id='grillaLotesCertificados']/tbody/tr[2]"
             )))
 
-            if pages == 'all':
-                total_pages = self.sgo.driver.find_element(
-                            By.XPATH, '//*[@id="sp_1_pagerLotesCertificados"]'
-                        )
-                total_pages = total_pages.text
-            else:
-                total_pages = int(pages)
-
-            nro_page = 0
-            for page in range(int(total_pages)):
-                page = page + 1
-                self.sgo.driver.execute_script("window.scrollTo(0, 0);")
-                # Llenado de inputs
-                nro_ids = self.sgo.driver.find_elements(
-                            By.XPATH, "//*[@id='grillaLotesCertificados']//td[1]"
-                        )
-                nro_lotes = self.sgo.driver.find_elements(
-                            By.XPATH, "//*[@id='grillaLotesCertificados']//td[2]"
-                        )        
-                btn_exportar_pdfs= self.sgo.driver.find_elements(
-                            By.XPATH, "//*/td[13]/div/div/button"
-                        )
-
-                #Bucle for primera por página
-                for i in range(len(btn_exportar_pdfs)): #len btn_exportar_pdfs
-                    btn_exportar_pdfs[i].click()
-                    nro_id = nro_ids[i+1].get_attribute("title")
-                    nro_lote = nro_lotes[i+1].text
-                    time.sleep(1)
-                    self.sgo.wait.until(EC.number_of_windows_to_be(1))
-                    time.sleep(1)
-                    self.sgo.rename_report(
-                        dir_path, 
-                        'lotecertificado-' + nro_id + '.pdf', 
-                        'lotecertificado-' + nro_lote + '.pdf',
-                    )
-
-                #Cambiamos de pagina	
-                btn_next = self.sgo.driver.find_element(
-                    By.XPATH, '//*[@id="next_pagerLotesCertificados"]'
-                )
-                btn_next.click()
-                time.sleep(1)
+            harvester = LotesHarvester(self.sgo, max_workers=max_workers)
+            lotes = harvester.enumerate_lotes(pages)
+            errors = harvester.download(lotes, dir_path)
+            for nro_lote, error in errors.items():
+                print(f"Lote {nro_lote} no descargado: {error}")
 
-                while (nro_page <= page) and (nro_page != int(total_pages)):
-                    print(nro_page)
-                    nro_page = self.sgo.driver.find_element(
-                        By.XPATH, '//*[@id="pagerLotesCertificados_center"]/table/tbody/tr/td[4]/input'
-                    )
-                    nro_page = nro_page.get_attribute("value")
-                    nro_page = int(nro_page)
-                    time.sleep(1)
-                
             self.sgo.driver.close()
 
         except Exception as e:
@@ -271,7 +227,8 @@ class LotesCertificados(RPWUtils):
             'fecha_fin_ampl_est', 'fecha_ultimo_certif'
 
         ]
-        df[to_date_cols] = df[to_date_cols].apply(pd.to_datetime)
+        for col in to_date_cols:
+            df[col] = parse_dates(df[col])
 
         self.df = df
         return self.df
@@ -308,6 +265,13 @@ def get_args():
         type=str,
         help = "Pages to download")
 
+    parser.add_argument(
+        '-w', '--workers', 
+        metavar = 'Workers',
+        default = 4,
+        type=int,
+        help = "Concurrent PDF downloads")
+
     return parser.parse_args()
 
 # --------------------------------------------------
@@ -333,7 +297,7 @@ def main():
                 json_file.close()
         sgo = LotesCertificados(sgo = sgo_connection)
         sgo.download_report(
-            dir_path, pages = args.pages
+            dir_path, pages = args.pages, max_workers = args.workers
         )
         sgo_connection.disconnect()
         sgo_connection.remove_html_files(dir_path)
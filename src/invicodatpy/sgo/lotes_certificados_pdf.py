@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Read, process and write the certificate lines of Gestion Obras's
+        lote PDFs (the ones LotesCertificados downloads)
+"""
+
+__all__ = ['LotesCertificadosPDF', 'parse_lote_pdf']
+
+import argparse
+import glob
+import hashlib
+import inspect
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from ..models.sgo_model import SGOModel
+from ..utils.money import parse_money
+from ..utils.rpw_utils import RPWUtils
+
+COLUMNS = [
+    'nro_lote', 'cod_obra', 'obra', 'nro_certificado',
+    'monto_certificado', 'importe_neto'
+]
+# '<obra> <nro certificado> <importe> ... <importe>', importes as 1.234,56
+_LINE_PATTERN = re.compile(
+    r'^(?P<obra>\S.*?)\s+(?P<nro_certificado>\d{1,4})\s+'
+    r'(?P<montos>-?[\d.]+,\d{2}(?:\s+-?[\d.]+,\d{2})*)\s*$'
+)
+_LOTE_PATTERN = re.compile(r'lotecertificado-(?P<nro_lote>.+)\.pdf$')
+
+
+# --------------------------------------------------
+def parse_lote_text(text:str) -> list[dict]:
+    """Certificate lines of a lote's extracted text"""
+    rows = []
+    for line in text.splitlines():
+        found = _LINE_PATTERN.match(' '.join(line.split()))
+        if found is None:
+            continue
+        montos = found.group('montos').split()
+        obra = found.group('obra')
+        rows.append({
+            # Same cod_obra as sgf's certificados_obras
+            'cod_obra': obra.split('-', 1)[0].split()[0],
+            'obra': obra,
+            'nro_certificado': found.group('nro_certificado'),
+            'monto_certificado': montos[0],
+            'importe_neto': montos[-1],
+        })
+    return rows
+
+# --------------------------------------------------
+def parse_lote_pdf(pdf_path:str) -> dict:
+    """{'rows': certificate lines, 'pages': number of pages} of a lote PDF.
+    Runs in worker processes.
+    Package requirement:
+        -   pip install pypdf
+    """
+    from pypdf import PdfReader
+    reader = PdfReader(pdf_path)
+    text = '\n'.join(page.extract_text() or '' for page in reader.pages)
+    return {'rows': parse_lote_text(text), 'pages': len(reader.pages)}
+
+# --------------------------------------------------
+def file_hash(file_path:str) -> str:
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+@dataclass
+class LotesCertificadosPDF(RPWUtils):
+    """
+    Read, process and write the certificate lines of SGO's lote PDFs.
+    PDFs are parsed in a process pool; results are cached by PDF hash
+    (cache_name, next to the PDFs) so only new lotes are parsed again.
+    """
+    _TABLE_NAME:str = field(
+        init=False, repr=False,
+        default='lotes_certificados'
+    )
+    _INDEX_COL:str = field(
+        init=False, repr=False, default='id'
+    )
+    _FILTER_COL:str = field(
+        init=False, repr=False, default='nro_lote'
+    )
+    _SQL_MODEL:SGOModel = field(
+        init=False, repr=False, default=SGOModel
+    )
+    max_workers:int = None
+    cache_name:str = '.lotes_pdf_cache.json'
+    stats:dict = field(init=False, repr=False, default_factory=dict)
+
+    # --------------------------------------------------
+    def read_cache(self, cache_path:str) -> dict:
+        if os.path.isfile(cache_path):
+            with open(cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    # --------------------------------------------------
+    def write_cache(self, cache_path:str, cache:dict) -> None:
+        with open(cache_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(cache_path + '.tmp', cache_path)
+
+    # --------------------------------------------------
+    def from_external_report(self, dir_path:str) -> pd.DataFrame:
+        """Read every lotecertificado-*.pdf in dir_path (or a single PDF,
+        without the cache)"""
+        if os.path.isfile(dir_path):
+            parsed = parse_lote_pdf(dir_path)
+            nro_lote = _LOTE_PATTERN.search(os.path.basename(dir_path))
+            self.df = pd.DataFrame(
+                [{'nro_lote': nro_lote.group('nro_lote'), **row} for row in parsed['rows']],
+                columns=COLUMNS
+            )
+            self.transform_df()
+            return self.df
+        pdf_paths = sorted(glob.glob(os.path.join(dir_path, 'lotecertificado-*.pdf')))
+        cache_path = os.path.join(dir_path, self.cache_name)
+        cache = self.read_cache(cache_path)
+        hashes = {pdf_path: file_hash(pdf_path) for pdf_path in pdf_paths}
+        new_paths = [
+            pdf_path for pdf_path in pdf_paths if hashes[pdf_path] not in cache
+        ]
+
+        start = time.perf_counter()
+        pages = 0
+        if new_paths:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                for pdf_path, parsed in zip(
+                    new_paths, executor.map(parse_lote_pdf, new_paths)
+                ):
+                    cache[hashes[pdf_path]] = parsed
+                    pages += parsed['pages']
+            self.write_cache(cache_path, cache)
+        seconds = time.perf_counter() - start
+        self.stats = {
+            'pdfs': len(pdf_paths), 'parsed': len(new_paths),
+            'pages': pages, 'seconds': seconds,
+            'pages_per_second': pages / seconds if seconds > 0 else 0.0,
+        }
+        print(
+            f"{self._TABLE_NAME}: {len(new_paths)} of {len(pdf_paths)} PDFs "
+            f"parsed, {pages} pages in {seconds:.2f} s "
+            f"({self.stats['pages_per_second']:.1f} pages/s)"
+        )
+
+        rows = []
+        for pdf_path in pdf_paths:
+            nro_lote = _LOTE_PATTERN.search(os.path.basename(pdf_path))
+            for row in cache[hashes[pdf_path]]['rows']:
+                rows.append({'nro_lote': nro_lote.group('nro_lote'), **row})
+        self.df = pd.DataFrame(rows, columns=COLUMNS)
+        self.transform_df()
+        return self.df
+
+    # --------------------------------------------------
+    def transform_df(self) -> pd.DataFrame:
+        """"Transform parsed certificate lines"""
+        df = self.df
+        to_numeric_cols = ['monto_certificado', 'importe_neto']
+        df[to_numeric_cols] = parse_money(df[to_numeric_cols], decimal=',')
+        self.df = df
+        return self.df
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Read, process and write SGO's lote PDFs",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        '-w', '--workers',
+        metavar = 'Workers',
+        default = None,
+        type=int,
+        help = "Parsing processes (default: one per CPU)")
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    dir_path = os.path.dirname(
+        os.path.abspath(
+            inspect.getfile(
+                inspect.currentframe())))
+
+    sgo = LotesCertificadosPDF(max_workers = args.workers)
+    sgo.from_external_report(dir_path)
+    # sgo.test_sql(dir_path + '/test.sqlite')
+    sgo.to_sql(dir_path + '/sgo.sqlite')
+    sgo.print_tidyverse()
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy/src
+    # python -m invicodatpy.sgo.lotes_certificados_pdf
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Enumerate every lote of Gestion Obras's Lotes Certificados grid
+and download their PDFs concurrently over the logged in session
+"""
+
+__all__ = ['LoteExport', 'LotesHarvester']
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from urllib3.util.retry import Retry
+
+from ..utils.freshness import DownloadManifest
+from .connect_sgo import ConnectSGO
+
+GRID_XPATH = "//*[@id='grillaLotesCertificados']"
+# Attributes the export button may keep its target in
+_URL_ATTRIBUTES = ('href', 'formaction', 'data-url', 'data-href', 'onclick')
+_URL_PATTERN = re.compile(r"""(?:https?://[^'"\s)]+|/[\w\-./]+(?:\?[^'"\s)]*)?)""")
+
+
+@dataclass
+class LoteExport():
+    """One row of the Lotes Certificados grid"""
+    nro_id:str
+    nro_lote:str
+    url:str = None
+    page:int = 1
+
+    # --------------------------------------------------
+    @property
+    def file_name(self) -> str:
+        return 'lotecertificado-' + self.nro_lote + '.pdf'
+
+
+@dataclass
+class LotesHarvester():
+    """
+    Two step download of the lote PDFs: enumerate (lote, export url) through
+    every grid page first, then download the PDFs with a bounded pool of
+    HTTP workers sharing the browser's cookies. Lotes recorded in the
+    download manifest (and still on disk) are skipped.
+    :param export_url: url template ('{nro_id}', '{nro_lote}') used when the
+    export button does not expose its target.
+    :param max_workers: concurrent PDF downloads.
+    """
+    sgo:ConnectSGO
+    max_workers:int = 4
+    timeout:float = 300
+    export_url:str = None
+    manifest_name:str = '.downloads_manifest.json'
+    _REPORT:str = field(init=False, repr=False, default='lotes_certificados')
+    http:requests.Session = field(init=False, repr=False, default=None)
+
+    # --------------------------------------------------
+    def __post_init__(self):
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_workers,
+            max_retries=Retry(
+                total=3, backoff_factor=1, status_forcelist=(502, 503, 504)
+            )
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+
+    # --------------------------------------------------
+    def load_cookies(self) -> None:
+        """Copy cookies and user agent from the browser"""
+        driver = self.sgo.driver
+        for cookie in driver.get_cookies():
+            self.http.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+        self.http.headers['User-Agent'] = driver.execute_script(
+            'return navigator.userAgent'
+        )
+
+    # --------------------------------------------------
+    def button_url(self, button, lote:LoteExport) -> str:
+        """Export url of a grid row (None if it can only be clicked)"""
+        for attribute in _URL_ATTRIBUTES:
+            value = button.get_attribute(attribute)
+            if not value:
+                continue
+            found = _URL_PATTERN.search(value)
+            if found:
+                return urljoin(self.sgo.driver.current_url, found.group(0))
+        if self.export_url is not None:
+            return urljoin(
+                self.sgo.driver.current_url,
+                self.export_url.format(nro_id=lote.nro_id, nro_lote=lote.nro_lote)
+            )
+        return None
+
+    # --------------------------------------------------
+    def read_page(self, page:int) -> list[LoteExport]:
+        driver = self.sgo.driver
+        nro_ids = driver.find_elements(By.XPATH, GRID_XPATH + "//td[1]")
+        nro_lotes = driver.find_elements(By.XPATH, GRID_XPATH + "//td[2]")
+        buttons = driver.find_elements(By.XPATH, "//*/td[13]/div/div/button")
+        lotes = []
+        # First row of the grid is jqGrid's hidden sizing row
+        for i, button in enumerate(buttons):
+            lote = LoteExport(
+                nro_id=nro_ids[i + 1].get_attribute('title'),
+                nro_lote=nro_lotes[i + 1].text,
+                page=page,
+            )
+            lote.url = self.button_url(button, lote)
+            lotes.append(lote)
+        return lotes
+
+    # --------------------------------------------------
+    def go_to_page(self, page:int) -> None:
+        """Move the grid to page and wait for its rows"""
+        driver = self.sgo.driver
+        first_row = driver.find_element(By.XPATH, GRID_XPATH + "/tbody/tr[2]")
+        input_page = driver.find_element(
+            By.XPATH, '//*[@id="pagerLotesCertificados_center"]/table/tbody/tr/td[4]/input'
+        )
+        input_page.clear()
+        input_page.send_keys(str(page), Keys.ENTER)
+        self.sgo.wait.until(EC.staleness_of(first_row))
+        self.sgo.wait.until(EC.presence_of_element_located((
+            By.XPATH, GRID_XPATH + "/tbody/tr[2]"
+        )))
+
+    # --------------------------------------------------
+    def enumerate_lotes(self, pages:str = 'all') -> list[LoteExport]:
+        """Every lote (and its export url) of the first pages grid pages"""
+        driver = self.sgo.driver
+        if pages == 'all':
+            total_pages = int(driver.find_element(
+                By.XPATH, '//*[@id="sp_1_pagerLotesCertificados"]'
+            ).text.replace('.', '').replace(',', ''))
+        else:
+            total_pages = int(pages)
+
+        lotes = []
+        for page in range(1, total_pages + 1):
+            if page > 1:
+                self.go_to_page(page)
+            lotes.extend(self.read_page(page))
+        return lotes
+
+    # --------------------------------------------------
+    def manifest(self, dir_path:str) -> DownloadManifest:
+        return DownloadManifest(os.path.join(dir_path, self.manifest_name))
+
+    # --------------------------------------------------
+    def pending(
+        self, lotes:list[LoteExport], dir_path:str
+    ) -> list[LoteExport]:
+        """Lotes not yet downloaded (certified lotes do not change)"""
+        manifest = self.manifest(dir_path)
+        return [
+            lote for lote in lotes
+            if manifest.get(self._REPORT, lote.nro_lote) is None
+            or not os.path.isfile(os.path.join(dir_path, lote.file_name))
+        ]
+
+    # --------------------------------------------------
+    def fetch(self, lote:LoteExport, dir_path:str) -> str:
+        """Download one lote PDF (written to a .part file and renamed)"""
+        response = self.http.get(lote.url, timeout=self.timeout)
+        response.raise_for_status()
+        if not response.content.startswith(b'%PDF'):
+            raise ValueError(
+                f"Lote {lote.nro_lote}: la respuesta no es un PDF "
+                f"({response.headers.get('Content-Type', '')})"
+            )
+        file_path = os.path.join(dir_path, lote.file_name)
+        with open(file_path + '.part', 'wb') as f:
+            f.write(response.content)
+        os.replace(file_path + '.part', file_path)
+        return file_path
+
+    # --------------------------------------------------
+    def click_download(self, lote:LoteExport, dir_path:str) -> str:
+        """Fallback for rows without an export url: the old button click"""
+        driver = self.sgo.driver
+        page = int(driver.find_element(
+            By.XPATH, '//*[@id="pagerLotesCertificados_center"]/table/tbody/tr/td[4]/input'
+        ).get_attribute('value'))
+        if page != lote.page:
+            self.go_to_page(lote.page)
+        for button, nro_id in zip(
+            driver.find_elements(By.XPATH, "//*/td[13]/div/div/button"),
+            driver.find_elements(By.XPATH, GRID_XPATH + "//td[1]")[1:]
+        ):
+            if nro_id.get_attribute('title') == lote.nro_id:
+                button.click()
+                break
+        else:
+            raise LookupError(f"Lote {lote.nro_lote} no encontrado en la grilla")
+        self.sgo.wait.until(EC.number_of_windows_to_be(1))
+        self.sgo.rename_report(
+            dir_path, 'lotecertificado-' + lote.nro_id + '.pdf', lote.file_name,
+            report=self._REPORT
+        )
+        return os.path.join(dir_path, lote.file_name)
+
+    # --------------------------------------------------
+    def download(
+        self, lotes:list[LoteExport], dir_path:str
+    ) -> dict:
+        """Download pending lotes. Returns {nro_lote: error} of the failed ones"""
+        self.load_cookies()
+        manifest = self.manifest(dir_path)
+        lotes = self.pending(lotes, dir_path)
+        errors = {}
+
+        def record(lote:LoteExport, file_path:str):
+            manifest.record(self._REPORT, lote.nro_lote, file_path)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch, lote, dir_path): lote
+                for lote in lotes if lote.url is not None
+            }
+            for future in as_completed(futures):
+                lote = futures[future]
+                try:
+                    record(lote, future.result())
+                except Exception as e:
+                    errors[lote.nro_lote] = f'{type(e).__name__}: {e}'
+
+        # The browser only handles one click at a time
+        for lote in lotes:
+            if lote.url is not None:
+                continue
+            try:
+                record(lote, self.click_download(lote, dir_path))
+            except Exception as e:
+                errors[lote.nro_lote] = f'{type(e).__name__}: {e}'
+        return errors
@@ -1,4 +1,34 @@
+from .. import _lazy
+
 __all__ = ['barrios_nuevos', 'saldo_barrio_variacion', 'saldo_motivo',
             'saldo_motivo_por_barrio', 
             'resumen_facturado', 'resumen_recaudado', 'saldo_barrio', 
-            'saldo_recuperos_cobrar_variacion', 'connect_sgv']
\ No newline at end of file
+            'saldo_recuperos_cobrar_variacion', 'connect_sgv']
+
+# Modules are imported on first use of one of their names
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all',
+        'barrios_nuevos',
+        'connect_sgv',
+        'resumen_facturado',
+        'resumen_recaudado',
+        'saldo_barrio',
+        'saldo_barrio_variacion',
+        'saldo_motivo',
+        'saldo_motivo_por_barrio',
+        'saldo_recuperos_cobrar_variacion'
+    ],
+    star_modules=[
+        'barrios_nuevos',
+        'saldo_barrio_variacion',
+        'saldo_motivo',
+        'saldo_motivo_por_barrio',
+        'resumen_facturado',
+        'resumen_recaudado',
+        'saldo_barrio',
+        'saldo_recuperos_cobrar_variacion',
+        'connect_sgv'
+    ],
+)
@@ -19,6 +19,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgv_model import SGVModel
+from ..utils.report_spec import Cell, ReportSpec
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgv import ConnectSGV
 
@@ -42,6 +43,25 @@ class BarriosNuevos(RPWUtils):
     _SQL_MODEL:SGVModel = field(
         init=False, repr=False, default=SGVModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(0, 0, stop=53),
+            header = {'ejercicio': Cell(0, 0, start=62, stop=66)},
+            data_start = 4, data_stop = -6,
+            columns = {
+                '0': 'cod_barrio', 
+                '2': 'barrio',
+                '6': 'localidad',
+                '8': 'q_entregadas',
+                '9': 'importe_total',
+                '13': 'importe_promedio',
+            },
+            integer = ('cod_barrio',),
+            numeric = ('importe_total', 'importe_promedio'),
+            blank_as_null = False,
+        )
+    )
     sgv:ConnectSGV = field(
         init=True, repr=False, default=None
     )
@@ -69,7 +89,7 @@ class BarriosNuevos(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/InformeBarriosNuevosIncorporados.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/InformeBarriosNuevosIncorporados.aspx')
 
             time.sleep(1)
 
@@ -104,7 +124,8 @@ class BarriosNuevos(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'Informe Barrios Nuevos.xlsx', 
-                        ejercicio + '-InformeBarriosNuevos.xlsx'
+                        ejercicio + '-InformeBarriosNuevos.xlsx',
+                        report=self._TABLE_NAME
                     )
                     time.sleep(1)
                     self.sgv.driver.refresh()
@@ -121,7 +142,7 @@ class BarriosNuevos(RPWUtils):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SGV's report"""
         df = self.read_xls(xls_path)
-        read_title = df['0'].iloc[0][:53]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -132,25 +153,7 @@ class BarriosNuevos(RPWUtils):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[0,0][62:66]
-        df = df.iloc[4:-6,[0, 2, 6, 8, 9, 13, 14]]
-        df.rename({
-            '0': 'cod_barrio', 
-            '2': 'barrio',
-            '6': 'localidad',
-            '8': 'q_entregadas',
-            '9': 'importe_total',
-            '13': 'importe_promedio',
-            }, axis='columns', inplace=True)
-        df['cod_barrio'] = df['cod_barrio'].astype(int)
-        df['importe_total'] = df['importe_total'].astype(float)
-        df['importe_promedio'] = df['importe_promedio'].astype(float)
-        cols = df.columns.tolist()
-        cols = cols[-1:] + cols[:-1]
-        df = df[cols]
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
@@ -14,11 +14,14 @@ import time
 from dataclasses import dataclass, field
 
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+
+from ..utils import downloads
+from ..utils.driver_factory import create_chrome_driver
+
+SGV_URL = 'https://gv.invico.gov.ar'
 
 
 @dataclass
@@ -26,17 +29,17 @@ class ConnectSGV():
     username:str = None 
     password:str = None
     invisible:bool = False
+    user_data_dir:str = None
+    url:str = SGV_URL
     driver:webdriver = field(init=False, repr=False, default=None)
 
     # --------------------------------------------------
     def __post_init__(self):
-        # Innitial driver options
-        options = Options()
-        options.add_argument("--window-size=1920,1080")
-        if self.invisible:
-            options.add_argument("--headless")
-        self.driver = webdriver.Chrome(ChromeDriverManager().install(), options=options)
-        self.driver.maximize_window()
+        self.driver = create_chrome_driver(
+            invisible=self.invisible, user_data_dir=self.user_data_dir
+        )
+        if not self.invisible:
+            self.driver.maximize_window()
 
         # Setup wait for later
         self.wait = WebDriverWait(self.driver, 20)
@@ -47,7 +50,7 @@ class ConnectSGV():
     # --------------------------------------------------
     def connect(self) -> None:
         """"Connect SGV"""
-        self.driver.get('https://gv.invico.gov.ar/login.aspx')
+        self.driver.get(self.url + '/login.aspx')
         try:
             self.wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='login']")))
             input_username, input_password, btn_connect = self.driver.find_elements(By.XPATH, "//table//input")
@@ -60,33 +63,22 @@ class ConnectSGV():
             self.quit()
 
     # --------------------------------------------------
-    def rename_report(self, dir_path:str, old_name:str, new_name:str):
-        old_file_path = os.path.join(dir_path, old_name)
-        new_file_path = os.path.join(dir_path, new_name)
-        while not os.path.exists(old_file_path):
-            time.sleep(1)
-
-        # Si sigue sin funcionar bien, considerar la posibilidad 
-        # de agregar un wait_is_there_html_file()
-
-        if os.path.isfile(old_file_path):
-            time.sleep(2)
-            if os.path.isfile(new_file_path):
-                os.remove(new_file_path)
-                time.sleep(2)
-            os.rename(old_file_path, new_file_path)
-        else:
-            raise ValueError("%s isn't a file!" % old_file_path)
+    def rename_report(
+        self, dir_path:str, old_name:str, new_name:str, timeout:float = None,
+        report:str = None
+    ):
+        """Rename old_name as soon as its download is finished
+        :param report: metrics label of the download (the calling report's
+        _TABLE_NAME), this object's own when None."""
+        downloads.move_download(
+            dir_path, old_name, new_name, timeout=timeout,
+            report=report or getattr(self, '_TABLE_NAME', '') or type(self).__name__
+        )
 
     # --------------------------------------------------
-    def remove_html_files(self, dir_path:str):
-        time.sleep(5)
-        file_list = os.listdir(dir_path)
-        for f in file_list:
-            if '.htm' in f:
-                file_path = os.path.join(dir_path, f)
-                os.remove(file_path)
-                print(f"File: {file_path} removed")
+    def remove_html_files(self, dir_path:str, timeout:float = None):
+        """Remove html files once pending downloads are finished"""
+        downloads.remove_html_files(dir_path, timeout=timeout)
         # root_dir = dir_path
         # for folder, subfolders, files in os.walk(root_dir):
         #     if folder != root_dir:
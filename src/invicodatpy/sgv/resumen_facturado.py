@@ -19,6 +19,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgv_model import SGVModel
+from ..utils.report_spec import Cell, ReportSpec
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgv import ConnectSGV
 
@@ -42,6 +43,36 @@ class ResumenFacturado(RPWUtils):
     _SQL_MODEL:SGVModel = field(
         init=False, repr=False, default=SGVModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(3, 7, stop=17),
+            header = {'ejercicio': Cell(3, 7, start=-4)},
+            data_start = 8, data_stop = -1,
+            columns = {
+                '2': 'mes', 
+                '3': 'amortizacion',
+                '4': 'int_financiero',
+                '5': 'int_mora',
+                '6': 'gtos_adm',
+                '8': 'seg_incendio',
+                '9': 'seg_vida',
+                '10': 'subsidio',
+                '11': 'pago_amigable',
+                '13': 'escritura',
+                '14': 'facturado_total',
+            },
+            numeric = (
+                'amortizacion', 'int_financiero', 'int_mora', 'gtos_adm', 
+                'seg_incendio', 'seg_vida', 'subsidio', 'pago_amigable', 
+                'escritura','facturado_total'
+            ),
+            derived = {
+                'mes': lambda df: df['mes'].str.zfill(2) + '/' + df['ejercicio'],
+            },
+            blank_as_null = False,
+        )
+    )
     sgv:ConnectSGV = field(
         init=True, repr=False, default=None
     )
@@ -69,7 +100,7 @@ class ResumenFacturado(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/ResumenFacturado.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/ResumenFacturado.aspx')
 
             time.sleep(1)
 
@@ -104,7 +135,8 @@ class ResumenFacturado(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'InformeResumenFacturado.xlsx', 
-                        ejercicio + '-InformeResumenFacturado.xlsx'
+                        ejercicio + '-InformeResumenFacturado.xlsx',
+                        report=self._TABLE_NAME
                     )
                     time.sleep(1)
                     self.sgv.driver.refresh()
@@ -121,7 +153,7 @@ class ResumenFacturado(RPWUtils):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SGV's report"""
         df = self.read_xls(xls_path)
-        read_title = df.iloc[3,7][:17]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -132,32 +164,7 @@ class ResumenFacturado(RPWUtils):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[3,7][-4:]
-        df = df.iloc[8:-1,[2, 3, 4, 5, 6, 8, 9, 10, 11, 13, 14, 15]]
-        df.rename({
-            '2': 'mes', 
-            '3': 'amortizacion',
-            '4': 'int_financiero',
-            '5': 'int_mora',
-            '6': 'gtos_adm',
-            '8': 'seg_incendio',
-            '9': 'seg_vida',
-            '10': 'subsidio',
-            '11': 'pago_amigable',
-            '13': 'escritura',
-            '14': 'facturado_total',
-            }, axis='columns', inplace=True)
-        cols = ['amortizacion', 'int_financiero', 'int_mora', 'gtos_adm', 'seg_incendio', 
-        'seg_vida', 'subsidio', 'pago_amigable', 'escritura','facturado_total']
-        for col in cols:
-            df[col] = df[col].astype(float)
-        cols = df.columns.tolist()
-        cols = cols[-1:] + cols[:-1]
-        df = df[cols]
-        df['mes'] = df['mes'].str.zfill(2) + '/' + df['ejercicio']
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
@@ -19,6 +19,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgv_model import SGVModel
+from ..utils.report_spec import Cell, ReportSpec
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgv import ConnectSGV
 
@@ -42,6 +43,37 @@ class ResumenRecaudado(RPWUtils):
     _SQL_MODEL:SGVModel = field(
         init=False, repr=False, default=SGVModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(3, 6, stop=17),
+            header = {'ejercicio': Cell(3, 6, start=41, stop=45)},
+            data_start = 8, data_stop = -1,
+            columns = {
+                '2': 'mes', 
+                '3': 'amortizacion',
+                '4': 'int_financiero',
+                '5': 'int_mora',
+                '7': 'gtos_adm',
+                '8': 'seg_incendio',
+                '9': 'seg_vida',
+                '10': 'subsidio',
+                '11': 'pago_amigable',
+                '13': 'escritura',
+                '14': 'pend_acreditacion',
+                '15': 'recaudado_total',
+            },
+            numeric = (
+                'amortizacion', 'int_financiero', 'int_mora', 'gtos_adm', 
+                'seg_incendio', 'seg_vida', 'subsidio', 'pago_amigable', 
+                'escritura', 'pend_acreditacion','recaudado_total'
+            ),
+            derived = {
+                'mes': lambda df: df['mes'].str.zfill(2) + '/' + df['ejercicio'],
+            },
+            blank_as_null = False,
+        )
+    )
     sgv:ConnectSGV = field(
         init=True, repr=False, default=None
     )
@@ -69,7 +101,7 @@ class ResumenRecaudado(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/ResumenRecaudado.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/ResumenRecaudado.aspx')
 
             time.sleep(1)
 
@@ -104,7 +136,8 @@ class ResumenRecaudado(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'InformeResumenRecaudado.xlsx', 
-                        ejercicio + '-InformeResumenRecaudado.xlsx'
+                        ejercicio + '-InformeResumenRecaudado.xlsx',
+                        report=self._TABLE_NAME
                     )
                     time.sleep(1)
                     self.sgv.driver.refresh()
@@ -121,7 +154,7 @@ class ResumenRecaudado(RPWUtils):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SGV's report"""
         df = self.read_xls(xls_path)
-        read_title = df.iloc[3,6][:17]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -132,33 +165,7 @@ class ResumenRecaudado(RPWUtils):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[3,6][41:45]
-        df = df.iloc[8:-1,[2, 3, 4, 5, 7, 8, 9, 10, 11, 13, 14, 15, 16]]
-        df.rename({
-            '2': 'mes', 
-            '3': 'amortizacion',
-            '4': 'int_financiero',
-            '5': 'int_mora',
-            '7': 'gtos_adm',
-            '8': 'seg_incendio',
-            '9': 'seg_vida',
-            '10': 'subsidio',
-            '11': 'pago_amigable',
-            '13': 'escritura',
-            '14': 'pend_acreditacion',
-            '15': 'recaudado_total',
-            }, axis='columns', inplace=True)
-        cols = ['amortizacion', 'int_financiero', 'int_mora', 'gtos_adm', 'seg_incendio', 
-        'seg_vida', 'subsidio', 'pago_amigable', 'escritura', 'pend_acreditacion','recaudado_total']
-        for col in cols:
-            df[col] = df[col].astype(float)
-        cols = df.columns.tolist()
-        cols = cols[-1:] + cols[:-1]
-        df = df[cols]
-        df['mes'] = df['mes'].str.zfill(2) + '/' + df['ejercicio']
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
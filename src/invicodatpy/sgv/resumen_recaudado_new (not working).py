@@ -120,7 +120,8 @@ class ResumenRecaudado(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'InformeResumenRecaudado.xlsx', 
-                        ejercicio + '-InformeResumenRecaudado.xlsx'
+                        ejercicio + '-InformeResumenRecaudado.xlsx',
+                        report=self._TABLE_NAME
                     )
                     time.sleep(1)
                     self.sgv.driver.refresh()
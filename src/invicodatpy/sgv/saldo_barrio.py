@@ -19,6 +19,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgv_model import SGVModel
+from ..utils.report_spec import Cell, ReportSpec
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgv import ConnectSGV
 
@@ -42,6 +43,24 @@ class SaldoBarrio(RPWUtils):
     _SQL_MODEL:SGVModel = field(
         init=False, repr=False, default=SGVModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(0, 0, stop=28),
+            header = {'ejercicio': Cell(0, 0, start=-4)},
+            data_start = 5, data_stop = -1,
+            columns = {
+                '0': 'cod_barrio', 
+                '1': 'barrio',
+                '2': 'saldo_vencido',
+                '3': 'saldo_actual',
+                '5': 'localidad',
+            },
+            integer = ('cod_barrio',),
+            numeric = ('saldo_vencido', 'saldo_actual'),
+            blank_as_null = False,
+        )
+    )
     sgv:ConnectSGV = field(
         init=True, repr=False, default=None
     )
@@ -54,6 +73,12 @@ class SaldoBarrio(RPWUtils):
         Download the 'Informe de Evolución Saldos Por Motivos' report from Sistema Recuperos.
 
         """
+        ejercicios = self.periods_to_download(
+            dir_path, ejercicios,
+            lambda ejercicio: ejercicio + '-InformeSaldosPorBarrio.xlsx'
+        )
+        if not ejercicios:
+            return
         try:
             # Path de salida
             params = {
@@ -69,7 +94,7 @@ class SaldoBarrio(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/InformeSaldosPorBarrio.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/InformeSaldosPorBarrio.aspx')
 
             time.sleep(1)
 
@@ -106,6 +131,11 @@ class SaldoBarrio(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'Informe Saldos Por Barrio.xlsx', 
+                        ejercicio + '-InformeSaldosPorBarrio.xlsx',
+                        report=self._TABLE_NAME
+                    )
+                    self.mark_downloaded(
+                        dir_path, ejercicio,
                         ejercicio + '-InformeSaldosPorBarrio.xlsx'
                     )
                     time.sleep(1)
@@ -122,7 +152,7 @@ class SaldoBarrio(RPWUtils):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SGV's report"""
         df = self.read_xls(xls_path)
-        read_title = df.iloc[0,0][:28]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -133,25 +163,7 @@ class SaldoBarrio(RPWUtils):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[0,0][-4:]
-        df = df.iloc[5:-1, [0, 1, 2, 3, 5, 6]]
-        df.rename({
-            '0': 'cod_barrio', 
-            '1': 'barrio',
-            '2': 'saldo_vencido',
-            '3': 'saldo_actual',
-            '5': 'localidad',
-            }, axis='columns', inplace=True)
-        df['cod_barrio'] = df['cod_barrio'].astype(int)
-        cols = ['saldo_vencido', 'saldo_actual']
-        for col in cols:
-            df[col] = df[col].astype(float)
-        cols = df.columns.tolist()
-        cols = cols[-1:] + cols[:-1]
-        df = df[cols]
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
@@ -19,6 +19,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgv_model import SGVModel
+from ..utils.report_spec import Cell, ReportSpec
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgv import ConnectSGV
 
@@ -42,6 +43,28 @@ class SaldoBarrioVariacion(RPWUtils):
     _SQL_MODEL:SGVModel = field(
         init=False, repr=False, default=SGVModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(1, 0, stop=30),
+            header = {'ejercicio': Cell(1, 0, start=-5, stop=-1)},
+            data_start = 6, data_stop = -1,
+            columns = {
+                '0': 'cod_barrio', 
+                '1': 'barrio',
+                '2': 'saldo_inicial',
+                '3': 'amortizacion',
+                '4': 'cambios',
+                '6': 'saldo_final',
+            },
+            integer = ('cod_barrio',),
+            numeric = ('saldo_inicial', 'amortizacion', 'cambios', 'saldo_final'),
+            derived = {
+                'amortizacion': lambda df: df['amortizacion'] * (-1),
+            },
+            blank_as_null = False,
+        )
+    )
     sgv:ConnectSGV = field(
         init=True, repr=False, default=None
     )
@@ -69,7 +92,7 @@ class SaldoBarrioVariacion(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/InformeEvolucionDeSaldosPorBarrio.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/InformeEvolucionDeSaldosPorBarrio.aspx')
 
             time.sleep(1)
 
@@ -106,7 +129,8 @@ class SaldoBarrioVariacion(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'InformeEvolucionDeSaldosPorBarrio.xlsx', 
-                        ejercicio + '-InformeEvolucionDeSaldosPorBarrio.xlsx'
+                        ejercicio + '-InformeEvolucionDeSaldosPorBarrio.xlsx',
+                        report=self._TABLE_NAME
                     )
                     time.sleep(1)
             self.sgv.driver.close()
@@ -122,7 +146,7 @@ class SaldoBarrioVariacion(RPWUtils):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SGV's report"""
         df = self.read_xls(xls_path)
-        read_title = df.iloc[1,0][:30]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -133,27 +157,7 @@ class SaldoBarrioVariacion(RPWUtils):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[1,0][-5:][0:4]
-        df = df.iloc[6:-1, [0, 1, 2, 3, 4, 6, 7]]
-        df.rename({
-            '0': 'cod_barrio', 
-            '1': 'barrio',
-            '2': 'saldo_inicial',
-            '3': 'amortizacion',
-            '4': 'cambios',
-            '6': 'saldo_final',
-            }, axis='columns', inplace=True)
-        df['cod_barrio'] = df['cod_barrio'].astype(int)
-        cols = ['saldo_inicial', 'amortizacion', 'cambios', 'saldo_final']
-        for col in cols:
-            df[col] = df[col].astype(float)
-        df['amortizacion'] = df['amortizacion'] * (-1)
-        cols = df.columns.tolist()
-        cols = cols[-1:] + cols[:-1]
-        df = df[cols]
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
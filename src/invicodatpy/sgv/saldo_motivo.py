@@ -19,6 +19,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..models.sgv_model import SGVModel
+from ..utils.report_spec import Cell, ReportSpec
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgv import ConnectSGV
 
@@ -43,6 +44,21 @@ class SaldoMotivo(RPWUtils):
     _SQL_MODEL:SGVModel = field(
         init=False, repr=False, default=SGVModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(0, 0, stop=30),
+            header = {'ejercicio': Cell(0, 0, start=-5, stop=-1)},
+            data_start = 4, data_stop = -1,
+            columns = {
+                '1': 'cod_motivo', 
+                '2': 'motivo',
+                '3': 'importe',
+            },
+            numeric = ('importe',),
+            blank_as_null = False,
+        )
+    )
     sgv:ConnectSGV = field(
         init=True, repr=False, default=None
     )
@@ -70,7 +86,7 @@ class SaldoMotivo(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/InformeEvolucionDeSaldosPorMotivos.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/InformeEvolucionDeSaldosPorMotivos.aspx')
 
             time.sleep(1)
 
@@ -105,7 +121,8 @@ class SaldoMotivo(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'RecuperosInformeEvolucionDeSaldosPorMotivos.xlsx', 
-                        ejercicio + '-InformeEvolucionDeSaldosPorMotivos.xlsx'
+                        ejercicio + '-InformeEvolucionDeSaldosPorMotivos.xlsx',
+                        report=self._TABLE_NAME
                     )
                     time.sleep(1)
             self.sgv.driver.close()
@@ -121,7 +138,7 @@ class SaldoMotivo(RPWUtils):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SGV's report"""
         df = self.read_xls(xls_path)
-        read_title = df.iloc[0,0][:30]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -132,22 +149,7 @@ class SaldoMotivo(RPWUtils):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[0,0][-5:][0:4]
-        df = df.iloc[4:-1, [1, 2, 3, 4]]
-        df.rename({
-            '1': 'cod_motivo', 
-            '2': 'motivo',
-            '3': 'importe',
-            }, axis='columns', inplace=True)
-        cols = ['importe']
-        for col in cols:
-            df[col] = df[col].astype(float)
-        cols = df.columns.tolist()
-        cols = cols[-1:] + cols[:-1]
-        df = df[cols]
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
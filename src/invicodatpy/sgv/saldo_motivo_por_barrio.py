@@ -12,6 +12,7 @@ import json
 import os
 import time
 from dataclasses import dataclass, field
+from typing import Literal
 
 import pandas as pd
 from selenium.webdriver.common.by import By
@@ -22,6 +23,10 @@ from ..models.sgv_model import SGVModel
 from ..utils.rpw_utils import RPWUtils
 from .connect_sgv import ConnectSGV
 
+MOTIVOS_COLUMNS = [
+    'cod_motivo', 'motivo', 'cod_barrio', 'barrio', 'importe', 'ejercicio'
+]
+
 def default_filter_col():
     return ['ejercicio', 'motivo']
 
@@ -51,12 +56,17 @@ class SaldoMotivoPorBarrio(RPWUtils):
 
     # --------------------------------------------------
     def download_report(
-        self, dir_path:str, ejercicios:list = str(dt.datetime.now().year)
+        self, dir_path:str, ejercicios:list = str(dt.datetime.now().year),
+        output:Literal['xlsx', 'parquet', 'sql'] = 'xlsx', sql_path:str = None
     ):
         """
         Download the 'Informe de Evolución Saldos Por Motivos' report from Sistema Recuperos.
-
+        :param output: where each ejercicio's combined motivos go: 'xlsx'
+        (the file from_external_report reads), 'parquet' (same name, 
+        .parquet) or 'sql' (straight to the sql_path database, no file).
         """
+        if output == 'sql' and sql_path is None:
+            raise ValueError("sql_path is needed when output is 'sql'")
         try:
             # Path de salida
             params = {
@@ -72,7 +82,7 @@ class SaldoMotivoPorBarrio(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/InformeEvolucionDeSaldosPorMotivos.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/InformeEvolucionDeSaldosPorMotivos.aspx')
 
             time.sleep(1)
 
@@ -83,16 +93,13 @@ class SaldoMotivoPorBarrio(RPWUtils):
                 (By.XPATH, xpath_ejercicio)
             ))
 
-            # Generando Dataframe de Motivos
-            df_motivos = pd.DataFrame(columns=[
-                'cod_motivo', 'motivo', 'cod_barrio', 'barrio', 'importe', 'ejercicio'
-            ])
-
             # Bajando Reportes
             if not isinstance(ejercicios, list):
                 ejercicios = [ejercicios]
             for ejercicio in ejercicios:
                 int_ejercicio = int(ejercicio)
+                # Motivos are concatenated once per ejercicio
+                motivos = []
                 if int_ejercicio > 2010 and int_ejercicio < (dt.datetime.now().year + 1):
                     # Ejercicio
                     input_ejercicio = self.sgv.driver.find_element(
@@ -136,7 +143,8 @@ class SaldoMotivoPorBarrio(RPWUtils):
                         self.sgv.rename_report(
                             dir_path, 
                             'RecuperosInformeEvoSaldosPorMotivoPorBarrio.xlsx', 
-                            file_name
+                            file_name,
+                            report=self._TABLE_NAME
                         )
                         self.from_external_report_temp(dir_path + '/' + file_name)
                         self.transform_df(
@@ -144,7 +152,7 @@ class SaldoMotivoPorBarrio(RPWUtils):
                             cod_motivo=cod_motivo_str, 
                             motivo=desc_motivo_str,
                         )
-                        df_motivos = pd.concat([df_motivos, self.df])
+                        motivos.append(self.df)
                         os.remove(dir_path + '/' + file_name)
                         input_ejercicio = self.sgv.driver.find_element(
                             By.XPATH, xpath_ejercicio
@@ -154,13 +162,10 @@ class SaldoMotivoPorBarrio(RPWUtils):
                             (By.XPATH, table_motivos)
                         ))
                     time.sleep(1)
-                file_name = dir_path + '/' + ejercicio + '-RecuperosInformeEvoSaldosPorMotivoPorBarrio.xlsx'
-                if os.path.isfile(file_name):
-                    os.remove(file_name)
-                    time.sleep(2)
-                with pd.ExcelWriter(file_name) as writer:
-                    df_motivos.to_excel(writer, sheet_name='MotivosPorBarrio', index=False)
-                df_motivos = df_motivos.drop(df_motivos.index)
+                self.save_motivos(
+                    self.concat_motivos(motivos), dir_path, ejercicio, 
+                    output, sql_path
+                )
             self.sgv.driver.close()
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[0])
             time.sleep(1)
@@ -170,6 +175,37 @@ class SaldoMotivoPorBarrio(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[0])
             self.sgv.disconnect()
 
+    # --------------------------------------------------
+    @staticmethod
+    def concat_motivos(motivos:list[pd.DataFrame]) -> pd.DataFrame:
+        """Single concat of every transformed motivo table"""
+        if not motivos:
+            return pd.DataFrame(columns=MOTIVOS_COLUMNS)
+        df = pd.concat(motivos)
+        return df.reindex(columns=MOTIVOS_COLUMNS + [
+            col for col in df.columns if col not in MOTIVOS_COLUMNS
+        ])
+
+    # --------------------------------------------------
+    def save_motivos(
+        self, df:pd.DataFrame, dir_path:str, ejercicio:str,
+        output:str = 'xlsx', sql_path:str = None
+    ):
+        """Write one ejercicio's motivos to xlsx, parquet or the database"""
+        file_name = os.path.join(
+            dir_path, ejercicio + '-RecuperosInformeEvoSaldosPorMotivoPorBarrio'
+        )
+        if output == 'xlsx':
+            with pd.ExcelWriter(file_name + '.xlsx') as writer:
+                df.to_excel(writer, sheet_name='MotivosPorBarrio', index=False)
+        elif output == 'parquet':
+            df.to_parquet(file_name + '.parquet', index=False)
+        elif output == 'sql':
+            self.df = df
+            self.to_sql(sql_path)
+        else:
+            raise ValueError(f"Unknown output: {output}")
+
     # --------------------------------------------------
     def from_external_report_temp(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SGV's report"""
@@ -183,7 +219,10 @@ class SaldoMotivoPorBarrio(RPWUtils):
 
     # --------------------------------------------------
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
-        """"Read from xls SGV's report"""
+        """"Read from xls SGV's report (or the parquet download_report writes)"""
+        if xls_path.endswith('.parquet'):
+            self.df = pd.read_parquet(xls_path)
+            return self.df
         df = self.read_xls(xls_path)
         read_title = df.iloc[0,0]
         if read_title == 'cod_motivo':
@@ -260,6 +299,13 @@ def get_args():
         type=str,
         help = "Ejercicio to download from Gestión Vivienda")
 
+    parser.add_argument(
+        '-o', '--output', 
+        choices = ['xlsx', 'parquet', 'sql'],
+        default = 'xlsx',
+        type=str,
+        help = "Where downloaded motivos are written")
+
     return parser.parse_args()
 
 # --------------------------------------------------
@@ -285,7 +331,8 @@ def main():
                 json_file.close()
         sgv = SaldoMotivoPorBarrio(sgv = sgv_connection)
         sgv.download_report(
-            dir_path, ejercicios=args.ejercicio
+            dir_path, ejercicios=args.ejercicio, output=args.output,
+            sql_path=dir_path + '/sgv.sqlite'
         )
         sgv_connection.disconnect()
         sgv_connection.remove_html_files(dir_path)
@@ -297,12 +344,15 @@ def main():
     else:
         file = args.ejercicio
 
-    file = file[0] + '-RecuperosInformeEvoSaldosPorMotivoPorBarrio.xlsx'
-
-    sgv.from_external_report(dir_path + '/' + file)
-    # sgv.test_sql(dir_path + '/test.sqlite')
-    sgv.to_sql(dir_path + '/sgv.sqlite')
-    sgv.print_tidyverse()
+    # With -o sql motivos are written straight to sgv.sqlite (by this or
+    # a previous download), there is no file to read
+    if args.output != 'sql':
+        file = file[0] + '-RecuperosInformeEvoSaldosPorMotivoPorBarrio.' + args.output
+        sgv.from_external_report(dir_path + '/' + file)
+        # sgv.test_sql(dir_path + '/test.sqlite')
+        sgv.to_sql(dir_path + '/sgv.sqlite')
+    if sgv.df is not None:
+        sgv.print_tidyverse()
     sgv.from_sql(dir_path + '/sgv.sqlite')
     sgv.print_tidyverse()
 
@@ -71,7 +71,7 @@ class SaldoRecuperosCobrarVariacion(RPWUtils):
             self.sgv.driver.switch_to.window(self.sgv.driver.window_handles[1])
 
             # Navegar a una dirección web específica en la nueva pestaña
-            self.sgv.driver.get('https://gv.invico.gov.ar/App/Recupero/Informes/InformeVariacionSaldosRecuperosACobrar.aspx')
+            self.sgv.driver.get(self.sgv.url + '/App/Recupero/Informes/InformeVariacionSaldosRecuperosACobrar.aspx')
 
             time.sleep(1)
 
@@ -107,7 +107,8 @@ class SaldoRecuperosCobrarVariacion(RPWUtils):
                     self.sgv.rename_report(
                         dir_path, 
                         'InformeVariacionSaldosRecuperosCobrar.xlsx', 
-                        ejercicio + '-InformeVariacionSaldosRecuperosCobrar.xlsx'
+                        ejercicio + '-InformeVariacionSaldosRecuperosCobrar.xlsx',
+                        report=self._TABLE_NAME
                     )
                     time.sleep(1)
             self.sgv.driver.close()
@@ -1,24 +1,56 @@
-from .connect_siif import *
-from .comprobantes_gtos_gpo_part_gto_rpa03g import *
-from .ppto_gtos_fte_rf602 import *
-from .ppto_gtos_desc_rf610 import *
-from .comprobantes_gtos_rcg01_uejp import *
-from .resumen_fdos_rfondo07tp import *
-from .resumen_contable_cta_rvicon03 import *
-from .comprobantes_rec_rci02 import *
-from .deuda_flotante_rdeu012 import *
-from .deuda_flotante_rdeu012b2_c import *
-from .detalle_partidas_rog01 import *
-from .form_gto_rfp_p605b import *
-from .join_comprobantes_gtos_gpo_part import *
-from .join_ppto_gtos_fte_desc import *
-from .mayor_contable_rcocc31 import *
-from .ppto_rec_ri102 import *
-from .join_resumen_mayor_contable import *
-
+from .. import _lazy
 
 __all__ = ['comprobantes_gtos_gpo_part_gto_rpa03g', 'comprobantes_gtos_rcg01_uejp',
 'comprobantes_rec_rci02', 'ppto_rec_ri102', 'deuda_flotante_rdeu012', 'deuda_flotante_rdeu012b2_c',
 'join_comprobantes_gtos_gpo_part', 'join_ppto_gtos_fte_desc', 'mayor_contable_rcocc31', 
 'form_gto_rfp_p605b', 'ppto_gtos_desc_rf610', 'ppto_gtos_fte_rf602', 'resumen_fdos_rfondo07tp',
-'detalle_partidas_rog01', 'connect_siif', 'resumen_contable_cta_rvicon03', 'join_resumen_mayor_contable']
\ No newline at end of file
+'detalle_partidas_rog01', 'connect_siif', 'resumen_contable_cta_rvicon03', 'join_resumen_mayor_contable',
+'siif_http_fetcher', 'siif_session_pool']
+
+# Modules are imported on first use of one of their names
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all',
+        'comprobantes_gtos_gpo_part_gto_rpa03g',
+        'comprobantes_gtos_rcg01_uejp',
+        'comprobantes_rec_rci02',
+        'connect_siif',
+        'detalle_partidas_rog01',
+        'deuda_flotante_rdeu012',
+        'deuda_flotante_rdeu012b2_c',
+        'form_gto_rfp_p605b',
+        'join_comprobantes_gtos_gpo_part',
+        'join_ppto_gtos_fte_desc',
+        'join_resumen_mayor_contable',
+        'mayor_contable_rcocc31',
+        'ppto_gtos_desc_rf610',
+        'ppto_gtos_fte_rf602',
+        'ppto_rec_ri102',
+        'resumen_contable_cta_rvicon03',
+        'resumen_fdos_rfondo07tp',
+        'siif_http_fetcher',
+        'siif_session_pool'
+    ],
+    star_modules=[
+        'connect_siif',
+        'comprobantes_gtos_gpo_part_gto_rpa03g',
+        'ppto_gtos_fte_rf602',
+        'ppto_gtos_desc_rf610',
+        'comprobantes_gtos_rcg01_uejp',
+        'resumen_fdos_rfondo07tp',
+        'resumen_contable_cta_rvicon03',
+        'comprobantes_rec_rci02',
+        'deuda_flotante_rdeu012',
+        'deuda_flotante_rdeu012b2_c',
+        'detalle_partidas_rog01',
+        'form_gto_rfp_p605b',
+        'join_comprobantes_gtos_gpo_part',
+        'join_ppto_gtos_fte_desc',
+        'mayor_contable_rcocc31',
+        'ppto_rec_ri102',
+        'join_resumen_mayor_contable',
+        'siif_http_fetcher',
+        'siif_session_pool'
+    ],
+)
@@ -18,6 +18,8 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.periods import mes_from, nro_comprobante_from
+from ..utils.report_spec import Cell, ReportSpec
 from .connect_siif import ConnectSIIF, ReportCategory
 
 
@@ -44,6 +46,39 @@ class ComprobantesGtosGpoPartGtoRpa03g(ConnectSIIF):
     _SQL_MODEL:SIIFModel = field(
         init=False, repr=False, default=SIIFModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(5, 18, stop=40),
+            header = {'ejercicio': Cell(3, 18, start=-4)},
+            data_start = 21,
+            columns = {
+                '1': 'nro_entrada',
+                '5': 'nro_origen',
+                '8': 'importe',
+                '14': 'fecha',
+                '17': 'partida',
+                '19': 'nro_expte',
+                '21': 'glosa',
+                '23': 'beneficiario',
+            },
+            required = ('nro_entrada',),
+            numeric = ('importe',),
+            dates = {'fecha': '%Y-%m-%d'},
+            derived = {
+                'grupo': lambda df: df['partida'].str[0] + '00',
+                'mes': lambda df: mes_from(df['fecha'], df['ejercicio']),
+                'nro_comprobante': lambda df: nro_comprobante_from(
+                    df['nro_entrada'], df['mes']
+                ),
+            },
+            order = (
+                'ejercicio', 'mes', 'fecha', 'nro_comprobante', 'importe',
+                'grupo', 'partida', 'nro_entrada', 'nro_origen', 'nro_expte', 
+                'glosa', 'beneficiario', 
+            ),
+        )
+    )
 
     # --------------------------------------------------
     def download_report(
@@ -113,7 +148,7 @@ class ComprobantesGtosGpoPartGtoRpa03g(ConnectSIIF):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SIIF's report"""
         df = self.read_xls(xls_path)
-        read_title = df['18'].iloc[5][:40]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -125,37 +160,7 @@ class ComprobantesGtosGpoPartGtoRpa03g(ConnectSIIF):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[3,18][-4:]
-        df = df.replace(to_replace='', value=None)
-        df = df.tail(-21)
-        df = df.dropna(subset=['1'])
-        df = df.rename(columns={
-            '1': 'nro_entrada',
-            '5': 'nro_origen',
-            '8': 'importe',
-            '14': 'fecha',
-            '17': 'partida',
-            '19': 'nro_expte',
-            '21': 'glosa',
-            '23': 'beneficiario',
-        })
-        df['importe'] = pd.to_numeric(df['importe']).astype(np.float64)
-        df['grupo'] = df['partida'].str[0] + '00'
-        df['mes'] = df['fecha'].str[5:7] + '/' + df['ejercicio']
-        df['nro_comprobante'] = df['nro_entrada'].str.zfill(5) + '/' + df['mes'].str[-2:]
-
-        df['fecha'] = pd.to_datetime(
-            df['fecha'], format='%Y-%m-%d'
-        )
-
-        df = df.loc[:,[
-            'ejercicio', 'mes', 'fecha', 'nro_comprobante', 'importe',
-            'grupo', 'partida', 'nro_entrada', 'nro_origen', 'nro_expte', 
-            'glosa', 'beneficiario', 
-        ]]
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
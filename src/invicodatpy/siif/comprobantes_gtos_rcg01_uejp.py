@@ -18,6 +18,8 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.periods import mes_from, nro_comprobante_from
+from ..utils.report_spec import Cell, ReportSpec
 from .connect_siif import ConnectSIIF, ReportCategory
 
 
@@ -44,11 +46,66 @@ class ComprobantesGtosRcg01Uejp(ConnectSIIF):
     _SQL_MODEL:SIIFModel = field(
         init=False, repr=False, default=SIIFModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(4, 1),
+            header = {'ejercicio': Cell(2, 1, start=-4)},
+            data_start = 16,
+            columns = {
+                '1': 'nro_entrada',
+                '2': 'nro_origen',
+                '3': 'fuente',
+                '4': 'clase_reg',
+                '5': 'clase_mod',
+                '6': 'clase_gto',
+                '7': 'fecha',
+                '8': 'importe',
+                '9': 'cuit',
+                '10': 'beneficiario',
+                '11': 'nro_expte',
+                '12': 'cta_cte',
+                '13': 'es_comprometido',
+                '14': 'es_verificado',
+                '15': 'es_aprobado',
+                '16': 'es_pagado',
+                '19': 'nro_fondo'
+            },
+            required = ('cuit', 'nro_entrada'),
+            numeric = ('importe',),
+            dates = {'fecha': '%Y-%m-%d'},
+            flags = {
+                'es_comprometido': 'S', 'es_verificado': 'S', 
+                'es_aprobado': 'S', 'es_pagado': 'S'
+            },
+            derived = {
+                'beneficiario': lambda df: df['beneficiario'].str.replace("\t", ""),
+                'mes': lambda df: mes_from(df['fecha']),
+                'nro_comprobante': lambda df: nro_comprobante_from(
+                    df['nro_entrada'], df['mes']
+                ),
+            },
+            order = (
+                'ejercicio', 'mes', 'fecha', 'nro_comprobante', 'importe', 
+                'fuente', 'cta_cte', 'cuit', 'nro_expte', 'nro_fondo',
+                'nro_entrada', 'nro_origen', 'clase_reg','clase_mod',
+                'clase_gto', 'beneficiario', 'es_comprometido',
+                'es_verificado', 'es_aprobado', 'es_pagado',
+            ),
+        )
+    )
 
     # --------------------------------------------------
     def download_report(
         self, dir_path:str, ejercicios:list = str(dt.datetime.now().year)
     ):
+        # Each ejercicio is asked up to the end of the next one
+        ejercicios = self.periods_to_download(
+            dir_path, ejercicios,
+            lambda ejercicio: ejercicio + '-rcg01_uejp.xls', grace_months=15
+        )
+        if not ejercicios:
+            return
         try:
             self.set_download_path(dir_path)
             self.select_report_module(ReportCategory.Gastos)
@@ -104,6 +161,7 @@ class ComprobantesGtosRcg01Uejp(ConnectSIIF):
 
                     # Download and rename xls
                     self.rename_report(dir_path, 'rcg01_uejp.xls', ejercicio + '-rcg01_uejp.xls')
+                    self.mark_downloaded(dir_path, ejercicio, ejercicio + '-rcg01_uejp.xls')
                     self.download_file_procedure()
             time.sleep(1)
 
@@ -118,7 +176,7 @@ class ComprobantesGtosRcg01Uejp(ConnectSIIF):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SIIF's report"""
         df = self.read_xls(xls_path)
-        read_title = df['1'].iloc[4]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -130,53 +188,7 @@ class ComprobantesGtosRcg01Uejp(ConnectSIIF):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df = df.replace(to_replace='', value=None)   
-        df['ejercicio'] = df.iloc[2,1][-4:]
-        df = df.tail(-16)
-        df = df.drop(columns=['0', '17', '18'])
-        df = df.rename(columns={
-            '1': 'nro_entrada',
-            '2': 'nro_origen',
-            '3': 'fuente',
-            '4': 'clase_reg',
-            '5': 'clase_mod',
-            '6': 'clase_gto',
-            '7': 'fecha',
-            '8': 'importe',
-            '9': 'cuit',
-            '10': 'beneficiario',
-            '11': 'nro_expte',
-            '12': 'cta_cte',
-            '13': 'es_comprometido',
-            '14': 'es_verificado',
-            '15': 'es_aprobado',
-            '16': 'es_pagado',
-            '19': 'nro_fondo'
-        })
-        df = df.dropna(subset=['cuit'])
-        df = df.dropna(subset=['nro_entrada'])   
-        df['beneficiario'] = df['beneficiario'].str.replace("\t", "")
-        df['importe'] = pd.to_numeric(df['importe']).astype(np.float64)
-        df['es_comprometido'] = df['es_comprometido'] == 'S'
-        df['es_verificado'] = df['es_verificado'] == 'S'
-        df['es_aprobado'] = df['es_aprobado'] == 'S'
-        df['es_pagado'] = df['es_pagado'] == 'S'
-        df['fecha'] = pd.to_datetime(
-            df['fecha'], format='%Y-%m-%d'
-        )
-        df['mes'] = df['fecha'].dt.strftime('%m/%Y')
-        df['nro_comprobante'] = df['nro_entrada'].str.zfill(5) + '/' + df['mes'].str[-2:]
-
-        df = df.loc[:, [
-            'ejercicio', 'mes', 'fecha', 'nro_comprobante', 'importe', 
-            'fuente', 'cta_cte', 'cuit', 'nro_expte', 'nro_fondo',
-            'nro_entrada', 'nro_origen', 'clase_reg','clase_mod',
-            'clase_gto', 'beneficiario', 'es_comprometido',
-            'es_verificado', 'es_aprobado', 'es_pagado',
-        ]]
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
@@ -18,6 +18,8 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.periods import mes_from
+from ..utils.report_spec import Cell, ReportSpec
 from .connect_siif import ConnectSIIF, ReportCategory
 
 
@@ -44,6 +46,41 @@ class ComprobantesRecRci02(ConnectSIIF):
     _SQL_MODEL:SIIFModel = field(
         init=False, repr=False, default=SIIFModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(6, 25),
+            header = {'ejercicio': Cell(3, 34)},
+            data_start = 22,
+            columns = {
+                '17': 'fecha',
+                '6': 'fuente',
+                '28': 'cta_cte',
+                '2': 'nro_entrada',
+                '23': 'importe',
+                '32': 'glosa',
+                '42': 'es_verificado',
+                '10': 'clase_reg',
+                '13': 'clase_mod'
+            },
+            required = ('nro_entrada',),
+            numeric = ('importe',),
+            dates = {'fecha': '%Y-%m-%d'},
+            flags = {'es_verificado': 'S'},
+            derived = {
+                'mes': lambda df: mes_from(df['fecha'], df['ejercicio']),
+                'es_remanente': lambda df: df['glosa'].str.contains("REMANENTE"),
+                'es_invico': lambda df: df['glosa'].str.contains("%"),
+            },
+            order = (
+                'ejercicio', 'mes', 'fecha',
+                'fuente', 'cta_cte', 'nro_entrada',
+                'importe', 'glosa', 'es_remanente',
+                'es_invico', 'es_verificado',
+                'clase_reg', 'clase_mod'
+            ),
+        )
+    )
 
     # --------------------------------------------------
     def download_report(
@@ -113,7 +150,7 @@ class ComprobantesRecRci02(ConnectSIIF):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SIIF's report"""
         df = self.read_xls(xls_path)
-        read_title = df['25'].iloc[6]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -125,42 +162,7 @@ class ComprobantesRecRci02(ConnectSIIF):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[3,34]
-        df = df.replace(to_replace='', value=None)
-        df = df.tail(-22)
-        df = df.dropna(subset=['2'])
-        df = df.rename(columns={
-            '17': 'fecha',
-            '6': 'fuente',
-            '28': 'cta_cte',
-            '2': 'nro_entrada',
-            '23': 'importe',
-            '32': 'glosa',
-            '42': 'es_verificado',
-            '10': 'clase_reg',
-            '13': 'clase_mod'
-        })
-        df['mes'] = df['fecha'].str[5:7] + '/' + df['ejercicio']
-        df['es_remanente'] = df['glosa'].str.contains("REMANENTE")
-        df['es_invico'] = df['glosa'].str.contains("%")
-        df['es_verificado'] = np.where(
-            df['es_verificado'] == 'S', True, False
-        )
-        df['importe'] = df['importe'].apply(pd.to_numeric).astype(np.float64) 
-
-        df['fecha'] = pd.to_datetime(
-            df['fecha'], format='%Y-%m-%d'
-        )
-        df = df.loc[:,[
-            'ejercicio', 'mes', 'fecha',
-            'fuente', 'cta_cte', 'nro_entrada',
-            'importe', 'glosa', 'es_remanente',
-            'es_invico', 'es_verificado',
-            'clase_reg', 'clase_mod'
-        ]]
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
@@ -5,10 +5,10 @@ Purpose: Web Scrapping SIIF with selenium
 Source: 
 """
 
-__all__ = ['ConnectSIIF', 'ReportCategory']
+__all__ = ['ConnectSIIF', 'ReportCategory', 'SIIF_URL']
 
-import os
 import time
+import types
 from enum import Enum
 from typing import Literal
 
@@ -18,16 +18,16 @@ from selenium.common.exceptions import (
     TimeoutException,
     WebDriverException,
 )
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-from ..utils import PrintTidyverse, RPWUtils
+from ..utils import PrintTidyverse, RPWUtils, downloads
+from ..utils.driver_factory import create_chrome_driver
+
+SIIF_URL = 'https://siif.cgpc.gob.ar/mainSiif/faces/login.jspx'
 
 
 class ReportCategory(Enum):
@@ -38,40 +38,86 @@ class ReportCategory(Enum):
     Clasificadores = "SUB - SISTEMA DE CLASIFICADORES"
 
 
+class _session_method():
+    """Method bound to the instance for scoped sessions (see
+    ConnectSIIF.use_session) and to the class otherwise, so every report
+    shares the process wide default session as they always did.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None):
+        if obj is not None and getattr(obj, '_scoped', False):
+            return types.MethodType(self.func, obj)
+        return types.MethodType(self.func, objtype or type(obj))
+
+
 class ConnectSIIF(RPWUtils):
     username:str =  ''
     password:str = ''
     invisible:bool = False
+    # Login page (point it to a local mock server for offline runs)
+    url:str = SIIF_URL
+    # Record the browser network traffic (see SIIFHttpFetcher)
+    log_requests:bool = False
+    # Persistent Chrome profile (keeps the browser cache between runs)
+    user_data_dir:str = None
     driver:webdriver = None
     wait:WebDriverWait
+    _scoped:bool = False
 
     # --------------------------------------------------
-    def __init__(self, username:str = '', password:str = '', invisible:bool = False) -> None:
+    def __init__(
+        self, username:str = '', password:str = '', invisible:bool = False,
+        scoped:bool = False
+    ) -> None:
+        """:param scoped: keep the browser session in this instance instead
+        of the default session shared by every report (see SIIFSessionPool)
+        """
+        if scoped:
+            self._scoped = True
         if username != '' and password != '':
             self.connect(username, password, invisible)
 
     # --------------------------------------------------
-    @classmethod
+    def use_session(self, session:'ConnectSIIF') -> 'ConnectSIIF':
+        """Run this report on the browser session of session"""
+        self.username = session.username
+        self.password = session.password
+        self.invisible = session.invisible
+        self.url = session.url
+        self.log_requests = session.log_requests
+        self.user_data_dir = session.user_data_dir
+        self.driver = session.driver
+        self.wait = session.wait
+        self._scoped = True
+        return self
+
+    # --------------------------------------------------
+    @_session_method
     def init_driver(cls):
         # Innitial driver options
-        options = Options()
-        options.add_argument("--window-size=1920,1080")
-        if cls.invisible:
-            options.add_argument("--headless")
-        service = Service(ChromeDriverManager().install())
-        cls.driver = webdriver.Chrome(service=service, options=options)
-        cls.driver.maximize_window()
+        capabilities = {}
+        if cls.log_requests:
+            capabilities['goog:loggingPrefs'] = {'performance': 'ALL'}
+        cls.driver = create_chrome_driver(
+            invisible=cls.invisible, user_data_dir=cls.user_data_dir,
+            capabilities=capabilities
+        )
+        if not cls.invisible:
+            cls.driver.maximize_window()
 
         # Setup wait for later
         cls.wait = WebDriverWait(cls.driver, 10)
         
         "Open SIIF webpage"
-        cls.driver.get('https://siif.cgpc.gob.ar/mainSiif/faces/login.jspx')
+        cls.driver.get(cls.url)
         # self.connect()
         # self.go_to_reports()
 
     # --------------------------------------------------
-    @classmethod
+    @_session_method
     def connect(cls, username:str = '', password:str = '', invisible:bool = False) -> None:
         if username != '':
             cls.username = username
@@ -109,7 +155,7 @@ class ConnectSIIF(RPWUtils):
             cls.quit()
 
     # --------------------------------------------------
-    @classmethod
+    @_session_method
     def go_to_reports(cls) -> None:
         """"Go to SIIF's Reportes Module"""
         try:
@@ -150,7 +196,7 @@ class ConnectSIIF(RPWUtils):
         btn_siguiente.click()
 
     # --------------------------------------------------
-    @classmethod
+    @_session_method
     def get_dom_element(cls, value:str, by:Literal['id', 'xpath'] = 'xpath', wait:bool = False) -> WebElement:
 
         op_map = {
@@ -192,35 +238,23 @@ class ConnectSIIF(RPWUtils):
         time.sleep(1)
 
     # --------------------------------------------------
-    def rename_report(self, dir_path:str, old_name:str, new_name:str):
-        old_file_path = os.path.join(dir_path, old_name)
-        new_file_path = os.path.join(dir_path, new_name)
-        while not os.path.exists(old_file_path):
-            time.sleep(1)
-
-        # Si sigue sin funcionar bien, considerar la posibilidad 
-        # de agregar un wait_is_there_html_file()
-
-        if os.path.isfile(old_file_path):
-            time.sleep(2)
-            if os.path.isfile(new_file_path):
-                os.remove(new_file_path)
-                time.sleep(2)
-            os.rename(old_file_path, new_file_path)
-        else:
-            raise ValueError("%s isn't a file!" % old_file_path)
+    def rename_report(
+        self, dir_path:str, old_name:str, new_name:str, timeout:float = None,
+        report:str = None
+    ):
+        """Rename old_name as soon as its download is finished
+        :param report: metrics label of the download (the calling report's
+        _TABLE_NAME), this object's own when None."""
+        downloads.move_download(
+            dir_path, old_name, new_name, timeout=timeout,
+            report=report or getattr(self, '_TABLE_NAME', '') or type(self).__name__
+        )
 
     # --------------------------------------------------
     @classmethod
-    def remove_html_files(cls, dir_path:str):
-        """Remove html files"""
-        time.sleep(5)
-        file_list = os.listdir(dir_path)
-        for f in file_list:
-            if '.htm' in f:
-                file_path = os.path.join(dir_path, f)
-                os.remove(file_path)
-                print(f"File: {file_path} removed")
+    def remove_html_files(cls, dir_path:str, timeout:float = None):
+        """Remove html files once pending downloads are finished"""
+        downloads.remove_html_files(dir_path, timeout=timeout)
 
     # --------------------------------------------------
     def print_tidyverse(self, data = None):
@@ -229,7 +263,7 @@ class ConnectSIIF(RPWUtils):
         print(PrintTidyverse(data))
 
     # --------------------------------------------------
-    @classmethod
+    @_session_method
     def disconnect(cls) -> None:
         cls.driver.switch_to.window(cls.driver.window_handles[0])
         btn_disconnect = cls.get_dom_element(value="//a[@id='pt1:pt_np1:pt_cni1']")
@@ -237,7 +271,20 @@ class ConnectSIIF(RPWUtils):
         # self.quit()
 
     # --------------------------------------------------
-    @classmethod
+    @_session_method
+    def reconnect(cls) -> None:
+        """Log in again on a new browser, back at the reports list (the
+        session expired or a report left the page in an unknown state)"""
+        if cls.driver is not None:
+            try:
+                cls.quit()
+            except Exception as e:
+                print(f"Ocurrió un error: {e}, {type(e)}")
+        cls.connect(invisible=cls.invisible)
+        cls.go_to_reports()
+
+    # --------------------------------------------------
+    @_session_method
     def quit(cls) -> None:
         # Quit
         cls.driver.quit()
\ No newline at end of file
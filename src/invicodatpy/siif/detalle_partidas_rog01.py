@@ -14,6 +14,7 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.outline import OutlineLevel, parse_outline
 from ..utils.rpw_utils import RPWUtils
 
 
@@ -42,17 +43,22 @@ class DetallePartidasRog01(RPWUtils):
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
         df = self.df
-        df = df.iloc[15:,[2, 4, 5, 6, 7, 11]]
-        df.columns = [
+        df = df.iloc[15:]
+        outline = parse_outline(df, [
+            OutlineLevel('grupo', '2'),
+            OutlineLevel('part_parcial', '4'),
+            OutlineLevel('desc_grupo', '5'),
+            OutlineLevel('desc_part_parcial', '7'),
+        ])
+        df = outline.assign(
+            partida = df['6'].replace('', np.nan),
+            desc_partida = df['11'].replace('', np.nan),
+        )
+        df = df.loc[:, [
             'grupo', 'part_parcial', 'desc_grupo', 
             'partida', 'desc_part_parcial', 'desc_partida'
-        ]
-        df.replace('', np.nan, inplace=True)
-        df.grupo.fillna(value=None, method="ffill", inplace=True)
-        df.part_parcial.fillna(value=None, method="ffill", inplace=True)
-        df.desc_grupo.fillna(value=None, method="ffill", inplace=True)
-        df.desc_part_parcial.fillna(value=None, method="ffill", inplace=True)
-        df.dropna(axis=0, how='any', inplace=True)
+        ]]
+        df = df.dropna(axis=0, how='any')
         # df = df >>\
         #     dplyr.select(
         #         f.ejercicio, f.mes, f.fecha,
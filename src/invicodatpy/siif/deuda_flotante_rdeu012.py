@@ -19,9 +19,27 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.periods import (
+    ejercicio_from, mes_from, nro_comprobante_from, parse_date, parse_dates
+)
+from ..utils.sql_utils import sqlite_engine
 from .connect_siif import ConnectSIIF, ReportCategory
 
 
+# --------------------------------------------------
+def fecha_hasta_of(mes:str) -> dt.date:
+    """Snapshot date of mes (yyyymm or yyyy-mm): its last day, or today
+    for the current month"""
+    fecha_hasta = dt.date(year=int(mes[0:4]), month=int(mes[-2:]), day=1)
+    next_month = fecha_hasta.replace(day=28) + timedelta(days=4)
+    fecha_hasta = next_month - timedelta(days=next_month.day)
+    return min(fecha_hasta, dt.date.today())
+
+# --------------------------------------------------
+def file_name_of(mes:str) -> str:
+    return mes[0:4] + mes[-2:] + '-rdeu012.xls'
+
+
 @dataclass
 class DeudaFlotanteRdeu012(ConnectSIIF):
     """
@@ -51,6 +69,9 @@ class DeudaFlotanteRdeu012(ConnectSIIF):
         self, dir_path:str, 
         meses:list = dt.datetime.strftime(dt.datetime.now(), '%Y-%m')
     ):
+        meses = self.periods_to_download(dir_path, meses, file_name_of)
+        if not meses:
+            return
         try:
             self.set_download_path(dir_path)
             self.select_report_module(ReportCategory.Gastos)
@@ -84,14 +105,11 @@ class DeudaFlotanteRdeu012(ConnectSIIF):
                 if int_ejercicio > 2010 and int_ejercicio <= dt.datetime.now().year:
                     # Fecha Hasta
                     input_fecha_hasta.clear()
-                    fecha_hasta = dt.datetime(year=(int_ejercicio), month=int(mes[-2:]), day=1)
-                    next_month = fecha_hasta.replace(day=28) + timedelta(days=4)
-                    fecha_hasta = next_month - timedelta(days=next_month.day)
-                    fecha_hasta = min(fecha_hasta.date(), dt.date.today())
-                    fecha_hasta = dt.datetime.strftime(fecha_hasta, '%d/%m/%Y')
+                    fecha_hasta = dt.datetime.strftime(fecha_hasta_of(mes), '%d/%m/%Y')
                     input_fecha_hasta.send_keys(fecha_hasta)
                     btn_get_reporte.click()
-                    self.rename_report(dir_path, 'rdeu012.xls', mes[0:4] + mes[-2:] + '-rdeu012.xls')
+                    self.rename_report(dir_path, 'rdeu012.xls', file_name_of(mes))
+                    self.mark_downloaded(dir_path, mes, file_name_of(mes))
                     self.download_file_procedure()
             time.sleep(1)
 
@@ -102,6 +120,76 @@ class DeudaFlotanteRdeu012(ConnectSIIF):
             print(f"Ocurrió un error: {e}, {type(e)}")
             self.disconnect()
 
+    # --------------------------------------------------
+    def loaded_snapshots(self, sql_path:str) -> dict:
+        """{mes_hasta ('mm/yyyy'): fecha_hasta} of the snapshots in sql_path"""
+        if not os.path.isfile(sql_path):
+            return {}
+        engine = sqlite_engine(sql_path)
+        try:
+            df = pd.read_sql_query(
+                f'SELECT mes_hasta, MAX(fecha_hasta) AS fecha_hasta '
+                f'FROM {self._TABLE_NAME} GROUP BY mes_hasta', engine
+            )
+        except Exception:
+            # No table yet
+            return {}
+        finally:
+            engine.dispose()
+        return dict(zip(
+            df['mes_hasta'], pd.to_datetime(df['fecha_hasta']).dt.date
+        ))
+
+    # --------------------------------------------------
+    def stale_meses(self, sql_path:str, meses:list = None) -> list:
+        """Meses (yyyy-mm) whose snapshot is missing in sql_path or was
+        taken before its fecha_hasta (the current month, a closing rerun).
+        Default meses: every month of the current ejercicio."""
+        if meses is None:
+            today = dt.date.today()
+            meses = [f'{today.year}-{month:02}' for month in range(1, today.month + 1)]
+        elif not isinstance(meses, list):
+            meses = [meses]
+        loaded = self.loaded_snapshots(sql_path)
+        return [
+            mes for mes in meses
+            if loaded.get(mes[-2:] + '/' + mes[0:4]) is None
+            or loaded[mes[-2:] + '/' + mes[0:4]] < fecha_hasta_of(mes)
+        ]
+
+    # --------------------------------------------------
+    def refresh(
+        self, dir_path:str, sql_path:str, meses:list = None,
+        download:bool = True
+    ) -> list:
+        """Incremental update: download (needs a SIIF session) and load
+        only the stale snapshots; every other mes_hasta stays untouched.
+        Returns the refreshed meses."""
+        meses = self.stale_meses(sql_path, meses)
+        if not meses:
+            print(f"{self._TABLE_NAME}: every snapshot is up to date")
+            return []
+        if download:
+            self.download_report(dir_path, meses=meses)
+        dfs, refreshed = [], []
+        for mes in meses:
+            xls_path = os.path.join(dir_path, file_name_of(mes))
+            if not os.path.isfile(xls_path):
+                print(f"{self._TABLE_NAME}: {file_name_of(mes)} not found")
+                continue
+            self.df = None
+            df = self.from_external_report(xls_path)
+            if df is not None:
+                dfs.append(df)
+                refreshed.append(mes)
+        if dfs:
+            # Deletes (by _FILTER_COL) only the refreshed mes_hasta
+            self.df = pd.concat(dfs, ignore_index=True)
+            self.to_sql(sql_path)
+            self.engine.dispose()
+        print(f"{self._TABLE_NAME}: {refreshed} refreshed")
+        return refreshed
+
     # --------------------------------------------------
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SIIF's report"""
@@ -121,16 +209,11 @@ class DeudaFlotanteRdeu012(ConnectSIIF):
         df = self.df
         df['6'] = df['6'].replace(to_replace='TODOS', value='') 
         df.loc[df['6'] != '27', 'fuente'] = df['6']
-        df['fecha_desde'] = df.iloc[15,2].split(' ')[2]
-        df['fecha_hasta'] = df.iloc[15,2].split(' ')[6]
-        df['fecha_desde'] = pd.to_datetime(
-            df['fecha_desde'], format='%d/%m/%Y'
-        )
-        df['fecha_hasta'] = pd.to_datetime(
-            df['fecha_hasta'], format='%d/%m/%Y'
-        )
-        df['mes_hasta'] = (df['fecha_hasta'].dt.month.astype(str).str.zfill(2) +
-                            '/'+ df['fecha_hasta'].dt.year.astype(str))
+        periodo = df.iloc[15,2].split(' ')
+        fecha_hasta = parse_date(periodo[6], format='%d/%m/%Y')
+        df['fecha_desde'] = parse_date(periodo[2], format='%d/%m/%Y')
+        df['fecha_hasta'] = fecha_hasta
+        df['mes_hasta'] = fecha_hasta.strftime('%m/%Y')
         df = df.replace(to_replace='', value=None)
         df = df.tail(-13)
         df['fuente'] = df['fuente'].fillna(method='ffill')
@@ -153,39 +236,24 @@ class DeudaFlotanteRdeu012(ConnectSIIF):
         to_numeric = ['importe', 'saldo']
         df[to_numeric] = df[to_numeric].apply(pd.to_numeric).astype(np.float64)
 
-        df['fecha_aprobado'] = pd.to_datetime(
+        df['fecha_aprobado'] = parse_dates(
             df['fecha_aprobado'], format='%Y-%m-%d'
         )
-        df['mes_aprobado'] = df['fecha_aprobado'].dt.strftime('%m/%Y')
-
-        df['fecha'] = np.where(
-            df['fecha_aprobado'] > df['fecha_hasta'],
-            df['fecha_hasta'], 
-            df['fecha_aprobado']
+        df['fecha'] = df['fecha_aprobado'].mask(
+            df['fecha_aprobado'] > fecha_hasta, fecha_hasta
         )
-        # df = df >> \
-        #     dplyr.mutate(
-        #         fecha = dplyr.if_else(f.fecha_aprobado > f.fecha_hasta,
-        #                                 f.fecha_hasta, f.fecha_aprobado)
-        #     )
 
         # CYO aprobados en enero correspodientes al ejercicio anterior
-        df['fecha'] = pd.to_datetime(df['fecha'], errors='coerce') 
-        df['fecha'] = df['fecha'].dt.strftime('%Y-%m-%d')
-        condition = ((df['mes_aprobado'].str[0:2] == '01') & 
+        condition = ((df['fecha_aprobado'].dt.month == 1) & 
                     (df['nro_entrada'].astype(int) > 1500))
-        df.loc[condition, 'fecha'] = (
-            (pd.to_numeric(df['mes_hasta'].loc[condition].str[-4:])).astype(str) + "-12-31")
-
-        df['fecha'] = pd.to_datetime(
-            df['fecha'],  format='%Y-%m-%d', errors='coerce'
-        ) 
-        
-        df['ejercicio'] = df['fecha'].dt.year.astype(str)
-        df['mes'] = df['fecha'].dt.strftime('%m/%Y')
-
-        df['nro_comprobante'] = (
-            df['nro_entrada'].str.zfill(5) + '/' +  df['mes'].str[-2:]
+        df['fecha'] = df['fecha'].mask(
+            condition, fecha_hasta + pd.offsets.YearEnd(0)
+        )
+
+        df['ejercicio'] = ejercicio_from(df['fecha'])
+        df['mes'] = mes_from(df['fecha'])
+        df['nro_comprobante'] = nro_comprobante_from(
+            df['nro_entrada'], df['mes']
         )
         df = df.loc[:, [
             'ejercicio', 'mes', 'fecha', 'mes_hasta', 'fuente',
@@ -237,6 +305,12 @@ def get_args():
         type=str,
         help = "Año y mes en formato yyyymm")
 
+    parser.add_argument(
+        '-i', '--incremental',
+        action = 'store_true',
+        help = "Refresh only the missing or stale snapshots of the "
+               "current ejercicio in siif.sqlite")
+
     return parser.parse_args()
 
 # --------------------------------------------------
@@ -262,12 +336,20 @@ def main():
                 json_file.close()
         siif = DeudaFlotanteRdeu012()
         siif.go_to_reports()
-        siif.download_report(
-            dir_path, meses=args.mes
-        )
+        if args.incremental:
+            siif.refresh(dir_path, dir_path + '/siif.sqlite')
+        else:
+            siif.download_report(
+                dir_path, meses=args.mes
+            )
         siif.disconnect()
     else:
         siif = DeudaFlotanteRdeu012()
+        if args.incremental:
+            siif.refresh(dir_path, dir_path + '/siif.sqlite', download=False)
+
+    if args.incremental:
+        return
 
     if args.file != '':
         filename = args.file
@@ -285,4 +367,5 @@ def main():
 if __name__ == '__main__':
     main()
     # From invicodatpy/src
-    # python -m invicodatpy.siif.deuda_flotante_rdeu012 --no-download
\ No newline at end of file
+    # python -m invicodatpy.siif.deuda_flotante_rdeu012 --no-download
+    # python -m invicodatpy.siif.deuda_flotante_rdeu012 --incremental
\ No newline at end of file
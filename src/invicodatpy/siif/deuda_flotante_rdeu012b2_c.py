@@ -13,6 +13,8 @@ import os
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.money import parse_money
+from ..utils.periods import parse_date
 from ..utils.rpw_utils import RPWUtils
 
 
@@ -56,16 +58,11 @@ class DeudaFlotanteRdeu012b2C(RPWUtils):
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
         df = self.df
-        df['fecha_desde'] = df['0'].iloc[6][6:16]
-        df['fecha_desde'] = pd.to_datetime(
-            df['fecha_desde'], format='%d/%m/%Y'
-        ) 
-        df['fecha_hasta'] = df['0'].iloc[6][-10:]
-        df['fecha_hasta'] = pd.to_datetime(
-            df['fecha_hasta'], format='%d/%m/%Y'
-        )
-        df['ejercicio'] = df['fecha_hasta'].dt.year.astype(str)
-        df['mes_hasta'] = df['fecha_hasta'].dt.strftime('%m/%Y')
+        fecha_hasta = parse_date(df['0'].iloc[6][-10:], format='%d/%m/%Y')
+        df['fecha_desde'] = parse_date(df['0'].iloc[6][6:16], format='%d/%m/%Y')
+        df['fecha_hasta'] = fecha_hasta
+        df['ejercicio'] = str(fecha_hasta.year)
+        df['mes_hasta'] = fecha_hasta.strftime('%m/%Y')
         df['entidad'] = df.loc[df['0'] == 'Entidad']['3']
         df["entidad"].fillna(method='ffill', inplace = True)
         df = df.iloc[9:]
@@ -85,12 +82,9 @@ class DeudaFlotanteRdeu012b2C(RPWUtils):
             '7':'cta_cte',
             '8':'glosa',
         }, inplace=True)
-        df['importe'] = df['importe'].str.replace('.', '', regex=False)
-        df['importe'] = df['importe'].str.replace(',', '.', regex=False)
-        df['importe'] = df['importe'].astype(float)
-        df['saldo'] = df['saldo'].str.replace('.', '', regex=False)
-        df['saldo'] = df['saldo'].str.replace(',', '.', regex=False)
-        df['saldo'] = df['saldo'].astype(float)
+        df[['importe', 'saldo']] = parse_money(
+            df[['importe', 'saldo']], decimal=','
+        )
         first_cols = [
             'ejercicio', 'mes_hasta', 'entidad', 'ejercicio_deuda',
             'fuente', 'nro_entrada', 'nro_origen', 'importe', 'saldo'            
@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.outline import OutlineLevel, parse_outline
 from .connect_siif import ConnectSIIF, ReportCategory
 
 
@@ -208,61 +209,29 @@ class FormGtoRfpP605b(ConnectSIIF):
         df['ejercicio'] = df.iloc[13,1][-4:]
         df = df.drop(range(22))
 
-        df['programa'] = np.where(
-            df['3'].str[0:8] == 'Programa', 
-            df['3'].str[22:], None
+        outline = parse_outline(df, [
+            OutlineLevel('programa', '3', prefix='Programa', start=22),
+            OutlineLevel('subprograma', '3', prefix='SubPrograma', start=19),
+            OutlineLevel('proyecto', '3', prefix='Proyecto', start=24),
+            OutlineLevel('actividad', '3', prefix='Actividad', start=20),
+            OutlineLevel('grupo', '10', stop=3),
+        ])
+        partida = df['9']
+        keep = partida.str.len() == 3
+        df = outline[keep].assign(
+            ejercicio = df['ejercicio'][keep],
+            partida = partida[keep],
+            fuente_11 = df['22'][keep],
+            fuente_10 = df['19'][keep],
         )
-        df['programa'] = df['programa'].fillna(method='ffill')
-        df['prog'] = df['programa'].str[:2]
-        df['prog'] = df['prog'].str.strip()
-        df['desc_prog'] = df['programa'].str[3:]
-        df['desc_prog'] = df['desc_prog'].str.strip()
-        df['subprograma'] = np.where(
-            df['3'].str[0:11] == 'SubPrograma', 
-            df['3'].str[19:], None
-        )
-        df['proyecto'] = np.where(
-            df['3'].str[0:8] == 'Proyecto', 
-            df['3'].str[24:], None
-        )
-        df['actividad'] = np.where(
-            df['3'].str[0:9] == 'Actividad', 
-            df['3'].str[20:], None
-        )
-        df['grupo'] = np.where(
-            df['10'] != '', 
-            df['10'].str[0:3], None
-        )
-        df['grupo'] = df['grupo'].fillna(method='ffill')
-        df['partida'] = np.where(
-            df['9'] != '', 
-            df['9'], None
-        )
-        df['fuente_11'] = df['22']
-        df['fuente_10'] = df['19']
-        df = df.loc[:,[
-            'ejercicio', 'prog', 'desc_prog', 'subprograma', 'proyecto',
-            'actividad', 'grupo', 'partida', 'fuente_11', 'fuente_10',
-        ]]
-        df = df.dropna(subset=['subprograma','proyecto','actividad','partida'], how='all')
-        df['subprograma'] = df['subprograma'].fillna(method='ffill')
-        df = df.dropna(subset=['proyecto','actividad','partida'], how='all')
-        df['proyecto'] = df['proyecto'].fillna(method='ffill')
-        df = df.dropna(subset=['actividad','partida'], how='all')
-        df['actividad'] = df['actividad'].fillna(method='ffill')
-        df = df[df['partida'].str.len() == 3]
-        df['sub'] = df['subprograma'].str[:2]
-        df['sub'] = df['sub'].str.strip()
-        df['desc_subprog'] = df['subprograma'].str[3:]
-        df['desc_subprog'] = df['desc_subprog'].str.strip()
-        df['proy'] = df['proyecto'].str[:2]
-        df['proy'] = df['proy'].str.strip()
-        df['desc_proy'] = df['proyecto'].str[3:]
-        df['desc_proy'] = df['desc_proy'].str.strip()
-        df['act'] = df['actividad'].str[:2]
-        df['act'] = df['act'].str.strip()
-        df['desc_act'] = df['actividad'].str[3:]
-        df['desc_act'] = df['desc_act'].str.strip()
+        for level, code, desc in [
+            ('programa', 'prog', 'desc_prog'),
+            ('subprograma', 'sub', 'desc_subprog'),
+            ('proyecto', 'proy', 'desc_proy'),
+            ('actividad', 'act', 'desc_act'),
+        ]:
+            df[code] = df[level].str[:2].str.strip().str.zfill(2)
+            df[desc] = df[level].str[3:].str.strip()
         df['fuente_10'] = df['fuente_10'].astype(float)
         df['fuente_11'] = df['fuente_11'].astype(float)
         df['fuente'] = np.select(
@@ -273,10 +242,6 @@ class FormGtoRfpP605b(ConnectSIIF):
             ['10', '11']
         )
         df['formulado'] = df['fuente_10'] + df['fuente_11']
-        df['prog'] = df['prog'].str.zfill(2)
-        df['sub'] = df['sub'].str.zfill(2)
-        df['proy'] = df['proy'].str.zfill(2)
-        df['act'] = df['act'].str.zfill(2)
         df['estructura'] = (
             df['prog'] + '-' + df['sub'] + '-' + 
             df['proy'] + '-' + df['act'] + '-' +
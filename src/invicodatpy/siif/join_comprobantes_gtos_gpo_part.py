@@ -21,6 +21,11 @@ from .detalle_partidas_rog01 import DetallePartidasRog01
 class JoinComprobantesGtosGpoPart():
     """Join gto_rpa03g (gtos_gpo_part) with rcg01_uejp (gtos)"""
     df:pd.DataFrame = None
+    # Reports whose tables from_sql reads
+    _INPUTS = (
+        ComprobantesGtosGpoPartGtoRpa03g, ComprobantesGtosRcg01Uejp,
+        DetallePartidasRog01
+    )
     
     # --------------------------------------------------
     def from_external_report(
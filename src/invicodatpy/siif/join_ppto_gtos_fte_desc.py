@@ -20,6 +20,8 @@ from .ppto_gtos_fte_rf602 import PptoGtosFteRf602
 class JoinPptoGtosFteDesc():
     """Join rf602 (ppto_gtos_fte) with rf610 (ppto_gtos_desc)"""
     df:pd.DataFrame = None
+    # Reports whose tables from_sql reads
+    _INPUTS = (PptoGtosFteRf602, PptoGtosDescRf610)
     
     # --------------------------------------------------
     def from_external_report(
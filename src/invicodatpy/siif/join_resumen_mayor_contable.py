@@ -26,6 +26,11 @@ class JoinResumenMayorContable(ConnectSIIF):
     """Join rvicon03 (resumen_contable) with rcocc31 (mayor_contable)"""
 
     df: pd.DataFrame = field(init=False, repr=False, default=None)
+    # Reports whose tables from_sql reads
+    _INPUTS: tuple = field(
+        init=False, repr=False,
+        default=(ResumenContableCtaRvicon03, MayorContableRcocc31)
+    )
 
     # --------------------------------------------------
     def download_and_unite_reports(
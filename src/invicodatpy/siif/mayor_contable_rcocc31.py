@@ -17,7 +17,11 @@ from dataclasses import dataclass, field
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.job_queue import JobQueue
+from ..utils.periods import ejercicio_from, mes_from, parse_date, parse_dates
 from .connect_siif import ConnectSIIF, ReportCategory
+from .resumen_contable_cta_rvicon03 import ResumenContableCtaRvicon03
+from .siif_session_pool import SIIFSessionPool
 
 
 @dataclass
@@ -43,13 +47,19 @@ class MayorContableRcocc31(ConnectSIIF):
     _SQL_MODEL:SIIFModel = field(
         init=False, repr=False, default=SIIFModel
     )
+    # Accounts to download come from rvicon03
+    _INPUTS:tuple = field(
+        init=False, repr=False, default=(ResumenContableCtaRvicon03,)
+    )
 
     # --------------------------------------------------
     def download_report(
         self, dir_path:str, 
         ejercicios:list = str(dt.datetime.now().year),
-        ctas_contables:list = '1112-2-6'
+        ctas_contables:list = '1112-2-6', raise_errors:bool = False
     ):
+        """:param raise_errors: raise instead of printing the error and
+        disconnecting (the caller retries on the same session)"""
         try:
             self.set_download_path(dir_path)
             self.select_report_module(ReportCategory.Contabilidad)
@@ -123,7 +133,7 @@ class MayorContableRcocc31(ConnectSIIF):
                         # Download and rename xls
                         self.rename_report(
                             dir_path, 'rcocc31.xls', 
-                            ejercicio + '-rcocc31 ('+ cta_contable +').xls'
+                            self.download_file_names(ejercicio, cta_contable)[0]
                         )
                         self.download_file_procedure()
             time.sleep(1)
@@ -132,9 +142,39 @@ class MayorContableRcocc31(ConnectSIIF):
             self.go_back_to_reports_list()
 
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Ocurrió un error: {e}, {type(e)}")
             self.disconnect()
 
+    # --------------------------------------------------
+    @classmethod
+    def download_params(cls, ejercicio:str, sql_path:str) -> dict:
+        """Every rvicon03 cta_contable of ejercicio (download_report's
+        default account when rvicon03 is not loaded yet)"""
+        if sql_path is None or not os.path.isfile(sql_path):
+            return {}
+        df = ResumenContableCtaRvicon03().from_sql(sql_path)
+        ctas_contables = df.loc[
+            df['ejercicio'] == ejercicio, 'cta_contable'
+        ].unique().tolist()
+        return {'ctas_contables': ctas_contables} if ctas_contables else {}
+
+    # --------------------------------------------------
+    @staticmethod
+    def download_file_names(
+        ejercicios:list, ctas_contables:list, **kwargs
+    ) -> list[str]:
+        """Files download_report leaves for ejercicios x ctas_contables"""
+        if not isinstance(ejercicios, list):
+            ejercicios = [ejercicios]
+        if not isinstance(ctas_contables, list):
+            ctas_contables = [ctas_contables]
+        return [
+            ejercicio + '-rcocc31 (' + cta_contable + ').xls'
+            for ejercicio in ejercicios for cta_contable in ctas_contables
+        ]
+
     # --------------------------------------------------
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SIIF's report"""
@@ -152,7 +192,8 @@ class MayorContableRcocc31(ConnectSIIF):
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
         df = self.df
-        df['ejercicio'] = df.iloc[3,1][-4:]
+        ejercicio = df.iloc[3,1][-4:]
+        df['ejercicio'] = ejercicio
         df['cta_contable'] = (df.iloc[10,6] + '-' + 
         df.iloc[10,11] + '-' + df.iloc[10,12])
         df = df.replace(to_replace='', value=None)
@@ -169,15 +210,15 @@ class MayorContableRcocc31(ConnectSIIF):
             '29': 'saldo',
             }, axis='columns')
         df = df.dropna(subset=['nro_entrada'])
-        df['fecha_aprobado'] = pd.to_datetime(
+        df['fecha_aprobado'] = parse_dates(
             df['fecha_aprobado'], format='%Y-%m-%d'
         )
-        df['fecha'] = df['fecha_aprobado']
-        # df.loc[df['fecha_aprobado'].dt.year.astype(str) == df['ejercicio'], 'fecha'] = df['fecha_aprobado']
-        df.loc[df['fecha_aprobado'].dt.year.astype(str) != df['ejercicio'], 'fecha'] = pd.to_datetime(
-            df['ejercicio'] + '-12-31', format='%Y-%m-%d'
+        # Movements approved out of the ejercicio are closed on its last day
+        df['fecha'] = df['fecha_aprobado'].mask(
+            ejercicio_from(df['fecha_aprobado']) != ejercicio,
+            parse_date(ejercicio + '-12-31', format='%Y-%m-%d')
         )
-        df['mes'] = df['fecha'].dt.month.astype(str).str.zfill(2) + '/' + df['ejercicio']
+        df['mes'] = mes_from(df['fecha'], df['ejercicio'])
 
         df = df.loc[
             :, ['ejercicio', 'mes', 'fecha', 'fecha_aprobado', 
@@ -248,6 +289,21 @@ def get_args():
         type=str,
         help = "Cuentas Contables to download from SIIF")
 
+    parser.add_argument(
+        '-s', '--sessions', 
+        metavar = 'Sessions',
+        default = 1,
+        type=int,
+        help = "Concurrent SIIF sessions used to download the accounts")
+
+    parser.add_argument(
+        '-q', '--queue', 
+        metavar = 'Job queue',
+        default = '',
+        type=str,
+        help = "SQLite job queue file. Downloads are retried and a "
+               "stopped sweep resumes where it was left")
+
     return parser.parse_args()
 
 # --------------------------------------------------
@@ -259,7 +315,26 @@ def main():
             inspect.getfile(
                 inspect.currentframe())))
 
-    if args.download:
+    if args.download and args.sessions > 1:
+        username, password = args.username, args.password
+        json_path = dir_path + '/siif_credentials.json'
+        if (username == '' or password == '') and os.path.isfile(json_path):
+            with open(json_path) as json_file:
+                data_json = json.load(json_file)
+                username, password = data_json['username'], data_json['password']
+        with SIIFSessionPool(username, password, size=args.sessions) as pool:
+            # One job per account, spread by the pool's queue
+            failed = pool.download_reports(
+                MayorContableRcocc31, dir_path, [
+                    {'ejercicios':args.ejercicio, 'ctas_contables':cta}
+                    for cta in args.cuenta
+                ],
+                expected=lambda job: MayorContableRcocc31.download_file_names(**job)
+            )
+        for job in failed:
+            print(f"No se pudo descargar {job}")
+        siif = MayorContableRcocc31()
+    elif args.download:
         json_path = dir_path + '/siif_credentials.json'
         if args.username != '' and args.password != '':
             ConnectSIIF(args.username, args.password)
@@ -273,10 +348,38 @@ def main():
                 json_file.close()
         siif = MayorContableRcocc31()
         siif.go_to_reports()
-        siif.download_report(
-            dir_path, ejercicios=args.ejercicio, 
-            ctas_contables=args.cuenta
-        )
+        if args.queue != '':
+            job_queue = JobQueue(dir_path + '/' + args.queue)
+            job_queue.add_many('rcocc31', [
+                {'ejercicio':args.ejercicio, 'cta_contable':cta_contable}
+                for cta_contable in args.cuenta
+            ])
+
+            def download_job(ejercicio, cta_contable):
+                try:
+                    siif.download_report(
+                        dir_path, ejercicios=ejercicio, 
+                        ctas_contables=cta_contable, raise_errors=True
+                    )
+                except Exception:
+                    # Log in again so the next attempt finds a working page
+                    siif.reconnect()
+                    raise
+
+            print(job_queue.run(
+                handlers={'rcocc31': download_job},
+                is_done={'rcocc31': lambda ejercicio, cta_contable: 
+                    os.path.isfile(
+                        dir_path + '/' + ejercicio + 
+                        '-rcocc31 (' + cta_contable + ').xls'
+                    )},
+            ))
+            job_queue.close()
+        else:
+            siif.download_report(
+                dir_path, ejercicios=args.ejercicio, 
+                ctas_contables=args.cuenta
+            )
         siif.disconnect()
     else:
         siif = MayorContableRcocc31()
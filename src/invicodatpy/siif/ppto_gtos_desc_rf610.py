@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.outline import OutlineLevel, parse_outline
 from .connect_siif import ConnectSIIF, ReportCategory
 
 @dataclass
@@ -91,33 +92,24 @@ class PptoGtosDescRf610(ConnectSIIF):
         """"Transform read xls file"""
         df = self.df.replace(to_replace='', value=None)
         df['ejercicio'] = df.iloc[9,33][-4:]
-        df = df.rename(columns={
-            '5':'programa',
-            '9':'subprograma',
-            '14':'proyecto',
-            '17':'actividad',
-            '20':'grupo',
-            '21':'partida',
-            '24':'desc_part',
-            '38':'credito_original',
-            '44':'credito_vigente',
-            '49':'comprometido',
-            '55':'ordenado',
-            '60':'saldo'
-        })
         df = df.tail(-30)
-        df = df.loc[:, [
-            'ejercicio', 'programa', 'subprograma', 'proyecto', 
-            'actividad', 'grupo', 'partida', 'desc_part', 
-            'credito_original', 'credito_vigente', 'comprometido', 'ordenado', 'saldo'
-        ]]
-        df['programa'] = df['programa'].fillna(method='ffill')
-        df['subprograma'] = df['subprograma'].fillna(method='ffill')
-        df['proyecto'] = df['proyecto'].fillna(method='ffill')
-        df['actividad'] = df['actividad'].fillna(method='ffill')
-        df['grupo'] = df['grupo'].fillna(method='ffill')
-        df['partida'] = df['partida'].fillna(method='ffill')
-        df['desc_part'] = df['desc_part'].fillna(method='ffill')
+        outline = parse_outline(df, [
+            OutlineLevel('programa', '5'),
+            OutlineLevel('subprograma', '9'),
+            OutlineLevel('proyecto', '14'),
+            OutlineLevel('actividad', '17'),
+            OutlineLevel('grupo', '20'),
+            OutlineLevel('partida', '21'),
+            OutlineLevel('desc_part', '24'),
+        ])
+        df = outline.assign(
+            ejercicio = df['ejercicio'],
+            credito_original = df['38'],
+            credito_vigente = df['44'],
+            comprometido = df['49'],
+            ordenado = df['55'],
+            saldo = df['60'],
+        )
         df = df.dropna(subset=['credito_original'])
         df[["programa", "desc_prog"]] = df["programa"].str.split(n=1, expand=True)
         df[["subprograma", "desc_subprog"]] = df["subprograma"].str.split(n=1, expand=True)
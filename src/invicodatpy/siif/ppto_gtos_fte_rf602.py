@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.report_spec import Cell, ReportSpec
 from .connect_siif import ConnectSIIF, ReportCategory
 
 
@@ -44,11 +45,61 @@ class PptoGtosFteRf602(ConnectSIIF):
     _SQL_MODEL:SIIFModel = field(
         init=False, repr=False, default=SIIFModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(5, 2, stop=-5),
+            header = {'ejercicio': Cell(5, 2, start=-4)},
+            data_start = 16,
+            columns = {
+                '2':'programa', 
+                '3':'subprograma', 
+                '6':'proyecto', 
+                '7':'actividad', 
+                '8':'partida', 
+                '9':'fuente', 
+                '10':'org', 
+                '13':'credito_original', 
+                '14':'credito_vigente', 
+                '15':'comprometido', 
+                '16':'ordenado', 
+                '18':'saldo', 
+                '20':'pendiente'
+            },
+            required = ('programa',),
+            numeric = (
+                'credito_original', 'credito_vigente', 
+                'comprometido', 'ordenado', 'saldo', 'pendiente'
+            ),
+            zfill = {
+                'programa': 2, 'subprograma': 2, 'proyecto': 2, 'actividad': 2
+            },
+            derived = {
+                'grupo': lambda df: df['partida'].str[0] + '00',
+                'estructura': lambda df: (
+                    df['programa'] + '-' + df['subprograma'] + '-' + 
+                    df['proyecto'] + '-' + df['actividad'] + '-' + df['partida']
+                ),
+            },
+            order = (
+                'ejercicio', 'estructura', 'fuente', 
+                'programa', 'subprograma', 'proyecto', 
+                'actividad', 'grupo', 'partida',
+                'org', 'credito_original', 'credito_vigente',
+                'comprometido', 'ordenado', 'saldo', 'pendiente'
+            ),
+        )
+    )
 
     # --------------------------------------------------
     def download_report(
         self, dir_path:str, ejercicios:list = str(dt.datetime.now().year)
     ):
+        ejercicios = self.periods_to_download(
+            dir_path, ejercicios, lambda ejercicio: ejercicio + '-rf602.xls'
+        )
+        if not ejercicios:
+            return
         try:
             self.set_download_path(dir_path)
             self.select_report_module(ReportCategory.Gastos)
@@ -76,6 +127,7 @@ class PptoGtosFteRf602(ConnectSIIF):
 
                 # Download and rename xls
                 self.rename_report(dir_path, 'rf602.xls', ejercicio + '-rf602.xls')
+                self.mark_downloaded(dir_path, ejercicio, ejercicio + '-rf602.xls')
                 self.download_file_procedure()
             time.sleep(1)
 
@@ -90,7 +142,7 @@ class PptoGtosFteRf602(ConnectSIIF):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SIIF's report"""
         df = self.read_xls(xls_path)
-        read_title = df['2'].iloc[5][:-5] 
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -102,53 +154,7 @@ class PptoGtosFteRf602(ConnectSIIF):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[5,2][-4:]
-        df = df.tail(-16)
-        df = df.loc[:,[
-            'ejercicio', '2', '3', '6', '7', '8', 
-            '9', '10', '13', '14', '15', '16', '18', '20'
-        ]]
-        df = df.replace(to_replace='', value=None)
-        df = df.dropna(subset=['2'])
-        df = df.rename(columns={
-            '2':'programa', 
-            '3':'subprograma', 
-            '6':'proyecto', 
-            '7':'actividad', 
-            '8':'partida', 
-            '9':'fuente', 
-            '10':'org', 
-            '13':'credito_original', 
-            '14':'credito_vigente', 
-            '15':'comprometido', 
-            '16':'ordenado', 
-            '18':'saldo', 
-            '20':'pendiente'
-        })
-        df['programa'] = df['programa'].str.zfill(2)
-        df['subprograma'] = df['subprograma'].str.zfill(2)
-        df['proyecto'] = df['proyecto'].str.zfill(2)
-        df['actividad'] = df['actividad'].str.zfill(2)
-        df['grupo'] = df['partida'].str[0] + '00'
-        df['estructura'] = (
-            df['programa'] + '-' + df['subprograma'] + '-' + df['proyecto'] + '-' + 
-            df['actividad'] + '-' + df['partida']
-        )
-        df = df.loc[:,[
-            'ejercicio', 'estructura', 'fuente', 
-            'programa', 'subprograma', 'proyecto', 
-            'actividad', 'grupo', 'partida',
-            'org', 'credito_original', 'credito_vigente',
-            'comprometido', 'ordenado', 'saldo', 'pendiente'
-        ]]
-        to_numeric_cols = [
-            'credito_original', 'credito_vigente', 
-            'comprometido', 'ordenado', 'saldo', 'pendiente'
-        ]
-        df[to_numeric_cols] = df[to_numeric_cols].apply(pd.to_numeric).astype(np.float64) 
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
@@ -125,10 +125,14 @@ class ResumenContableCtaRvicon03(ConnectSIIF):
         df['nivel_desc'] = df['nivel_desc'].ffill()
         df = df.dropna(subset=['saldo_inicial'])
 
-        df['cta_contable'] = df['nivel_descripcion'].str.split('-', expand=True).iloc[:,:3].agg('-'.join, axis=1)
-        df['cta_contable_desc'] = df['nivel_descripcion'].apply(
-            lambda x: '-'.join(filter(None, x.split('-')[3:])) if x is not None else None
+        # First three '-' separated tokens are the account code, the rest
+        # (without empty tokens) is its description
+        cta_contable = df['nivel_descripcion'].str.extract(
+            r'^([^-]*-[^-]*-[^-]*)(?:-(.*))?$', expand=True
         )
+        df['cta_contable'] = cta_contable[0]
+        df['cta_contable_desc'] = cta_contable[1].fillna('')\
+            .str.replace(r'-{2,}', '-', regex=True).str.strip('-')
         df = df.loc[:,[
             'ejercicio', 'nivel', 'nivel_desc', 'cta_contable', 'cta_contable_desc',
             'saldo_inicial', 'debe', 'haber', 'ajuste_debe', 'ajuste_haber', 
@@ -139,7 +143,7 @@ class ResumenContableCtaRvicon03(ConnectSIIF):
             'fondos_debe', 'fondos_haber', 'saldo_final'
         ]
         df[to_numeric_cols] = df[to_numeric_cols].apply(pd.to_numeric)
-        df = df[~df[to_numeric_cols].apply(lambda x: (x == 0).all(), axis=1)]
+        df = df[(df[to_numeric_cols].to_numpy() != 0).any(axis=1)]
 
         self.df = df
         return self.df
@@ -18,6 +18,8 @@ import numpy as np
 import pandas as pd
 
 from ..models.siif_model import SIIFModel
+from ..utils.periods import mes_from, nro_comprobante_from
+from ..utils.report_spec import Cell, ReportSpec
 from .connect_siif import ConnectSIIF, ReportCategory
 
 
@@ -44,6 +46,38 @@ class ResumenFdosRfondo07tp(ConnectSIIF):
     _SQL_MODEL:SIIFModel = field(
         init=False, repr=False, default=SIIFModel
     )
+    _SPEC:ReportSpec = field(
+        init=False, repr=False,
+        default=ReportSpec(
+            title = Cell(4, 1, stop=-5),
+            header = {
+                'ejercicio': Cell(4, 1, start=-4),
+                'tipo_comprobante': lambda df: df.iat[11, 2].split(':')[2].strip(),
+            },
+            data_start = 19,
+            columns = {
+                '3': 'nro_fondo',
+                '6': 'glosa',
+                '10': 'fecha',
+                '12': 'ingresos',
+                '15': 'egresos',
+                '18': 'saldo',
+            },
+            required = ('fecha',),
+            numeric = ('ingresos', 'egresos', 'saldo'),
+            dates = {'fecha': '%Y-%m-%d'},
+            derived = {
+                'mes': lambda df: mes_from(df['fecha'], df['ejercicio']),
+                'nro_comprobante': lambda df: nro_comprobante_from(
+                    df['nro_fondo'], df['mes']
+                ),
+            },
+            order = (
+                'ejercicio', 'mes', 'fecha', 'tipo_comprobante', 'nro_comprobante',
+                'nro_fondo', 'glosa', 'ingresos', 'egresos', 'saldo'
+            ),
+        )
+    )
 
 
     # --------------------------------------------------
@@ -124,7 +158,7 @@ class ResumenFdosRfondo07tp(ConnectSIIF):
     def from_external_report(self, xls_path:str) -> pd.DataFrame:
         """"Read from xls SIIF's report"""
         df = self.read_xls(xls_path)
-        read_title = df['1'].iloc[4][:-5]
+        read_title = self._SPEC.read_title(df)
         if read_title == self._REPORT_TITLE:
             self.df = df
             self.transform_df()
@@ -136,56 +170,7 @@ class ResumenFdosRfondo07tp(ConnectSIIF):
     # --------------------------------------------------
     def transform_df(self) -> pd.DataFrame:
         """"Transform read xls file"""
-        df = self.df
-        df['ejercicio'] = df.iloc[4,1][-4:]
-        df['tipo_comprobante'] = df.iloc[11,2].split(':')[2].strip()
-        # df['tipo_comprobante'] = base.trimws(
-        #     df.iloc[11,2].split(':')[2]
-        # )
-        df = df.replace(to_replace='', value=None)
-        df = df.tail(-19)
-        df = df.dropna(subset=['10'])
-        df = df.rename(columns={
-            '3': 'nro_fondo',
-            '6': 'glosa',
-            '10': 'fecha',
-            '12': 'ingresos',
-            '15': 'egresos',
-            '18': 'saldo',
-        })
-        df['mes'] = df['fecha'].str[5:7] + '/' + df['ejercicio']
-        df['nro_comprobante'] = df['nro_fondo'].str.zfill(5) + '/' + df['mes'].str[-2:]
-        # df = df >> \
-        #     base.tail(-19) >> \
-        #     tidyr.drop_na(f['10']) >> \
-        #     dplyr.transmute(
-        #         ejercicio = f.ejercicio,
-        #         tipo_comprobante = base.trimws(f.tipo_comprobante),
-        #         fecha = f['10'],
-        #         mes =  f.fecha.str[5:7] + '/' + f.ejercicio,
-        #         nro_fondo = f['3'],
-        #         glosa = base.trimws(f['6']),
-        #         ingresos = base.as_double(f['12']),
-        #         egresos = base.as_double(f['15']),
-        #         saldo = base.as_double(f['18']),
-        #         nro_comprobante = f['nro_fondo'].str.zfill(5) + '/' + f['mes'].str[-2:]
-        #     )
-
-        df['fecha'] = pd.to_datetime(
-            df['fecha'], format='%Y-%m-%d'
-        )
-
-        df = df.loc[:, [
-            'ejercicio', 'mes', 'fecha', 'tipo_comprobante', 'nro_comprobante',
-            'nro_fondo', 'glosa', 'ingresos', 'egresos', 'saldo'
-        ]]
-
-        to_numeric_cols = [
-            'ingresos', 'egresos', 'saldo'
-        ]
-        df[to_numeric_cols] = df[to_numeric_cols].apply(pd.to_numeric).astype(np.float64) 
-
-        self.df = df
+        self.df = self._SPEC.transform(self.df)
         return self.df
 
 # --------------------------------------------------
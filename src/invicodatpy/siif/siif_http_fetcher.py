@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Download SIIF reports over plain HTTP reusing the cookies of a
+selenium session (the browser is only needed to log in again)
+"""
+
+__all__ = ['ReportRequest', 'SIIFHttpFetcher', 'capture_report_requests']
+
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .connect_siif import ConnectSIIF
+
+
+@dataclass
+class ReportRequest():
+    """
+    One report generation request
+    :param params: query string parameters.
+    :param data: form parameters (POST).
+    :param file_name: output name (default: Content-Disposition or url name).
+    """
+    url:str
+    method:str = 'GET'
+    params:dict = field(default_factory=dict)
+    data:dict = field(default_factory=dict)
+    file_name:str = None
+
+    # --------------------------------------------------
+    def with_values(self, file_name:str = None, **values) -> 'ReportRequest':
+        """Copy of the request with some parameters (ejercicio, fechas,
+        cuenta, ...) replaced wherever they show up"""
+        params = {
+            k: values.get(k, v) for k, v in self.params.items()
+        }
+        data = {
+            k: values.get(k, v) for k, v in self.data.items()
+        }
+        return replace(
+            self, params=params, data=data,
+            file_name=file_name or self.file_name
+        )
+
+# --------------------------------------------------
+def capture_report_requests(
+    siif:ConnectSIIF, url_contains:str = ''
+) -> list[ReportRequest]:
+    """Report requests made by the browser so far (the session must be
+    opened with ConnectSIIF.log_requests = True). Download a report once
+    through the UI, capture its request and replay it with other values.
+    """
+    captured = []
+    for entry in siif.driver.get_log('performance'):
+        message = json.loads(entry['message'])['message']
+        if message.get('method') != 'Network.requestWillBeSent':
+            continue
+        request = message['params']['request']
+        if url_contains not in request['url']:
+            continue
+        url, _, query = request['url'].partition('?')
+        captured.append(ReportRequest(
+            url=url,
+            method=request['method'],
+            params=dict(parse_qsl(query, keep_blank_values=True)),
+            data=dict(parse_qsl(
+                request.get('postData', ''), keep_blank_values=True
+            )),
+        ))
+    return captured
+
+
+@dataclass
+class SIIFHttpFetcher():
+    """
+    Pooled HTTP client sharing the authenticated SIIF session
+    :param siif: logged in SIIF session (shared or scoped).
+    :param pool_size: concurrent connections (and fetch_many workers).
+    """
+    siif:ConnectSIIF
+    pool_size:int = 8
+    timeout:float = 300
+    http:requests.Session = field(init=False, repr=False, default=None)
+    _login_lock:threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _logins:int = field(init=False, repr=False, default=0)
+
+    # --------------------------------------------------
+    def __post_init__(self):
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_size,
+            max_retries=Retry(
+                total=3, backoff_factor=1, status_forcelist=(502, 503, 504)
+            )
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        self.load_cookies()
+
+    # --------------------------------------------------
+    def load_cookies(self) -> None:
+        """Copy cookies and user agent from the browser"""
+        driver = self.siif.driver
+        for cookie in driver.get_cookies():
+            self.http.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+        self.http.headers['User-Agent'] = driver.execute_script(
+            'return navigator.userAgent'
+        )
+
+    # --------------------------------------------------
+    def relogin(self, logins_seen:int) -> None:
+        """Log in again through selenium, once for every thread that
+        found the session expired"""
+        with self._login_lock:
+            if self._logins != logins_seen:
+                return
+            # One browser per session: close the expired one first
+            if self.siif.driver is not None:
+                try:
+                    self.siif.quit()
+                except Exception as e:
+                    print(f"Ocurrió un error: {e}, {type(e)}")
+            # connect() would otherwise bring a headless session back visible
+            self.siif.connect(invisible=self.siif.invisible)
+            self.load_cookies()
+            self._logins += 1
+
+    # --------------------------------------------------
+    @staticmethod
+    def is_expired(response:requests.Response) -> bool:
+        """SIIF answers an expired session with its login page"""
+        if 'login.jspx' in response.url:
+            return True
+        content_type = response.headers.get('Content-Type', '')
+        return (
+            'html' in content_type
+            and b'pt1:cb1' in response.content[:100_000]
+        )
+
+    # --------------------------------------------------
+    def _send(self, request:ReportRequest) -> requests.Response:
+        response = self.http.request(
+            request.method, request.url, params=request.params or None,
+            data=request.data or None, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response
+
+    # --------------------------------------------------
+    def fetch(self, request:ReportRequest, dir_path:str) -> str:
+        """Download request into dir_path and return the file path"""
+        logins_seen = self._logins
+        response = self._send(request)
+        if self.is_expired(response):
+            self.relogin(logins_seen)
+            response = self._send(request)
+            if self.is_expired(response):
+                raise ConnectionError("No se pudo renovar la sesión del SIIF")
+
+        file_name = request.file_name
+        if file_name is None:
+            disposition = response.headers.get('Content-Disposition', '')
+            found = re.search(r'filename="?([^";]+)', disposition)
+            file_name = (
+                found.group(1) if found
+                else os.path.basename(urlsplit(response.url).path)
+            )
+        file_path = os.path.join(dir_path, file_name)
+        # Never leave half written reports behind; the partial file is
+        # unique so concurrent fetches never write into each other's
+        fd, part_path = tempfile.mkstemp(
+            suffix='.part', prefix=file_name + '.', dir=dir_path
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(response.content)
+            os.replace(part_path, file_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        return file_path
+
+    # --------------------------------------------------
+    def fetch_many(
+        self, requests_list:list[ReportRequest], dir_path:str
+    ) -> list[str]:
+        """Download every request concurrently, keeping their order. Each
+        request needs its own file_name: SIIF names every download of a
+        report alike (e.g. rcocc31.xls)."""
+        file_names = [request.file_name for request in requests_list]
+        if None in file_names or len(set(file_names)) != len(file_names):
+            raise ValueError(
+                "fetch_many needs a distinct file_name for every request "
+                "(see ReportRequest.with_values)"
+            )
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return list(executor.map(
+                lambda request: self.fetch(request, dir_path), requests_list
+            ))
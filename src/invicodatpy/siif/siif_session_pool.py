@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Pool of independent SIIF browser sessions to download many
+reports (ejercicios x cuentas, ...) concurrently
+"""
+
+__all__ = ['SIIFSessionPool']
+
+import inspect
+import os
+import queue
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from urllib.parse import urlparse
+
+from ..utils.downloads import wait_for_downloads_idle
+from .connect_siif import ConnectSIIF
+
+# Downloads running per host, shared by every pool of the process
+_HOST_LIMITS = {}
+_HOST_LIMITS_LOCK = threading.Lock()
+
+
+class _HostLimit():
+    """Downloads running against one host. Every caller waits until fewer
+    than its own limit are running, so each pool's max_per_host holds
+    host wide whatever the other pools asked for."""
+    def __init__(self):
+        self.running = 0
+        self.condition = threading.Condition()
+
+    @contextmanager
+    def slot(self, limit:int):
+        with self.condition:
+            self.condition.wait_for(lambda: self.running < limit)
+            self.running += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.running -= 1
+                self.condition.notify_all()
+
+
+# --------------------------------------------------
+def _host_limit(host:str) -> _HostLimit:
+    with _HOST_LIMITS_LOCK:
+        if host not in _HOST_LIMITS:
+            _HOST_LIMITS[host] = _HostLimit()
+        return _HOST_LIMITS[host]
+
+
+@dataclass
+class SIIFSessionPool():
+    """
+    N independent headless SIIF sessions, each one with its own driver,
+    Chrome profile and download directory.
+    :param size: number of browser sessions.
+    :param max_per_host: concurrent report downloads allowed against SIIF,
+    whatever the number of pools or sessions.
+    :param retries: times a failed job is queued again. The session that
+    failed it logs in again, or is retired if it cannot.
+    """
+    username:str
+    password:str
+    size:int = 2
+    invisible:bool = True
+    max_per_host:int = 4
+    retries:int = 1
+    sessions:list = field(init=False, repr=False, default_factory=list)
+
+    # --------------------------------------------------
+    def __enter__(self) -> 'SIIFSessionPool':
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --------------------------------------------------
+    def open(self) -> None:
+        """Log in every session at once"""
+        def start(n:int) -> ConnectSIIF:
+            session = ConnectSIIF(scoped=True)
+            # Chrome locks its profile: one (persistent) profile per session
+            if ConnectSIIF.user_data_dir is not None:
+                session.user_data_dir = (
+                    ConnectSIIF.user_data_dir + f'_session_{n}'
+                )
+            session.connect(self.username, self.password, self.invisible)
+            session.go_to_reports()
+            return session
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(start, n) for n in range(self.size)]
+            for future in futures:
+                try:
+                    self.sessions.append(future.result())
+                except Exception as e:
+                    print(f"Ocurrió un error: {e}, {type(e)}")
+        if not self.sessions:
+            raise ConnectionError("No se pudo abrir ninguna sesión del SIIF")
+
+    # --------------------------------------------------
+    def close(self) -> None:
+        for session in self.sessions:
+            try:
+                session.disconnect()
+            except Exception as e:
+                print(f"Ocurrió un error: {e}, {type(e)}")
+            try:
+                session.quit()
+            except Exception as e:
+                print(f"Ocurrió un error: {e}, {type(e)}")
+        self.sessions = []
+
+    # --------------------------------------------------
+    def download_reports(
+        self, report_cls:type, dir_path:str, jobs:list[dict],
+        expected = None
+    ) -> list[dict]:
+        """Run report_cls().download_report(**job) for every job. Idle
+        sessions take the next pending job, so keep jobs small (one
+        ejercicio x cta_contable for rcocc31). Each session downloads into
+        its own sub folder of dir_path (SIIF always names the file the
+        same way), finished files are then moved to dir_path. A job
+        raising, or leaving any expected file missing, failed
+        (download_report is called with raise_errors=True when it takes
+        it, most others print their errors and disconnect).
+        :param jobs: download_report keyword arguments (but dir_path).
+        :param expected: job -> file names (or glob patterns) it leaves in
+        dir_path. Without it, a job leaving any file was downloaded.
+        Returns the jobs that could not be downloaded.
+        """
+        pending = queue.Queue()
+        for job in jobs:
+            pending.put((job, 0))
+        failed = []
+        host_limit = _host_limit(urlparse(ConnectSIIF.url).hostname)
+        raise_errors = 'raise_errors' in inspect.signature(
+            report_cls.download_report
+        ).parameters
+
+        def work(n:int, session:ConnectSIIF) -> None:
+            session_dir = os.path.join(dir_path, f'.siif_session_{n}')
+            os.makedirs(session_dir, exist_ok=True)
+            report = report_cls().use_session(session)
+            while True:
+                try:
+                    job, attempts = pending.get_nowait()
+                except queue.Empty:
+                    break
+                downloaded = True
+                try:
+                    with host_limit.slot(self.max_per_host):
+                        if raise_errors:
+                            report.download_report(
+                                session_dir, raise_errors=True, **job
+                            )
+                        else:
+                            report.download_report(session_dir, **job)
+                    wait_for_downloads_idle(session_dir)
+                except Exception as e:
+                    print(f"Ocurrió un error: {e}, {type(e)}")
+                    downloaded = False
+                moved = []
+                for name in os.listdir(session_dir):
+                    if '.htm' not in name:
+                        os.replace(
+                            os.path.join(session_dir, name),
+                            os.path.join(dir_path, name)
+                        )
+                        moved.append(name)
+                if expected is None:
+                    downloaded = downloaded and bool(moved)
+                else:
+                    missing = [
+                        pattern for pattern in expected(job)
+                        if not any(fnmatch(name, pattern) for name in moved)
+                    ]
+                    if missing:
+                        print(f"Faltan {missing} de {job}")
+                        downloaded = False
+                if downloaded:
+                    continue
+                if attempts < self.retries:
+                    pending.put((job, attempts + 1))
+                else:
+                    failed.append(job)
+                # The session may be logged out or stuck on the report page
+                try:
+                    session.reconnect()
+                    report.use_session(session)
+                except Exception as e:
+                    print(f"Sesión {n} del SIIF retirada: {e}, {type(e)}")
+                    break
+            shutil.rmtree(session_dir, ignore_errors=True)
+
+        with ThreadPoolExecutor(max_workers=len(self.sessions)) as executor:
+            futures = [
+                executor.submit(work, n, session)
+                for n, session in enumerate(self.sessions)
+            ]
+            for future in futures:
+                future.result()
+        # Left over by sessions retired before taking them
+        while not pending.empty():
+            failed.append(pending.get_nowait()[0])
+        return failed
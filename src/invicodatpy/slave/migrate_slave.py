@@ -22,6 +22,7 @@ from dataclasses import dataclass
 import pandas as pd
 
 from ..models.slave_model import SlaveModel
+from ..utils.periods import ejercicio_from, mes_from, parse_dates
 from ..utils.rpw_utils import RPWUtils
 
 
@@ -133,7 +134,7 @@ class MigrateSlave(RPWUtils):
                     "12":"actividad",
                     "13":"partida",
                     }, inplace=True)
-            df['fecha'] = pd.to_datetime(
+            df['fecha'] = parse_dates(
                 df['fecha'], format='%m/%d/%y %H:%M:%S'
             )
         elif sys.platform.startswith('win32'):
@@ -157,8 +158,8 @@ class MigrateSlave(RPWUtils):
                 }, inplace=True)
 
         # Table honorarios_factureros
-        df['ejercicio'] = df['fecha'].dt.year.astype(str)
-        df['mes'] = df['fecha'].dt.strftime('%m/%Y')
+        df['ejercicio'] = ejercicio_from(df['fecha'])
+        df['mes'] = mes_from(df['fecha'])
         df['mutual'] = 0
         df['embargo'] = 0
         keep = ['NoSIIF']
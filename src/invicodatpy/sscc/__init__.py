@@ -1,7 +1,23 @@
-from .banco_invico import *
-from .ctas_ctes import *
-from .sdo_final_banco_invico import *
-from .connect_sscc import *
-from .listado_imputaciones import *
+from .. import _lazy
 
-__all__ = ['banco_invico', 'ctas_ctes', 'sdo_final_banco_invico', 'connect_sscc', 'listado_imputaciones']
\ No newline at end of file
+__all__ = ['banco_invico', 'ctas_ctes', 'sdo_final_banco_invico', 'connect_sscc', 'listado_imputaciones']
+
+# Modules are imported on first use of one of their names
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all',
+        'banco_invico',
+        'connect_sscc',
+        'ctas_ctes',
+        'listado_imputaciones',
+        'sdo_final_banco_invico'
+    ],
+    star_modules=[
+        'banco_invico',
+        'ctas_ctes',
+        'sdo_final_banco_invico',
+        'connect_sscc',
+        'listado_imputaciones'
+    ],
+)
@@ -14,14 +14,18 @@ import json
 import os
 import time
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from pywinauto import findwindows, keyboard, mouse
 
 from ..models.sscc_model import SSCCModel
+from ..utils.money import parse_money
+from ..utils.periods import ejercicio_from, mes_from, parse_dates
 from ..utils.rpw_utils import RPWUtils
-from .connect_sscc import ConnectSSCC
+
+if TYPE_CHECKING:
+    from .connect_sscc import ConnectSSCC
 
 
 @dataclass
@@ -47,7 +51,7 @@ class BancoINVICO(RPWUtils):
     _SQL_MODEL:SSCCModel = field(
         init=False, repr=False, default=SSCCModel
     )
-    sscc:ConnectSSCC = field(
+    sscc:'ConnectSSCC' = field(
         init=True, repr=False, default=None
     )
 
@@ -55,6 +59,9 @@ class BancoINVICO(RPWUtils):
     def download_report(
         self, dir_path:str, ejercicios:list = str(dt.datetime.now().year)
     ):
+        # pywinauto (Windows only) is imported when a download is asked for
+        from pywinauto import findwindows, keyboard, mouse
+
         try:
             if not isinstance(ejercicios, list):
                 ejercicios = [ejercicios]
@@ -163,10 +170,11 @@ class BancoINVICO(RPWUtils):
         df = self.df
         df = df.replace(to_replace='[\r\n]', value='')
         df['21'] = df['21'].str.strip()
+        fecha = parse_dates(df['20'], format='%d/%m/%Y')
         df = df.assign(
-            fecha = df['20'],
-            ejercicio = df['20'].str[-4:],
-            mes = df['20'].str[3:5] + '/' + df['20'].str[-4:],
+            fecha = fecha,
+            ejercicio = ejercicio_from(fecha),
+            mes = mes_from(fecha),
             cta_cte = df['22'],
             movimiento = df['21'],
             es_cheque = np.where(
@@ -179,7 +187,7 @@ class BancoINVICO(RPWUtils):
             moneda = df['25'],
             libramiento = df['26'],
             imputacion = df['27'],
-            importe = df['28'].str.replace(',', '').astype(float)
+            importe = parse_money(df['28'], decimal='.')
         )
         df[['cod_imputacion', 'imputacion']] = df['imputacion'].str.split(
             pat='-', n=1, expand=True
@@ -190,10 +198,6 @@ class BancoINVICO(RPWUtils):
             'moneda', 'libramiento', 'cod_imputacion', 'imputacion', 
         ]]
 
-        df['fecha'] = pd.to_datetime(
-            df['fecha'], format='%d/%m/%Y'
-        )
-
         self.df = df
         return self.df
 
@@ -249,6 +253,7 @@ def main():
                 inspect.currentframe())))
 
     if args.download:
+        from .connect_sscc import ConnectSSCC
         json_path = dir_path + '/sscc_credentials.json'
         if args.username != '' and args.password != '':
             sscc_connection = ConnectSSCC(args.username, args.password)
@@ -13,6 +13,7 @@ import os
 import pandas as pd
 
 from ..models.sscc_model import SSCCModel
+from ..utils.money import parse_money
 from ..utils.rpw_utils import RPWUtils
 
 
@@ -44,9 +45,7 @@ class SdoFinalBancoINVICO(RPWUtils):
         df.columns = ['ejercicio', 'cta_cte', 'desc_cta_cte', 
         'desc_banco', 'saldo']
         df['ejercicio'] =  df['ejercicio'].str[-4:]
-        df['saldo'] = df['saldo'].str.replace('.', '', regex=False)
-        df['saldo'] = df['saldo'].str.replace(',', '.', regex=False)
-        df['saldo'] = df['saldo'].astype(float)
+        df['saldo'] = parse_money(df['saldo'], decimal=',')
 
         self.df = df
         return self.df
@@ -1,8 +1,45 @@
-from .google_sheets import *
-from .handling_files import *
-from .print_tidyverse import *
-from .rpw_utils import *
-from .sql_utils import *
+from .. import _lazy
 
+__all__ = ['google_sheets', 'rpw_utils']
 
-__all__ = ['google_sheets', 'rpw_utils']
\ No newline at end of file
+# Modules are imported on first use of one of their names
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        'all',
+        'downloads',
+        'driver_factory',
+        'fixtures',
+        'freshness',
+        'google_sheets',
+        'handling_files',
+        'job_queue',
+        'metrics',
+        'money',
+        'outline',
+        'periods',
+        'print_tidyverse',
+        'profiling',
+        'report_spec',
+        'rpw_utils',
+        'sql_utils'
+    ],
+    star_modules=[
+        'downloads',
+        'driver_factory',
+        'fixtures',
+        'freshness',
+        'google_sheets',
+        'handling_files',
+        'job_queue',
+        'metrics',
+        'money',
+        'outline',
+        'periods',
+        'print_tidyverse',
+        'profiling',
+        'report_spec',
+        'rpw_utils',
+        'sql_utils'
+    ],
+)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Wait for browser downloads to finish (inotify on Linux, polling
+elsewhere) instead of sleeping a fixed time
+"""
+
+
+__all__ = [
+    "wait_for_download", "wait_for_downloads_idle",
+    "move_download", "remove_html_files"
+]
+
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import sys
+import time
+
+from ..config import settings
+from .metrics import metrics
+
+
+# Suffixes of files still being written by Chrome / Firefox / Edge
+_PARTIAL_SUFFIXES = ('.crdownload', '.part', '.partial', '.tmp')
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+
+
+# --------------------------------------------------
+class _Inotify():
+    """Wake up as soon as something changes in a directory (Linux only)"""
+    def __init__(self, dir_path:str):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        mask = (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO |
+                _IN_CREATE | _IN_DELETE)
+        if libc.inotify_add_watch(self.fd, os.fsencode(dir_path), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f'inotify_add_watch failed for {dir_path}')
+
+    def wait(self, timeout:float) -> None:
+        ready, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if ready:
+            # Events are only a wake up call, the directory is rescanned
+            try:
+                while os.read(self.fd, 64 * 1024):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+# --------------------------------------------------
+class _Poller():
+    """Fallback for platforms without inotify"""
+    def __init__(self, poll_interval:float):
+        self.poll_interval = poll_interval
+
+    def wait(self, timeout:float) -> None:
+        time.sleep(max(min(timeout, self.poll_interval), 0))
+
+    def close(self) -> None:
+        pass
+
+# --------------------------------------------------
+def _watcher(dir_path:str, poll_interval:float):
+    if sys.platform.startswith('linux'):
+        try:
+            return _Inotify(dir_path)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return _Poller(poll_interval)
+
+# --------------------------------------------------
+def _is_partial(name:str) -> bool:
+    return name.lower().endswith(_PARTIAL_SUFFIXES)
+
+# --------------------------------------------------
+def _find_download(dir_path:str, pattern:str) -> str:
+    """Newest finished-looking file of dir_path matching pattern (glob)"""
+    names = os.listdir(dir_path)
+    partial = {name for name in names if _is_partial(name)}
+    found = None
+    for name in fnmatch.filter(names, pattern):
+        if name in partial or any(name + sfx in partial for sfx in _PARTIAL_SUFFIXES):
+            continue
+        path = os.path.join(dir_path, name)
+        if not os.path.isfile(path):
+            continue
+        mtime = os.stat(path).st_mtime_ns
+        if found is None or mtime > found[1]:
+            found = (path, mtime)
+    return None if found is None else found[0]
+
+# --------------------------------------------------
+def _is_unlocked(path:str) -> bool:
+    """False while another process holds the file (Windows locks it)"""
+    try:
+        with open(path, 'ab'):
+            return True
+    except OSError:
+        return False
+
+# --------------------------------------------------
+def wait_for_download(
+    dir_path:str, pattern:str, timeout:float = None,
+    stable_for:float = 0.5, poll_interval:float = 0.25
+) -> str:
+    """Wait until a file matching pattern (a name or a glob) is fully
+    written in dir_path and return its path. A file is done when it has
+    no partial download sibling (.crdownload, ...), its size and mtime
+    did not change for stable_for seconds and it is not locked.
+    Raise TimeoutError after timeout seconds (default: the
+    download_timeout setting).
+    """
+    if timeout is None:
+        timeout = settings.download_timeout
+    deadline = time.monotonic() + timeout
+    watcher = _watcher(dir_path, poll_interval)
+    try:
+        last, since = None, None
+        while True:
+            now = time.monotonic()
+            path = _find_download(dir_path, pattern)
+            wait = deadline - now
+            if path is not None:
+                try:
+                    stat = os.stat(path)
+                    signature = (path, stat.st_size, stat.st_mtime_ns)
+                except FileNotFoundError:
+                    signature = None
+                if signature is not None and signature == last:
+                    if now - since >= stable_for and _is_unlocked(path):
+                        return path
+                else:
+                    last, since = signature, now
+                # Even without new events, look again once the file
+                # should be stable
+                wait = min(wait, stable_for, poll_interval)
+            else:
+                last, since = None, None
+            if now >= deadline:
+                raise TimeoutError(
+                    f"{pattern} not downloaded in {dir_path} after {timeout}s"
+                )
+            watcher.wait(wait)
+    finally:
+        watcher.close()
+
+# --------------------------------------------------
+def wait_for_downloads_idle(
+    dir_path:str, timeout:float = None, poll_interval:float = 0.25
+) -> None:
+    """Wait until dir_path holds no partial downloads.
+    Raise TimeoutError after timeout seconds.
+    """
+    if timeout is None:
+        timeout = settings.download_timeout
+    deadline = time.monotonic() + timeout
+    watcher = _watcher(dir_path, poll_interval)
+    try:
+        while any(_is_partial(name) for name in os.listdir(dir_path)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Downloads in {dir_path} not finished after {timeout}s"
+                )
+            watcher.wait(min(remaining, poll_interval * 4))
+    finally:
+        watcher.close()
+
+# --------------------------------------------------
+def move_download(
+    dir_path:str, old_name:str, new_name:str, timeout:float = None,
+    report:str = 'download'
+) -> str:
+    """Wait for old_name (a name or a glob) to be downloaded in dir_path
+    and rename it to new_name, replacing any previous file. Return the
+    new path.
+    :param report: metrics label (a report or table name, never the file
+    name: each one would be a new Prometheus series).
+    """
+    with metrics.stage(report, 'download_file') as record:
+        record.file = new_name
+        old_file_path = wait_for_download(dir_path, old_name, timeout=timeout)
+        new_file_path = os.path.join(dir_path, new_name)
+        os.replace(old_file_path, new_file_path)
+        record.bytes_read = os.path.getsize(new_file_path)
+    return new_file_path
+
+# --------------------------------------------------
+def remove_html_files(dir_path:str, timeout:float = None) -> None:
+    """Remove html files left by the browser once downloads are done"""
+    wait_for_downloads_idle(dir_path, timeout=timeout)
+    for f in os.listdir(dir_path):
+        if '.htm' in f:
+            file_path = os.path.join(dir_path, f)
+            os.remove(file_path)
+            print(f"File: {file_path} removed")
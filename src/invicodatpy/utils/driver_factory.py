@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Shared, lightweight Chrome driver factory for SIIF, SGV and SGO
+"""
+
+
+__all__ = ["get_driver_path", "create_chrome_driver", "BLOCKED_RESOURCES"]
+
+
+import os
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from ..config import settings
+
+# Assets the scrapers never look at. CSS is left out on purpose: ADF and
+# ASP.NET pages hide menus and popups with it, and selenium refuses to
+# click hidden elements (pass BLOCKED_RESOURCES + BLOCKED_CSS to drop it).
+BLOCKED_RESOURCES = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3',
+)
+BLOCKED_CSS = ('*.css',)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+# --------------------------------------------------
+def get_driver_path(refresh:bool = False) -> str:
+    """Path of the chromedriver binary. ChromeDriverManager is asked (it
+    hits the network) only once: the path is kept in memory and on disk
+    until the binary goes away.
+    """
+    global _driver_path
+    cache_file = os.path.join(settings.cache_dir, 'chromedriver_path')
+    with _driver_path_lock:
+        if not refresh:
+            if _driver_path is not None and os.path.isfile(_driver_path):
+                return _driver_path
+            if os.path.isfile(cache_file):
+                with open(cache_file, encoding='utf-8') as f:
+                    cached = f.read().strip()
+                if os.path.isfile(cached):
+                    _driver_path = cached
+                    return _driver_path
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        _driver_path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            f.write(_driver_path)
+        return _driver_path
+
+# --------------------------------------------------
+def create_chrome_driver(
+    invisible:bool = False, download_dir:str = None,
+    user_data_dir:str = None, blocked:tuple = BLOCKED_RESOURCES,
+    page_load_strategy:str = 'eager', window_size:str = '1920,1080',
+    prefs:dict = None, capabilities:dict = None
+) -> webdriver.Chrome:
+    """Chrome driver tuned for scraping.
+    :param invisible: headless (new headless mode).
+    :param download_dir: folder for downloads (can be changed later with
+    Page.setDownloadBehavior).
+    :param user_data_dir: persistent profile (keeps Chrome's cache between
+    runs).
+    :param blocked: url patterns never requested (through CDP).
+    :param page_load_strategy: 'eager' returns once the DOM is ready,
+    without waiting for every asset.
+    """
+    options = Options()
+    options.add_argument(f"--window-size={window_size}")
+    if invisible:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    if user_data_dir is not None:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+    options.page_load_strategy = page_load_strategy
+    for name, value in (capabilities or {}).items():
+        options.set_capability(name, value)
+
+    all_prefs = {
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+        # Never load images, even those the url patterns miss
+        "profile.managed_default_content_settings.images": 2,
+    }
+    if download_dir is not None:
+        all_prefs["download.default_directory"] = download_dir
+    all_prefs.update(prefs or {})
+    options.add_experimental_option('prefs', all_prefs)
+
+    driver = webdriver.Chrome(
+        service=Service(get_driver_path()), options=options
+    )
+    if blocked:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(blocked)})
+    return driver
@@ -0,0 +1,1228 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Synthetic SIIF, SGV, SGO, SGF and SSCC reports laid out cell by
+cell as each from_external_report / transform_df expects, for offline
+tests and benchmarks
+"""
+
+__all__ = [
+    'Fixture', 'FIXTURES', 'file_format', 'synthetic_report', 'write_fixture',
+    'write_fixtures'
+]
+
+import argparse
+import calendar
+import csv
+import os
+import warnings
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Rows of a worksheet
+XLSX_MAX_ROWS = 1048576
+XLS_MAX_ROWS = 65536
+XLS_MAX_COLS = 256
+
+
+@dataclass(frozen=True)
+class Fixture():
+    """
+    How to build a report
+    :param build: callable(rng, rows, period, **params) returning the
+    report as an object array of strings ('' for empty cells), exactly as
+    read_xls / read_csv would read it.
+    :param file_name: callable(period, **params) with the name the report
+    is downloaded with (cli.REPORTS patterns match it).
+    :param numeric: columns written as numbers (not text) to xls / xlsx
+    files.
+    :param header: the first row holds column names (read_xls(header=0)).
+    """
+    build:callable
+    file_name:callable
+    period_arg:str = 'ejercicios'
+    numeric:tuple = ()
+    header:bool = False
+    rows:int = 1000
+
+    # --------------------------------------------------
+    @property
+    def is_csv(self) -> bool:
+        return self.file_name('2024').endswith('.csv')
+
+
+# --------------------------------------------------
+def _blank(n_rows:int, n_cols:int) -> np.ndarray:
+    return np.full((n_rows, n_cols), '', dtype=object)
+
+# --------------------------------------------------
+def _fit(text:str, width:int) -> str:
+    """text padded with spaces (or cut) to width, to put a value at a
+    fixed position of a cell"""
+    return text.ljust(width)[:width]
+
+# --------------------------------------------------
+def _num(values:np.ndarray) -> np.ndarray:
+    """Amounts as read_xls reads number cells (1234.5, 1234)"""
+    values = np.round(np.asarray(values, dtype=np.float64), 2)
+    return np.array(
+        [str(int(x)) if x.is_integer() else repr(x) for x in values.tolist()],
+        dtype=object
+    )
+
+# --------------------------------------------------
+def _money(values:np.ndarray, decimal:str = '.') -> np.ndarray:
+    """Amounts as SGF / SSCC csv print them ('1,234.56' or '1.234,56')"""
+    text = [f'{x:,.2f}' for x in np.asarray(values, dtype=np.float64).tolist()]
+    if decimal == ',':
+        table = str.maketrans(',.', '.,')
+        text = [x.translate(table) for x in text]
+    return np.array(text, dtype=object)
+
+# --------------------------------------------------
+def _amounts(rng, n:int, high:float = 1e7, zeros:float = 0.0) -> np.ndarray:
+    values = rng.integers(1, int(high * 100), size=n) / 100
+    if zeros:
+        values[rng.random(n) < zeros] = 0
+    return values
+
+# --------------------------------------------------
+def _ints(rng, n:int, low:int, high:int, width:int = None) -> np.ndarray:
+    values = rng.integers(low, high, size=n).astype(str).astype(object)
+    if width:
+        values = np.array([x.zfill(width) for x in values], dtype=object)
+    return values
+
+# --------------------------------------------------
+def _choice(rng, options:list, n:int, p:list = None) -> np.ndarray:
+    return np.asarray(options, dtype=object)[
+        rng.choice(len(options), size=n, p=p)
+    ]
+
+# --------------------------------------------------
+def _names(rng, n:int, prefix:str, pool:int = 500) -> np.ndarray:
+    return _choice(rng, [f'{prefix} {i}' for i in range(1, pool + 1)], n)
+
+# --------------------------------------------------
+def _cuits(rng, n:int, sep:str = '') -> np.ndarray:
+    return np.array([
+        f'{prefix}{sep}{body:08d}{sep}{check}' for prefix, body, check in zip(
+            rng.choice(['20', '27', '30', '33'], n).tolist(),
+            rng.integers(10000000, 99999999, n).tolist(),
+            rng.integers(0, 10, n).tolist(),
+        )
+    ], dtype=object)
+
+# --------------------------------------------------
+def _dates(
+    rng, n:int, ejercicio:str, format:str = '%Y-%m-%d', until:str = None
+) -> np.ndarray:
+    """Dates of ejercicio (up to until, 'YYYY-MM-DD'), as text"""
+    days = pd.date_range(f'{ejercicio}-01-01', until or f'{ejercicio}-12-31')
+    return np.asarray(days.strftime(format), dtype=object)[
+        rng.integers(0, len(days), size=n)
+    ]
+
+# --------------------------------------------------
+def _month_end(mes:str) -> str:
+    """'YYYY-MM' -> 'YYYY-MM-DD' of its last day"""
+    year, month = int(mes[:4]), int(mes[5:7])
+    return f'{mes[:7]}-{calendar.monthrange(year, month)[1]:02d}'
+
+# --------------------------------------------------
+def _outline(n_leaves:int, fanout:tuple) -> tuple:
+    """
+    Rows of an outline report: headers of len(fanout) levels, each one
+    followed by its children, with n_leaves leaf rows at the bottom.
+    :param fanout: children of a header of each level (the last one,
+    leaves per header).
+    Returns (number of rows, leaf rows, [(header rows, header numbers)
+    by level], [parent header number of each leaf by level]).
+    """
+    depth = len(fanout)
+    spans = [int(np.prod(fanout[d:])) for d in range(depth)]
+    leaves = np.arange(n_leaves)
+    leaf_rows = leaves + sum(leaves // span + 1 for span in spans)
+    headers, parents = [], []
+    for d, span in enumerate(spans):
+        numbers = np.arange(-(-n_leaves // span))
+        headers.append((leaf_rows[numbers * span] - (depth - d), numbers))
+        parents.append(leaves // span)
+    return int(leaf_rows[-1]) + 1, leaf_rows, headers, parents
+
+
+# --------------------------------------------------
+# SIIF
+# --------------------------------------------------
+def _rf602(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(16 + rows, 21)
+    raw[5, 2] = 'DETALLE DE LA EJECUCION PRESUESTARIA ' + ejercicio
+    raw[13, [2, 3, 6, 7, 8, 9, 10, 13, 14, 15, 16, 18, 20]] = [
+        'Prog', 'Subp', 'Proy', 'Act', 'Partida', 'Fte', 'Org', 'Cred. Original',
+        'Cred. Vigente', 'Comprometido', 'Ordenado', 'Saldo', 'Pendiente',
+    ]
+    data = raw[16:]
+    grupo = rng.integers(1, 5, size=rows)
+    data[:, 2] = _ints(rng, rows, 1, 30)
+    data[:, 3] = _ints(rng, rows, 0, 5)
+    data[:, 6] = _ints(rng, rows, 0, 10)
+    data[:, 7] = _ints(rng, rows, 1, 90)
+    data[:, 8] = [f'{g}{p:02d}' for g, p in zip(
+        grupo.tolist(), rng.integers(0, 60, size=rows).tolist()
+    )]
+    data[:, 9] = _choice(rng, ['10', '11', '13'], rows)
+    data[:, 10] = _choice(rng, ['0', '1'], rows)
+    vigente = _amounts(rng, rows, 5e8)
+    comprometido = vigente * rng.random(rows)
+    ordenado = comprometido * rng.random(rows)
+    data[:, 13] = _num(vigente * rng.uniform(0.8, 1.2, rows))
+    data[:, 14] = _num(vigente)
+    data[:, 15] = _num(comprometido)
+    data[:, 16] = _num(ordenado)
+    data[:, 18] = _num(vigente - comprometido)
+    data[:, 20] = _num(comprometido - ordenado)
+    return raw
+
+# --------------------------------------------------
+def _rf610(rng, rows:int, ejercicio:str) -> np.ndarray:
+    n_rows, leaf_rows, headers, parents = _outline(rows, (2, 1, 3, 4, 8))
+    raw = _blank(30 + n_rows, 61)
+    raw[2, 32] = 'LISTADO DE EJECUCION'
+    raw[4, 32] = 'DE GASTOS POR PARTIDA'
+    raw[9, 33] = 'Ejercicio: ' + ejercicio
+    raw[27, [5, 21, 38, 44, 49, 55, 60]] = [
+        'Estructura', 'Partida', 'Crédito Original', 'Crédito Vigente',
+        'Comprometido', 'Ordenado', 'Saldo',
+    ]
+    body = raw[30:]
+    for (header_rows, numbers), col, label in zip(
+        headers[:4], (5, 9, 14, 17),
+        ('PROGRAMA', 'SUBPROGRAMA', 'PROYECTO', 'ACTIVIDAD')
+    ):
+        body[header_rows, col] = [f'{k % 99 + 1} {label} {k}' for k in numbers.tolist()]
+    grupo_rows, grupos = headers[4]
+    body[grupo_rows, 20] = [f'{k % 4 + 1}00 GRUPO {k % 4 + 1}' for k in grupos.tolist()]
+    partida = [
+        f'{g % 4 + 1}{p:02d}' for g, p in zip(
+            parents[4].tolist(), (np.arange(rows) % 8 * 10 + 10).tolist()
+        )
+    ]
+    body[leaf_rows, 21] = partida
+    body[leaf_rows, 24] = ['PARTIDA ' + p for p in partida]
+    vigente = _amounts(rng, rows, 5e8)
+    comprometido = vigente * rng.random(rows)
+    ordenado = comprometido * rng.random(rows)
+    body[leaf_rows, 38] = _num(vigente * rng.uniform(0.8, 1.2, rows))
+    body[leaf_rows, 44] = _num(vigente)
+    body[leaf_rows, 49] = _num(comprometido)
+    body[leaf_rows, 55] = _num(ordenado)
+    body[leaf_rows, 60] = _num(vigente - comprometido)
+    return raw
+
+# --------------------------------------------------
+def _rfp_p605b(rng, rows:int, ejercicio:str) -> np.ndarray:
+    n_rows, leaf_rows, headers, parents = _outline(rows, (2, 1, 3, 4, 8))
+    raw = _blank(22 + n_rows, 38)
+    raw[8, 37] = 'rfp_p605b'
+    raw[13, 1] = 'Ejercicio ' + ejercicio
+    raw[20, [3, 9, 10, 19, 22]] = ['Estructura', 'Part.', 'Descripción', 'F. 10', 'F. 11']
+    body = raw[22:]
+    for (header_rows, numbers), (prefix, start) in zip(headers[:4], (
+        ('Programa', 22), ('SubPrograma', 19), ('Proyecto', 24), ('Actividad', 20)
+    )):
+        body[header_rows, 3] = [
+            _fit(prefix + ':', start) + f'{k % 99 + 1:>2} {prefix.upper()} {k}'
+            for k in numbers.tolist()
+        ]
+    grupo_rows, grupos = headers[4]
+    body[grupo_rows, 10] = [f'{k % 4 + 1}00 - GRUPO {k % 4 + 1}' for k in grupos.tolist()]
+    body[leaf_rows, 9] = [
+        f'{g % 4 + 1}{p:02d}' for g, p in zip(
+            parents[4].tolist(), (np.arange(rows) % 8 * 10 + 10).tolist()
+        )
+    ]
+    formulado = _amounts(rng, rows, 1e8)
+    fuente_11 = rng.random(rows) < 0.3
+    body[leaf_rows, 19] = _num(np.where(fuente_11, 0, formulado))
+    body[leaf_rows, 22] = _num(np.where(fuente_11, formulado, 0))
+    return raw
+
+# --------------------------------------------------
+def _rog01(rng, rows:int, ejercicio:str = None) -> np.ndarray:
+    """Partidas are unique (table key): 9 grupos of 9 parciales of 9
+    partidas at most"""
+    rows = min(rows, 9 * 9 * 9)
+    n_rows, leaf_rows, headers, parents = _outline(rows, (9, 9))
+    raw = _blank(15 + n_rows, 17)
+    raw[7, 16] = 'rog01'
+    raw[12, [2, 4, 6, 11]] = ['Grupo', 'Parcial', 'Partida', 'Descripción']
+    body = raw[15:]
+    grupo_rows, grupos = headers[0]
+    body[grupo_rows, 2] = [f'{k + 1}00' for k in grupos.tolist()]
+    body[grupo_rows, 5] = [f'GRUPO {k + 1}' for k in grupos.tolist()]
+    parcial_rows, parciales = headers[1]
+    parcial = [f'{k // 9 + 1}{k % 9 + 1}0' for k in parciales.tolist()]
+    body[parcial_rows, 4] = parcial
+    body[parcial_rows, 7] = ['PARTIDA PARCIAL ' + p for p in parcial]
+    partida = [
+        f'{parcial[k][:2]}{i % 9 + 1}' for k, i in zip(
+            parents[1].tolist(), range(rows)
+        )
+    ]
+    body[leaf_rows, 6] = partida
+    body[leaf_rows, 11] = ['PARTIDA ' + p for p in partida]
+    return raw
+
+# --------------------------------------------------
+def _ri102(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(15 + rows, 28)
+    raw[5, 17] = ejercicio
+    raw[9, 27] = 'ri102'
+    raw[12, [2, 11, 12, 14, 15, 19, 22, 25]] = [
+        'Recurso', 'Fte', 'Org', 'Ppto. Inicial', 'Modificaciones',
+        'Ppto. Vigente', 'Ingresado', 'Saldo',
+    ]
+    data = raw[15:]
+    cod_rec = [f'{t}{c}{r:03d}' for t, c, r in zip(
+        rng.integers(11, 18, rows).tolist(), rng.integers(1, 6, rows).tolist(),
+        rng.integers(0, 1000, rows).tolist()
+    )]
+    data[:, 2] = cod_rec
+    data[:, 4] = ['RECURSO ' + c for c in cod_rec]
+    data[:, 11] = _choice(rng, ['10', '11', '12', '13'], rows)
+    data[:, 12] = _choice(rng, ['0', '1'], rows)
+    inicial = _amounts(rng, rows, 1e9)
+    modif = _amounts(rng, rows, 1e8)
+    ingreso = (inicial + modif) * rng.random(rows)
+    data[:, 14] = _num(inicial)
+    data[:, 15] = _num(modif)
+    data[:, 19] = _num(inicial + modif)
+    data[:, 22] = _num(ingreso)
+    data[:, 25] = _num(inicial + modif - ingreso)
+    return raw
+
+# --------------------------------------------------
+def _rcg01_uejp(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(16 + rows, 20)
+    raw[2, 1] = 'Ejercicio: ' + ejercicio
+    raw[4, 1] = 'Resumen Diario de Comprobantes de Gastos Ingresados'
+    raw[13, [1, 2, 3, 7, 8, 9, 10, 19]] = [
+        'Nro. Entrada', 'Nro. Origen', 'Fte', 'Fecha', 'Importe', 'CUIT',
+        'Beneficiario', 'Nro. Fondo',
+    ]
+    data = raw[16:]
+    clase_mod = _choice(rng, ['NOR', 'FDO'], rows, [0.85, 0.15])
+    data[:, 1] = (np.arange(rows) + 1).astype(str).astype(object)
+    data[:, 2] = _ints(rng, rows, 1, 20000)
+    data[:, 3] = _choice(rng, ['10', '11', '13'], rows)
+    data[:, 4] = _choice(rng, ['CYO', 'REG', 'TRA'], rows)
+    data[:, 5] = clase_mod
+    data[:, 6] = _choice(rng, ['OTR', 'PAS', 'REM'], rows)
+    data[:, 7] = _dates(rng, rows, ejercicio)
+    data[:, 8] = _num(_amounts(rng, rows, 1e7))
+    data[:, 9] = _cuits(rng, rows)
+    data[:, 10] = _names(rng, rows, 'BENEFICIARIO')
+    data[:, 11] = [f'900{x:06d}{ejercicio}' for x in rng.integers(1, 999999, rows).tolist()]
+    data[:, 12] = _choice(rng, ['130832-03', '130832-05', '130832-07', '22110034-02'], rows)
+    for col in (13, 14, 15, 16):
+        data[:, col] = _choice(rng, ['S', 'N'], rows, [0.9, 0.1])
+    data[:, 19] = np.where(clase_mod == 'FDO', _ints(rng, rows, 1, 500), '')
+    return raw
+
+# --------------------------------------------------
+def _rpa03g(rng, rows:int, ejercicio:str, grupo:str = '100') -> np.ndarray:
+    raw = _blank(21 + rows, 24)
+    raw[3, 18] = 'Ejercicio: ' + ejercicio
+    raw[5, 18] = 'DETALLE DE DOCUMENTOS ORDENADOS. PARTIDA ' + grupo
+    raw[18, [1, 5, 8, 14, 17, 19, 21, 23]] = [
+        'Entrada', 'Origen', 'Importe', 'Fecha', 'Partida', 'Expediente',
+        'Glosa', 'Beneficiario',
+    ]
+    data = raw[21:]
+    data[:, 1] = (np.arange(rows) + 1).astype(str).astype(object)
+    data[:, 5] = _ints(rng, rows, 1, 20000)
+    data[:, 8] = _num(_amounts(rng, rows, 1e7))
+    data[:, 14] = _dates(rng, rows, ejercicio)
+    data[:, 17] = [f'{grupo[0]}{p:02d}' for p in rng.integers(10, 99, rows).tolist()]
+    data[:, 19] = [f'900{x:06d}{ejercicio}' for x in rng.integers(1, 999999, rows).tolist()]
+    data[:, 21] = _names(rng, rows, 'GLOSA', 200)
+    data[:, 23] = _names(rng, rows, 'BENEFICIARIO')
+    return raw
+
+# --------------------------------------------------
+def _rci02(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(22 + rows, 43)
+    raw[3, 34] = ejercicio
+    raw[6, 25] = 'RESUMEN DIARIO DE COMPROBANTES DE RECURSOS'
+    raw[19, [2, 6, 17, 23, 28, 32, 42]] = [
+        'Entrada', 'Fte', 'Fecha', 'Importe', 'Cta. Cte.', 'Glosa', 'Verif.',
+    ]
+    data = raw[22:]
+    data[:, 2] = (np.arange(rows) + 1).astype(str).astype(object)
+    data[:, 6] = _choice(rng, ['10', '11', '12', '13'], rows)
+    data[:, 10] = _choice(rng, ['CYO', 'REG'], rows)
+    data[:, 13] = _choice(rng, ['NOR', 'OTR'], rows)
+    data[:, 17] = _dates(rng, rows, ejercicio)
+    data[:, 23] = _num(_amounts(rng, rows, 1e8))
+    data[:, 28] = _choice(rng, ['130832-03', '130832-05', '130832-07'], rows)
+    data[:, 32] = _choice(rng, [
+        'RECAUDACION CUOTAS', 'REMANENTE EJERCICIO ANTERIOR',
+        '3% INVICO', 'TRANSFERENCIA FONAVI',
+    ], rows)
+    data[:, 42] = _choice(rng, ['S', 'N'], rows, [0.9, 0.1])
+    return raw
+
+# --------------------------------------------------
+def _rfondo07tp(rng, rows:int, ejercicio:str, tipo:str = 'PA6') -> np.ndarray:
+    raw = _blank(19 + rows, 19)
+    raw[4, 1] = 'RESUMEN DE FONDOS DEL EJERCICIO ' + ejercicio
+    raw[11, 2] = f'Tipo de Comprobante: {tipo}: ANTICIPO DE FONDOS'
+    raw[16, [3, 6, 10, 12, 15, 18]] = [
+        'Nro. Fondo', 'Glosa', 'Fecha', 'Ingresos', 'Egresos', 'Saldo',
+    ]
+    data = raw[19:]
+    ingresos = _amounts(rng, rows, 1e7, zeros=0.5)
+    egresos = np.where(ingresos == 0, _amounts(rng, rows, 1e7), 0)
+    data[:, 3] = (np.arange(rows) + 1).astype(str).astype(object)
+    data[:, 6] = _names(rng, rows, 'FONDO', 200)
+    data[:, 10] = _dates(rng, rows, ejercicio)
+    data[:, 12] = _num(ingresos)
+    data[:, 15] = _num(egresos)
+    data[:, 18] = _num(np.cumsum(ingresos - egresos))
+    return raw
+
+# --------------------------------------------------
+def _rdeu012(rng, rows:int, mes:str) -> np.ndarray:
+    fecha_hasta = _month_end(mes)
+    fuentes = ['10', '11', '13']
+    per_fuente = -(-rows // len(fuentes))
+    raw = _blank(17 + rows + len(fuentes), 20)
+    raw[9, 2] = (
+        'DETALLE DE COMPROBANTES DE GASTOS ORDENADOS Y NO PAGADOS (DEUDA FLOTANTE)'
+    )
+    raw[15, 2] = (
+        f'DEL PERIODO 01/01/{mes[:4]} AL CIERRE DEL '
+        f'{fecha_hasta[8:]}/{fecha_hasta[5:7]}/{mes[:4]}'
+    )
+    raw[16, [4, 7, 10, 13, 17, 19]] = [
+        'Nro. Origen', 'Fecha Aprobado', 'Importe', 'Saldo', 'Glosa', 'Beneficiario',
+    ]
+    row = 17
+    for i, fuente in enumerate(fuentes):
+        n = min(per_fuente, rows - i * per_fuente)
+        raw[row, 6] = fuente
+        data = raw[row + 1:row + 1 + n]
+        importe = _amounts(rng, n, 1e7)
+        data[:, 2] = _ints(rng, n, 1, 3000)
+        data[:, 4] = _ints(rng, n, 1, 20000)
+        data[:, 7] = _dates(rng, n, mes[:4], until=fecha_hasta)
+        data[:, 9] = _choice(rng, ['0', '1'], n)
+        data[:, 10] = _num(importe)
+        data[:, 13] = _num(importe * rng.random(n))
+        data[:, 14] = [f'900{x:06d}{mes[:4]}' for x in rng.integers(1, 999999, n).tolist()]
+        data[:, 15] = _choice(rng, ['130832-03', '130832-05', '130832-07'], n)
+        data[:, 17] = _names(rng, n, 'GLOSA', 200)
+        data[:, 18] = _cuits(rng, n)
+        data[:, 19] = _names(rng, n, 'BENEFICIARIO')
+        row += 1 + n
+    return raw[:row]
+
+# --------------------------------------------------
+def _rdeu012b2_c(rng, rows:int, mes:str) -> np.ndarray:
+    fecha_hasta = _month_end(mes)
+    ejercicios = [str(int(mes[:4]) - i) for i in (2, 1, 0)]
+    per_ejercicio = -(-rows // len(ejercicios))
+    raw = _blank(9 + 1 + rows + 2 * len(ejercicios), 12)
+    raw[3, 4] = 'DETALLE DE COMPROBANTES DE GASTOS ORDENADOS Y NO PAGADOS (DEUDA FLOTANTE)'
+    raw[6, 0] = (
+        f'Desde 01/01/{mes[:4]} Hasta '
+        f'{fecha_hasta[8:]}/{fecha_hasta[5:7]}/{mes[:4]}'
+    )
+    raw[9, [0, 3]] = ['Entidad', '2 - INSTITUTO DE VIVIENDA']
+    row = 10
+    for i, ejercicio in enumerate(ejercicios):
+        n = min(per_ejercicio, rows - i * per_ejercicio)
+        raw[row, :9] = [
+            'Entrada', 'Origen', 'Fuente', 'Org.', 'Importe', 'Saldo',
+            'Expediente', 'Cta. Cte.', 'Glosa',
+        ]
+        data = raw[row + 1:row + 1 + n]
+        importe = _amounts(rng, n, 1e7)
+        data[:, 0] = _ints(rng, n, 1, 3000)
+        data[:, 1] = _ints(rng, n, 1, 20000)
+        data[:, 2] = _choice(rng, ['10', '11', '13'], n)
+        data[:, 3] = _choice(rng, ['0', '1'], n)
+        data[:, 4] = _money(importe, ',')
+        data[:, 5] = _money(importe * rng.random(n), ',')
+        data[:, 6] = [f'900{x:06d}{ejercicio}' for x in rng.integers(1, 999999, n).tolist()]
+        data[:, 7] = _choice(rng, ['130832-03', '130832-05', '130832-07'], n)
+        data[:, 8] = _names(rng, n, 'GLOSA', 200)
+        raw[row + 1 + n, [1, 4]] = ['Total Ejercicio ' + ejercicio, '0,00']
+        row += 2 + n
+    return raw[:row]
+
+# --------------------------------------------------
+def _rcocc31(rng, rows:int, ejercicio:str, cta_contable:str = '1112-2-6') -> np.ndarray:
+    raw = _blank(20 + rows, 30)
+    raw[3, 1] = 'Ejercicio ' + ejercicio
+    raw[9, 2] = f'DETALLES DE MOVIMIENTOS CONTABLES DE LA CUENTA {cta_contable}'
+    raw[10, [6, 11, 12]] = cta_contable.split('-')
+    raw[17, [3, 10, 14, 19, 22, 25, 26, 28, 29]] = [
+        'Entrada', 'Original', 'Fecha', 'Auxiliar 1', 'Auxiliar 2', 'Tipo',
+        'Débitos', 'Créditos', 'Saldo',
+    ]
+    data = raw[20:]
+    debe = _amounts(rng, rows, 1e7, zeros=0.5)
+    haber = np.where(debe == 0, _amounts(rng, rows, 1e7), 0)
+    data[:, 3] = (np.arange(rows) + 1).astype(str).astype(object)
+    data[:, 10] = _ints(rng, rows, 1, 20000)
+    # A few movements are approved after the ejercicio closes
+    data[:, 14] = np.where(
+        rng.random(rows) < 0.02,
+        _dates(rng, rows, str(int(ejercicio) + 1), until=f'{int(ejercicio) + 1}-01-31'),
+        _dates(rng, rows, ejercicio)
+    )
+    data[:, 19] = _cuits(rng, rows)
+    data[:, 22] = _choice(rng, ['', '130832-03', '130832-05'], rows)
+    data[:, 25] = _choice(rng, ['CAP', 'CYO', 'PA6', 'REG'], rows)
+    data[:, 26] = _num(debe)
+    data[:, 28] = _num(haber)
+    data[:, 29] = _num(np.cumsum(debe - haber))
+    return raw
+
+# --------------------------------------------------
+def _rvicon03(rng, rows:int, ejercicio:str) -> np.ndarray:
+    n_rows, leaf_rows, headers, _ = _outline(rows, (250,))
+    raw = _blank(18 + n_rows, 18)
+    raw[3, 2] = 'Ejercicio ' + ejercicio
+    raw[7, 17] = 'rvicon03'
+    raw[15, [2, 6, 7, 8, 15]] = ['Cuenta', 'Saldo Inicial', 'Debe', 'Haber', 'Saldo Final']
+    body = raw[18:]
+    nivel_rows, niveles = headers[0]
+    niveles = [str(1000 + k % 90 * 100) for k in niveles.tolist()]
+    body[nivel_rows, 2] = [n + '    NIVEL ' + n for n in niveles]
+    cuentas = np.arange(rows) % 250
+    body[leaf_rows, 2] = [
+        f'{niveles[i // 250][:3]}{j % 10}-{j % 7}-{j}-CUENTA {j}--'
+        + ('SUB-' if j % 3 == 0 else '') + 'DESC '
+        for i, j in zip(range(rows), cuentas.tolist())
+    ]
+    amounts = rng.integers(0, 100000000, size=(rows, 8)) / 100
+    # Roughly one in four accounts has no movements at all
+    amounts[rng.random(rows) < 0.25] = 0
+    for i, col in enumerate((6, 7, 8, 10, 11, 12, 13, 15)):
+        body[leaf_rows, col] = _num(amounts[:, i])
+    return raw
+
+
+# --------------------------------------------------
+# SGV
+# --------------------------------------------------
+def _barrios(rng, n:int) -> tuple:
+    cod = (np.arange(n) + 1).astype(str).astype(object)
+    return cod, np.array([f'BARRIO {c}' for c in cod], dtype=object)
+
+# --------------------------------------------------
+def _barrios_nuevos(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(4 + rows + 6, 14)
+    raw[0, 0] = _fit('NOMINA DE BARRIOS NUEVOS INCORPORADOS EN EL EJERCICIO', 62) + ejercicio
+    raw[2, [0, 2, 6, 8, 9, 13]] = [
+        'Código', 'Barrio', 'Localidad', 'Entregadas', 'Importe Total', 'Promedio',
+    ]
+    data = raw[4:4 + rows]
+    q = rng.integers(1, 200, rows)
+    total = _amounts(rng, rows, 5e8)
+    data[:, 0], data[:, 2] = _barrios(rng, rows)
+    data[:, 6] = _names(rng, rows, 'LOCALIDAD', 60)
+    data[:, 8] = q.astype(str).astype(object)
+    data[:, 9] = _num(total)
+    data[:, 13] = _num(total / q)
+    raw[-6, [2, 8, 9]] = ['TOTAL', str(q.sum()), _num([total.sum()])[0]]
+    raw[-1, 0] = 'Fin del informe'
+    return raw
+
+# --------------------------------------------------
+def _resumen_facturado(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(8 + 12 + 1, 15)
+    raw[3, 7] = 'Resumen Facturado Ejercicio ' + ejercicio
+    raw[6, [2, 3, 14]] = ['Mes', 'Amortización', 'Total Facturado']
+    data = raw[8:20]
+    data[:, 2] = (np.arange(12) + 1).astype(str).astype(object)
+    cols = [3, 4, 5, 6, 8, 9, 10, 11, 13]
+    amounts = rng.integers(0, 1e10, size=(12, len(cols))) / 100
+    for i, col in enumerate(cols):
+        data[:, col] = _num(amounts[:, i])
+    data[:, 14] = _num(amounts.sum(axis=1))
+    raw[-1, 2] = 'TOTAL'
+    return raw
+
+# --------------------------------------------------
+def _resumen_recaudado(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(8 + 12 + 1, 16)
+    raw[3, 6] = _fit('Resumen Recaudado - Período', 41) + ejercicio + ' (acumulado)'
+    raw[6, [2, 3, 15]] = ['Mes', 'Amortización', 'Total Recaudado']
+    data = raw[8:20]
+    data[:, 2] = (np.arange(12) + 1).astype(str).astype(object)
+    cols = [3, 4, 5, 7, 8, 9, 10, 11, 13, 14]
+    amounts = rng.integers(0, 1e10, size=(12, len(cols))) / 100
+    for i, col in enumerate(cols):
+        data[:, col] = _num(amounts[:, i])
+    data[:, 15] = _num(amounts.sum(axis=1))
+    raw[-1, 2] = 'TOTAL'
+    return raw
+
+# --------------------------------------------------
+def _saldo_barrio(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(5 + rows + 1, 6)
+    raw[0, 0] = f'INFORME DE SALDOS POR BARRIO AL 31/12/{ejercicio}'
+    raw[3, :] = ['Código', 'Barrio', 'Saldo Vencido', 'Saldo Actual', '', 'Localidad']
+    data = raw[5:-1]
+    data[:, 0], data[:, 1] = _barrios(rng, rows)
+    data[:, 2] = _num(_amounts(rng, rows, 1e8))
+    data[:, 3] = _num(_amounts(rng, rows, 5e8))
+    data[:, 5] = _names(rng, rows, 'LOCALIDAD', 60)
+    raw[-1, 1] = 'TOTAL'
+    return raw
+
+# --------------------------------------------------
+def _saldo_barrio_variacion(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(6 + rows + 1, 7)
+    raw[1, 0] = f'EVOLUCIÓN DE SALDOS POR BARRIO ({ejercicio})'
+    raw[4, :] = [
+        'Código', 'Barrio', 'Saldo Inicial', 'Amortización', 'Cambios', '', 'Saldo Final',
+    ]
+    data = raw[6:-1]
+    inicial = _amounts(rng, rows, 5e8)
+    amortizacion = inicial * rng.random(rows) * 0.2
+    cambios = _amounts(rng, rows, 1e6) - 5e5
+    data[:, 0], data[:, 1] = _barrios(rng, rows)
+    data[:, 2] = _num(inicial)
+    data[:, 3] = _num(amortizacion)
+    data[:, 4] = _num(cambios)
+    data[:, 6] = _num(inicial - amortizacion + cambios)
+    raw[-1, 1] = 'TOTAL'
+    return raw
+
+# --------------------------------------------------
+def _saldo_motivo(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(4 + rows + 1, 4)
+    raw[0, 0] = f'EVOLUCIÓN DE SALDOS POR MOTIVO ({ejercicio})'
+    raw[2, 1:] = ['Código', 'Motivo', 'Importe']
+    data = raw[4:-1]
+    data[:, 1] = _ints(rng, rows, 100, 999)
+    data[:, 2] = ['MOTIVO ' + c for c in data[:, 1]]
+    data[:, 3] = _num(_amounts(rng, rows, 1e8))
+    raw[-1, 2] = 'TOTAL'
+    return raw
+
+# --------------------------------------------------
+def _saldo_motivo_por_barrio(rng, rows:int, ejercicio:str) -> np.ndarray:
+    """Motivos concatenated by download_report"""
+    raw = _blank(1 + rows, 6)
+    raw[0] = ['cod_motivo', 'motivo', 'cod_barrio', 'barrio', 'importe', 'ejercicio']
+    data = raw[1:]
+    data[:, 0] = _ints(rng, rows, 100, 130)
+    data[:, 1] = ['MOTIVO ' + c for c in data[:, 0]]
+    data[:, 2], data[:, 3] = _barrios(rng, rows)
+    data[:, 4] = _num(_amounts(rng, rows, 1e7))
+    data[:, 5] = ejercicio
+    return raw
+
+# --------------------------------------------------
+def _saldo_motivo_por_barrio_provisorio(rng, rows:int, ejercicio:str) -> np.ndarray:
+    """One motivo as exported by SGV (see SaldoMotivoPorBarrio.transform_df)"""
+    raw = _blank(4 + rows + 1, 7)
+    raw[0, 0] = f'INFORME EVOLUCION SALDOS POR MOTIVOS - EJERCICIO {ejercicio}'
+    raw[2, 1:] = ['Código', 'Barrio', 'Importe', 'Cuotas', 'Vencidas', 'Localidad']
+    data = raw[4:-1]
+    data[:, 1], data[:, 2] = _barrios(rng, rows)
+    data[:, 3] = _num(_amounts(rng, rows, 1e7))
+    data[:, 4] = _ints(rng, rows, 1, 240)
+    data[:, 5] = _ints(rng, rows, 0, 24)
+    data[:, 6] = _names(rng, rows, 'LOCALIDAD', 60)
+    raw[-1, 2] = 'TOTAL'
+    return raw
+
+# --------------------------------------------------
+def _saldo_recuperos_cobrar_variacion(rng, rows:int, ejercicio:str) -> np.ndarray:
+    conceptos = ['SALDO INICIAL:', 'FACTURACION:', 'AJUSTES:', 'COBRANZA:', 'SALDO FINAL:']
+    per_concepto = max(-(-rows // len(conceptos)) - 1, 0)
+    raw = _blank(2 + len(conceptos) * (1 + per_concepto), 7)
+    raw[0, 0] = f'VARIACIÓN DE SALDOS DE RECUPEROS A COBRAR - EJERCICIO {ejercicio}'
+    row = 2
+    for concepto in conceptos:
+        raw[row, 0] = concepto
+        raw[row, 6] = _num(_amounts(rng, 1, 1e9))[0]
+        # Detail rows carry their amount one column to the left
+        raw[row + 1:row + 1 + per_concepto, 1] = _names(rng, per_concepto, 'DETALLE', 50)
+        raw[row + 1:row + 1 + per_concepto, 5] = _num(_amounts(rng, per_concepto, 1e7))
+        row += 1 + per_concepto
+    return raw
+
+
+# --------------------------------------------------
+# SGO
+# --------------------------------------------------
+def _listado_obras(rng, rows:int, ejercicio:str = '2024') -> np.ndarray:
+    raw = _blank(4 + rows, 51)
+    raw[0, 0] = 'Listado de Obras'
+    raw[3, :] = [
+        'Codigo Obra', 'Mes Basico Obra', 'Contrato', 'Obra', 'Mes Basico Contrato',
+        'Tipo', 'Localidad', 'Contratista', 'Activa', 'Monto', 'Monto Total',
+        'Representante', 'Operatoria', 'Rubros', 'Inspector', 'Iniciador',
+        'Estado', 'Inicio', 'Contrato', '', 'Fin', 'Plazo', 'Fin Est.',
+        'Ampliación', 'Fin Ampl.', 'Av. Fis. Real', 'Av. Fciero. Real',
+        'Av. Fis. Est.', 'Av. Fciero. Est.', 'Certificado', 'Certificado Obra',
+        'Pagado', '', 'Ult. Certif.', 'Ult. Certif. BC', 'Mes Certif.',
+        'Año Certif.', 'Fecha Certif.', 'Anticipo', 'Cant. Anticipo',
+        '% Anticipo', 'Certif. Anticipo', 'Fdo. Reparo', 'Desc. Fdo. Reparo',
+        'Redeterminado', 'Ult. Redet.', 'Mes Ult. Basico', 'Año Ult. Basico',
+        'Ult. Medición', 'Mes Medición', 'Año Medición',
+    ]
+    data = raw[4:]
+    year = int(ejercicio)
+    cod = np.array([f'{x:04d}' for x in range(1, rows + 1)], dtype=object)
+    monto = _amounts(rng, rows, 1e9)
+    avance = np.round(rng.random((rows, 4)), 4)
+    certificado = monto * avance[:, 1]
+    certificada = rng.random(rows) < 0.8
+
+    def mes_anio(n):
+        return [f'{m}/{a}' for m, a in zip(
+            rng.integers(1, 13, n).tolist(), rng.integers(year - 5, year + 1, n).tolist()
+        )]
+
+    def fechas(n, empty = 0.0):
+        values = _dates(rng, n, str(year - int(rng.integers(0, 4))))
+        return np.where(rng.random(n) < empty, '', values)
+
+    data[:, 0] = cod
+    data[:, 1] = mes_anio(rows)
+    data[:, 2] = ['C' + c for c in cod]
+    data[:, 3] = ['OBRA ' + c for c in cod]
+    data[:, 4] = mes_anio(rows)
+    data[:, 5] = _choice(rng, ['VIVIENDAS', 'INFRAESTRUCTURA', 'MEJORAMIENTO'], rows)
+    data[:, 6] = _names(rng, rows, 'LOCALIDAD', 60)
+    data[:, 7] = _names(rng, rows, 'CONTRATISTA', 120)
+    data[:, 8] = _choice(rng, ['S', 'N'], rows)
+    data[:, 9] = _num(monto)
+    data[:, 10] = _num(monto * 1.1)
+    data[:, 11] = _names(rng, rows, 'REPRESENTANTE', 50)
+    data[:, 12] = _choice(rng, ['FONAVI', 'PROPIA', 'NACION'], rows)
+    data[:, 13] = _ints(rng, rows, 1, 40)
+    data[:, 14] = _ints(rng, rows, 1, 30)
+    data[:, 15] = _names(rng, rows, 'INICIADOR', 20)
+    data[:, 16] = _choice(rng, ['EN EJECUCION', 'FINALIZADA', 'PARALIZADA'], rows)
+    data[:, 17] = fechas(rows)
+    data[:, 18] = fechas(rows)
+    data[:, 20] = fechas(rows, 0.5)
+    data[:, 21] = _ints(rng, rows, 90, 720)
+    data[:, 22] = fechas(rows)
+    data[:, 23] = _ints(rng, rows, 0, 180)
+    data[:, 24] = fechas(rows, 0.5)
+    for i, col in enumerate((25, 26, 27, 28)):
+        data[:, col] = _num(avance[:, i])
+    data[:, 29] = _num(certificado)
+    data[:, 30] = _num(certificado * 0.95)
+    data[:, 31] = _num(certificado * 0.9)
+    data[:, 33] = _ints(rng, rows, 1, 40)
+    data[:, 34] = _ints(rng, rows, 0, 40)
+    data[:, 35] = np.where(certificada, _ints(rng, rows, 1, 13), '')
+    data[:, 36] = np.where(certificada, _ints(rng, rows, year - 3, year + 1), '')
+    data[:, 37] = fechas(rows, 0.2)
+    data[:, 38] = _num(monto * 0.1)
+    data[:, 39] = _ints(rng, rows, 0, 3)
+    data[:, 40] = _num(np.round(rng.random(rows) * 0.2, 4))
+    data[:, 41] = _ints(rng, rows, 0, 10)
+    data[:, 42] = _num(certificado * 0.05)
+    data[:, 43] = _num(certificado * 0.01)
+    data[:, 44] = _num(monto * rng.uniform(1, 1.5, rows))
+    data[:, 45] = _ints(rng, rows, 0, 10)
+    data[:, 46] = np.where(certificada, _ints(rng, rows, 1, 13), '')
+    data[:, 47] = np.where(certificada, _ints(rng, rows, year - 3, year + 1), '')
+    data[:, 48] = _ints(rng, rows, 0, 40)
+    data[:, 49] = np.where(certificada, _ints(rng, rows, 1, 13), '')
+    data[:, 50] = np.where(certificada, _ints(rng, rows, year - 3, year + 1), '')
+    return raw
+
+
+# --------------------------------------------------
+# SGF (every csv row repeats the report header fields)
+# --------------------------------------------------
+def _resumen_rend_prov(rng, rows:int, ejercicio:str, origen:str = 'EPAM') -> np.ndarray:
+    raw = _blank(rows, 42)
+    raw[:, 1] = 'Resumen de Rendiciones (Detalle) por Proveedor'
+    raw[:, 6] = f'Origen = "{origen}" - Ejercicio = {ejercicio}'
+    beneficiario = _names(rng, rows, 'PROVEEDOR', 300)
+    beneficiario[rng.random(rows) < 0.02] = 'CREDITO ESPECIAL'
+    bruto = _amounts(rng, rows, 1e7)
+    retenciones = bruto[:, None] * rng.random((rows, 7)) * 0.02
+    neto = bruto - retenciones.sum(axis=1)
+    # OBRAS rendiciones have no destino and fewer retenciones
+    if origen == 'OBRAS':
+        cols = dict(
+            beneficiario=23, cta_cte=24, libramiento=25, fecha=26, movimiento=27,
+            importes=[28, 29, 30, 31, 32, 33, 34, 35]
+        )
+    else:
+        cols = dict(
+            beneficiario=26, destino=27, cta_cte=28, libramiento=29, fecha=30,
+            movimiento=31, importes=[32, 33, 34, 35, 36, 37, 38, 39, 40, 41]
+        )
+        raw[:, cols['destino']] = _names(rng, rows, 'DESTINO', 40)
+    raw[:, cols['beneficiario']] = beneficiario
+    raw[:, cols['cta_cte']] = _choice(rng, ['130832-03', '130832-05', '22110034-02'], rows)
+    raw[:, cols['libramiento']] = [f'{x}/{ejercicio[-2:]}' for x in range(1, rows + 1)]
+    raw[:, cols['fecha']] = _dates(rng, rows, ejercicio, '%d/%m/%Y')
+    raw[:, cols['movimiento']] = _ints(rng, rows, 1, 99999)
+    importes = cols['importes']
+    raw[:, importes[0]] = _money(bruto)
+    for i, col in enumerate(importes[1:-1]):
+        raw[:, col] = _money(retenciones[:, i % 7])
+    raw[:, importes[-1]] = _money(neto)
+    return raw
+
+# --------------------------------------------------
+def _certificados_obras(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(rows, 49)
+    raw[:, 1] = 'Resumen de Certificaciones: '
+    raw[:, 2] = 'Ejercicio ' + ejercicio
+    # The first certificado of each beneficiario carries its name and a
+    # TOTALES mark, and its amounts one column to the right
+    first = np.zeros(rows, dtype=bool)
+    first[::5] = True
+    shift = first.astype(int)
+    index = np.arange(rows)
+    monto = _amounts(rng, rows, 5e7)
+    values = np.column_stack([
+        monto, monto * 0.05, monto * 0.01, monto * 0.94,
+        monto * 0.03, monto * 0.01, monto * 0.02, monto * 0.005, monto * 0.03,
+    ])
+    retenciones = values[:, 4:].sum(axis=1)
+    values = np.column_stack([values, retenciones, values[:, 3] - retenciones])
+    raw[first, 21] = _names(rng, int(first.sum()), 'CONTRATISTA', 120)
+    raw[index, 21 + shift] = [f'{x:04d}-OBRA {x}' for x in rng.integers(1, 3000, rows).tolist()]
+    raw[index, 22 + shift] = _ints(rng, rows, 1, 40)
+    for i in range(values.shape[1]):
+        raw[index, 25 + i + shift] = _money(values[:, i])
+    raw[first, 37] = 'TOTALES'
+    return raw
+
+# --------------------------------------------------
+def _listado_prov(rng, rows:int, ejercicio:str = None) -> np.ndarray:
+    raw = _blank(rows, 16)
+    raw[:, 1] = 'Listado de Proveedores'
+    raw[:, 9] = (np.arange(rows) + 1).astype(str).astype(object)
+    raw[:, 10] = [f'PROVEEDOR {x}' for x in range(1, rows + 1)]
+    raw[:, 11] = [f'CALLE {x} {n}' for x, n in zip(
+        range(1, rows + 1), rng.integers(1, 5000, rows).tolist()
+    )]
+    raw[:, 12] = _names(rng, rows, 'LOCALIDAD', 60)
+    raw[:, 13] = _ints(rng, rows, 3794000000, 3794999999)
+    raw[:, 14] = _cuits(rng, rows, '-')
+    raw[rng.random(rows) < 0.05, 14] = ''
+    raw[:, 15] = _choice(rng, ['RESPONSABLE INSCRIPTO', 'MONOTRIBUTO', 'EXENTO'], rows)
+    return raw
+
+# --------------------------------------------------
+def _resumen_rend_obras(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(rows, 56)
+    raw[:, 1] = 'Resumen de Rendiciones (por Obras)'
+    # The first rendicion of each obra names it and is laid out eleven
+    # columns to the right
+    first = np.zeros(rows, dtype=bool)
+    first[::4] = True
+    shift = np.where(first, 11, 0)
+    index = np.arange(rows)
+    bruto = _amounts(rng, rows, 1e7)
+    retenciones = bruto[:, None] * rng.random((rows, 8)) * 0.01
+    raw[first, 25] = [f'{x:04d} - OBRA {x}' for x in rng.integers(1, 3000, int(first.sum())).tolist()]
+    raw[first, 55] = 'x'
+    raw[index, 25 + shift] = np.where(
+        first, raw[:, 25], _names(rng, rows, 'PROVEEDOR', 300)
+    )
+    raw[first, 36] = _names(rng, int(first.sum()), 'PROVEEDOR', 300)
+    raw[index, 26 + shift] = [f'{x}/{ejercicio[-2:]}' for x in range(1, rows + 1)]
+    raw[index, 27 + shift] = _names(rng, rows, 'DESTINO', 40)
+    raw[index, 28 + shift] = _dates(rng, rows, ejercicio, '%d/%m/%Y')
+    raw[index, 29 + shift] = _ints(rng, rows, 1, 99999)
+    raw[index, 30 + shift] = _money(bruto - retenciones.sum(axis=1))
+    for i in range(8):
+        raw[index, 31 + i + shift] = _money(retenciones[:, i])
+    raw[index, 39 + shift] = _money(bruto)
+    return raw
+
+
+# --------------------------------------------------
+# SSCC
+# --------------------------------------------------
+def _banco_invico(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(rows, 29)
+    raw[:, 1] = 'Consulta General de Movimientos'
+    raw[:, 20] = _dates(rng, rows, ejercicio, '%d/%m/%Y')
+    raw[:, 21] = _choice(
+        rng, ['DEBITO', 'DEPOSITO', 'CHEQUE', 'TRANSFERENCIA'], rows, [0.3, 0.3, 0.2, 0.2]
+    )
+    raw[:, 22] = _choice(rng, ['130832-03', '130832-05', '130832-07', '22110034-02'], rows)
+    raw[:, 23] = _names(rng, rows, 'CONCEPTO', 100)
+    raw[:, 24] = _names(rng, rows, 'BENEFICIARIO')
+    raw[:, 25] = 'PESOS'
+    raw[:, 26] = _ints(rng, rows, 1, 9999)
+    raw[:, 27] = _choice(rng, [
+        '001-RECAUDACION', '010-TRANSFERENCIAS', '033-PAGO PROVEEDORES',
+        '040-GASTOS BANCARIOS', '120-FONAVI',
+    ], rows)
+    raw[:, 28] = _money(_amounts(rng, rows, 1e7) * rng.choice([-1, 1], rows))
+    return raw
+
+# --------------------------------------------------
+def _listado_imputaciones(rng, rows:int, ejercicio:str = None) -> np.ndarray:
+    raw = _blank(rows, 10)
+    raw[:, 1] = 'Listado de Imputaciones'
+    raw[:, 6] = (np.arange(rows) + 1).astype(str).astype(object)
+    raw[:, 7] = [f'IMPUTACION {x}' for x in range(1, rows + 1)]
+    raw[:, 8] = _choice(rng, ['Ingreso', 'Egreso'], rows)
+    raw[:, 9] = _names(rng, rows, 'FONAVI', 30)
+    return raw
+
+# --------------------------------------------------
+def _sdo_final_banco_invico(rng, rows:int, ejercicio:str) -> np.ndarray:
+    raw = _blank(rows, 15)
+    raw[:, 1] = 'Informe de Saldos de Cuentas'
+    raw[:, 5] = 'Ejercicio: ' + ejercicio
+    raw[:, 11] = [f'{130832 + x}-{x % 10:02d}' for x in range(rows)]
+    raw[:, 12] = _names(rng, rows, 'CUENTA', 100)
+    raw[:, 13] = _choice(rng, ['BANCO DE CORRIENTES', 'BANCO NACION'], rows)
+    raw[:, 14] = _money(_amounts(rng, rows, 1e9), ',')
+    return raw
+
+# --------------------------------------------------
+def _ctas_ctes(rng, rows:int, ejercicio:str = None) -> np.ndarray:
+    columns = [
+        'map_to', 'sscc_cta_cte', 'real_cta_cte', 'siif_recursos_cta_cte',
+        'siif_gastos_cta_cte', 'siif_contabilidad_cta_cte', 'sgf_cta_cte',
+        'siif_cta_cte', 'icaro_cta_cte',
+    ]
+    raw = _blank(1 + rows, len(columns))
+    raw[0] = columns
+    ctas = np.array([f'{130832 + x}-{x % 10:02d}' for x in range(rows)], dtype=object)
+    raw[1:, :] = ctas[:, None]
+    return raw
+
+
+def _named(suffix:str):
+    return lambda period, **params: period + suffix
+
+def _fixed(file_name:str):
+    return lambda period, **params: file_name
+
+
+# Keys are cli.REPORTS names (plus the SGV motivo export)
+FIXTURES = {
+    # SIIF
+    'rcg01_uejp': Fixture(_rcg01_uejp, _named('-rcg01_uejp.xls'), numeric=(8,)),
+    'rpa03g': Fixture(
+        _rpa03g,
+        lambda period, grupo='100': f'{period}-gto_rpa03g (Gpo {grupo}).xls',
+        numeric=(8,)
+    ),
+    'rci02': Fixture(_rci02, _named('-rci02.xls'), numeric=(23,)),
+    'rog01': Fixture(_rog01, _fixed('detalle_partidas.xls'), period_arg=None),
+    'rdeu012': Fixture(
+        _rdeu012, lambda mes: mes[0:4] + mes[-2:] + '-rdeu012.xls',
+        period_arg='meses', numeric=(10, 13)
+    ),
+    'rdeu012b2_c': Fixture(
+        _rdeu012b2_c, lambda mes: mes[0:4] + mes[-2:] + '-rdeu012b2_c.csv',
+        period_arg='meses'
+    ),
+    'rfp_p605b': Fixture(_rfp_p605b, _named('-rfp_p605b.xls'), numeric=(19, 22)),
+    'rcocc31': Fixture(
+        _rcocc31,
+        lambda period, cta_contable='1112-2-6': f'{period}-rcocc31 ({cta_contable}).xls',
+        numeric=(26, 28, 29)
+    ),
+    'rf610': Fixture(_rf610, _named('-rf610.xls'), numeric=(38, 44, 49, 55, 60)),
+    'rf602': Fixture(
+        _rf602, _named('-rf602.xls'), numeric=(13, 14, 15, 16, 18, 20)
+    ),
+    'ri102': Fixture(_ri102, _named('-ri102.xls'), numeric=(14, 15, 19, 22, 25)),
+    'rvicon03': Fixture(
+        _rvicon03, _named('-rvicon03.xls'), numeric=(6, 7, 8, 10, 11, 12, 13, 15)
+    ),
+    'rfondo07tp': Fixture(
+        _rfondo07tp,
+        lambda period, tipo='PA6': f'{period}-rfondo07tp ({tipo}).xls',
+        numeric=(12, 15, 18)
+    ),
+    # Gestion Viviendas
+    'barrios_nuevos': Fixture(
+        _barrios_nuevos, _named('-InformeBarriosNuevos.xlsx'), numeric=(9, 13),
+        rows=100
+    ),
+    'resumen_facturado': Fixture(
+        _resumen_facturado, _named('-InformeResumenFacturado.xlsx'),
+        numeric=(3, 4, 5, 6, 8, 9, 10, 11, 13, 14), rows=12
+    ),
+    'resumen_recaudado': Fixture(
+        _resumen_recaudado, _named('-InformeResumenRecaudado.xlsx'),
+        numeric=(3, 4, 5, 7, 8, 9, 10, 11, 13, 14, 15), rows=12
+    ),
+    'saldo_barrio': Fixture(
+        _saldo_barrio, _named('-InformeSaldosPorBarrio.xlsx'), numeric=(2, 3)
+    ),
+    'saldo_barrio_variacion': Fixture(
+        _saldo_barrio_variacion, _named('-InformeEvolucionDeSaldosPorBarrio.xlsx'),
+        numeric=(2, 3, 4, 6)
+    ),
+    'saldo_motivo': Fixture(
+        _saldo_motivo, _named('-InformeEvolucionDeSaldosPorMotivos.xlsx'),
+        numeric=(3,), rows=100
+    ),
+    'saldo_motivo_por_barrio': Fixture(
+        _saldo_motivo_por_barrio,
+        _named('-RecuperosInformeEvoSaldosPorMotivoPorBarrio.xlsx'), numeric=(4,)
+    ),
+    'saldo_motivo_por_barrio_provisorio': Fixture(
+        _saldo_motivo_por_barrio_provisorio, _named('-Provisorio 101.xlsx'),
+        numeric=(3,)
+    ),
+    'saldo_recuperos_cobrar_variacion': Fixture(
+        _saldo_recuperos_cobrar_variacion,
+        _named('-InformeVariacionSaldosRecuperosCobrar.xlsx'), numeric=(5, 6),
+        rows=50
+    ),
+    # Gestion Obras
+    'listado_obras': Fixture(
+        _listado_obras, _fixed('Obras Completo.xls'), period_arg=None,
+        numeric=(9, 10, 25, 26, 27, 28, 29, 30, 31, 38, 40, 42, 43, 44)
+    ),
+    # SGF
+    'resumen_rend_prov': Fixture(
+        _resumen_rend_prov,
+        lambda period, origen='EPAM': f'{period} Resumen de Rendiciones {origen}.csv'
+    ),
+    'certificados_obras': Fixture(
+        _certificados_obras, _named(' Informe para Contable.csv')
+    ),
+    'listado_prov': Fixture(
+        _listado_prov, _fixed('Listado de Proveedores.csv'), period_arg=None
+    ),
+    'resumen_rend_obras': Fixture(
+        _resumen_rend_obras, _named(' Resumen de Rendiciones EPAM por Obra.csv')
+    ),
+    # SSCC
+    'banco_invico': Fixture(
+        _banco_invico, _named(' - Bancos - Consulta General de Movimientos.csv')
+    ),
+    'ctas_ctes': Fixture(
+        _ctas_ctes, _fixed('ctas_ctes.xlsx'), period_arg=None, header=True, rows=50
+    ),
+    'listado_imputaciones': Fixture(
+        _listado_imputaciones, _fixed('Bancos - Listado de Imputaciones.csv'),
+        period_arg=None, rows=200
+    ),
+    'sdo_final_banco_invico': Fixture(
+        _sdo_final_banco_invico, _named(' - saldos_sscc.csv'), rows=100
+    ),
+}
+
+
+# --------------------------------------------------
+def _default_period(fixture:Fixture) -> str:
+    # Fixed, so that a seed always gives the same files
+    return '2024-12' if fixture.period_arg == 'meses' else '2024'
+
+# --------------------------------------------------
+def _build(name:str, rows:int, seed:int, period:str, params:dict) -> np.ndarray:
+    fixture = FIXTURES[name]
+    # Each report gets its own stream: same files whatever else is built
+    rng = np.random.default_rng([seed, zlib.crc32(name.encode())])
+    period = period or _default_period(fixture)
+    return fixture.build(rng, rows or fixture.rows, period, **params)
+
+# --------------------------------------------------
+def synthetic_report(
+    name:str, rows:int = None, seed:int = 0, period:str = None, **params
+) -> pd.DataFrame:
+    """
+    Report name (a FIXTURES key) as read_xls / read_csv read it, without
+    writing a file (e.g. to time transform_df alone).
+    :param rows: data rows (default: the fixture's). Reports with a fixed
+    number of rows (resumen_facturado's months) ignore it.
+    :param period: ejercicio ('2024') or mes ('2024-12').
+    :param params: report specific (rpa03g grupo, rcocc31 cta_contable,
+    rfondo07tp tipo, resumen_rend_prov origen).
+    """
+    raw = _build(name, rows, seed, period, params)
+    if FIXTURES[name].header:
+        return pd.DataFrame(raw[1:], columns=raw[0])
+    return pd.DataFrame(raw, columns=[str(x) for x in range(raw.shape[1])])
+
+# --------------------------------------------------
+def _write_xlsx(raw:np.ndarray, path:str, numeric:tuple) -> None:
+    from openpyxl import Workbook
+    if len(raw) > XLSX_MAX_ROWS:
+        raise ValueError(
+            f"{len(raw)} rows do not fit in a worksheet ({XLSX_MAX_ROWS}), "
+            "use synthetic_report instead"
+        )
+    numeric = set(numeric)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for values in raw.tolist():
+        row = [None if value == '' else value for value in values]
+        for col in numeric:
+            try:
+                row[col] = float(row[col])
+            except (TypeError, ValueError):
+                pass
+        sheet.append(row)
+    workbook.save(path)
+
+# --------------------------------------------------
+def _write_xls(raw:np.ndarray, path:str, numeric:tuple) -> bool:
+    """Excel 97 (BIFF8) workbook, as SIIF and SGO export them, so that
+    read_xls times are xlrd's. False (nothing written) when xlwt is
+    missing or raw does not fit in a BIFF8 sheet.
+    Package requirement:
+        -   pip install xlwt
+    """
+    try:
+        import xlwt
+    except ImportError:
+        return False
+    if len(raw) > XLS_MAX_ROWS or raw.shape[1] > XLS_MAX_COLS:
+        return False
+    numeric = set(numeric)
+    workbook = xlwt.Workbook(encoding='utf-8')
+    sheet = workbook.add_sheet('Sheet1')
+    for i, values in enumerate(raw.tolist()):
+        sheet_row = sheet.row(i)
+        for j, value in enumerate(values):
+            if value == '':
+                continue
+            if j in numeric:
+                try:
+                    value = float(value)
+                except ValueError:
+                    pass
+            sheet_row.write(j, value)
+        # xlwt keeps every row otherwise
+        if i % 1000 == 999:
+            sheet.flush_row_data()
+    workbook.save(path)
+    return True
+
+# --------------------------------------------------
+def _write_csv(raw:np.ndarray, path:str) -> None:
+    with open(path, 'w', newline='', encoding='ISO-8859-1') as f:
+        csv.writer(f).writerows(raw.tolist())
+
+# --------------------------------------------------
+def write_fixture(
+    name:str, dir_path:str, rows:int = None, seed:int = 0,
+    period:str = None, **params
+) -> str:
+    """
+    Write report name to dir_path with the file name it is downloaded
+    with. SIIF / SGO .xls files are real BIFF8 workbooks (xlwt); without
+    xlwt, or past 65536 rows, they are written as xlsx, which read_xls
+    (pandas) opens by content, but then read times are not the xls ones
+    (see file_format). Returns the path.
+    """
+    fixture = FIXTURES[name]
+    period = period or _default_period(fixture)
+    raw = _build(name, rows, seed, period, params)
+    os.makedirs(dir_path, exist_ok=True)
+    path = os.path.join(dir_path, fixture.file_name(period, **params))
+    if fixture.is_csv:
+        _write_csv(raw, path)
+    elif not (path.endswith('.xls') and _write_xls(raw, path, fixture.numeric)):
+        if path.endswith('.xls'):
+            warnings.warn(
+                f"{os.path.basename(path)} written as xlsx (xlwt missing or "
+                f"{len(raw)} rows over {XLS_MAX_ROWS}): its read times are "
+                "not representative of SIIF / SGO xls files"
+            )
+        _write_xlsx(raw, path, fixture.numeric)
+    return path
+
+# --------------------------------------------------
+def file_format(path:str) -> str:
+    """'xls' (BIFF), 'xlsx' or 'csv', by content: fixtures named .xls may
+    hold an xlsx workbook (see write_fixture)"""
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    if magic == b'\xd0\xcf\x11\xe0':
+        return 'xls'
+    if magic == b'PK\x03\x04':
+        return 'xlsx'
+    return 'csv'
+
+# --------------------------------------------------
+def write_fixtures(
+    dir_path:str, names:list = None, rows:int = None, seed:int = 0,
+    periods:list = None
+) -> list[str]:
+    """Every report of names (default: all) for each period"""
+    paths = []
+    for name in names or FIXTURES:
+        fixture = FIXTURES[name]
+        for period in (periods if fixture.period_arg else None) or [None]:
+            if period is not None and fixture.period_arg == 'meses' and len(period) == 4:
+                period = period + '-12'
+            paths.append(write_fixture(name, dir_path, rows, seed, period))
+    return paths
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Write synthetic reports for offline tests and benchmarks",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        'names', nargs='*',
+        help = "Reports (default: all): " + ', '.join(FIXTURES))
+
+    parser.add_argument(
+        '-d', '--dir',
+        default = 'fixtures',
+        type=str,
+        help = "Folder to write the reports to")
+
+    parser.add_argument(
+        '-n', '--rows',
+        default = None,
+        type=int,
+        help = "Data rows of each report (default: the report's own)")
+
+    parser.add_argument(
+        '-s', '--seed',
+        default = 0,
+        type=int,
+        help = "Random seed")
+
+    parser.add_argument(
+        '-e', '--periods', nargs='*', default=None,
+        help = "Ejercicios (2024) or meses (2024-06)")
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    for path in write_fixtures(args.dir, args.names, args.rows, args.seed, args.periods):
+        print(f"{path}: {os.path.getsize(path)} bytes")
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy/src
+    # python -m invicodatpy.utils.fixtures -d ./fixtures -n 5000
+    # python -m invicodatpy.utils.fixtures rf602 banco_invico -n 1000000 -e 2023 2024
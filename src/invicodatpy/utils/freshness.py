@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Decide which report periods need to be downloaded again, from a
+manifest of previous downloads
+"""
+
+
+__all__ = ["DownloadManifest", "FreshnessPolicy"]
+
+
+import datetime as dt
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+
+
+# --------------------------------------------------
+def period_end(period:str) -> dt.date:
+    """Last day of a 'yyyy', 'yyyy-mm' or 'yyyymm' period"""
+    period = str(period).replace('-', '').replace('/', '')
+    year = int(period[:4])
+    if len(period) < 6:
+        return dt.date(year, 12, 31)
+    month = int(period[4:6])
+    if month == 12:
+        return dt.date(year, 12, 31)
+    return dt.date(year, month + 1, 1) - dt.timedelta(days=1)
+
+# --------------------------------------------------
+def _month_end_after(date:dt.date, months:int) -> dt.date:
+    """Last day of the month months after date's month"""
+    month = date.month - 1 + months
+    return period_end(f'{date.year + month // 12}{month % 12 + 1:02d}')
+
+
+@dataclass
+class DownloadManifest():
+    """
+    JSON file recording every downloaded report file:
+    {report: {period: {'file': ..., 'downloaded_at': iso datetime, 'size': ...}}}
+    """
+    path:str
+    entries:dict = field(init=False, repr=False, default_factory=dict)
+    _lock:threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+
+    # --------------------------------------------------
+    def __post_init__(self):
+        if os.path.isfile(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    # --------------------------------------------------
+    def get(self, report:str, period:str) -> dict:
+        return self.entries.get(report, {}).get(str(period))
+
+    # --------------------------------------------------
+    def record(self, report:str, period:str, file_path:str) -> None:
+        with self._lock:
+            self.entries.setdefault(report, {})[str(period)] = {
+                'file': os.path.basename(file_path),
+                'downloaded_at': dt.datetime.now().isoformat(timespec='seconds'),
+                'size': os.path.getsize(file_path),
+            }
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+@dataclass
+class FreshnessPolicy():
+    """
+    A period is closed once grace_months passed since its end (SIIF keeps
+    taking entries of the previous ejercicio for a while). Closed periods
+    are downloaded once after closing and never again; open periods are
+    downloaded again when the local file is older than ttl_hours.
+    :param manifest_name: manifest file, relative to each download folder.
+    """
+    ttl_hours:float = 6
+    grace_months:int = 3
+    manifest_name:str = '.downloads_manifest.json'
+    _manifests:dict = field(init=False, repr=False, default_factory=dict)
+
+    # --------------------------------------------------
+    def manifest(self, dir_path:str) -> DownloadManifest:
+        path = os.path.join(dir_path, self.manifest_name)
+        if path not in self._manifests:
+            self._manifests[path] = DownloadManifest(path)
+        return self._manifests[path]
+
+    # --------------------------------------------------
+    def closed_on(self, period:str, grace_months:int = None) -> dt.date:
+        if grace_months is None:
+            grace_months = self.grace_months
+        return _month_end_after(period_end(period), grace_months)
+
+    # --------------------------------------------------
+    def needs_download(
+        self, report:str, period:str, file_path:str,
+        grace_months:int = None, now:dt.datetime = None
+    ) -> bool:
+        if not os.path.isfile(file_path):
+            return True
+        now = now or dt.datetime.now()
+        entry = self.manifest(os.path.dirname(file_path)).get(report, period)
+        if entry is not None and entry['file'] == os.path.basename(file_path):
+            downloaded_at = dt.datetime.fromisoformat(entry['downloaded_at'])
+        else:
+            # Files from before the manifest: trust their mtime
+            downloaded_at = dt.datetime.fromtimestamp(os.path.getmtime(file_path))
+        if downloaded_at.date() > self.closed_on(period, grace_months):
+            return False
+        return now - downloaded_at > dt.timedelta(hours=self.ttl_hours)
+
+    # --------------------------------------------------
+    def select(
+        self, report:str, dir_path:str, periods:list, file_name,
+        grace_months:int = None
+    ) -> list:
+        """Periods whose file (file_name(period)) is missing or stale"""
+        return [
+            period for period in periods
+            if self.needs_download(
+                report, period, os.path.join(dir_path, file_name(period)),
+                grace_months=grace_months
+            )
+        ]
+
+    # --------------------------------------------------
+    def record(self, report:str, dir_path:str, period:str, file_name:str) -> None:
+        self.manifest(dir_path).record(
+            report, period, os.path.join(dir_path, file_name)
+        )
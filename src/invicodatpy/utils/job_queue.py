@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Persistent (SQLite) queue of report download jobs with retries,
+exponential backoff and resume after a crash
+"""
+
+
+__all__ = ["Job", "JobQueue"]
+
+
+import json
+import random
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+@dataclass
+class Job():
+    """One (report, parameters) task"""
+    id:int
+    report:str
+    params:dict
+    state:str
+    attempts:int
+    next_run_at:float
+    last_error:str = None
+
+
+@dataclass
+class JobQueue():
+    """
+    SQLite backed job queue. Jobs are unique by (report, params), so adding
+    the same sweep twice resumes it instead of starting again.
+    :param max_attempts: a job failing that many times ends as 'failed'.
+    :param backoff_base, backoff_max: a failed job waits
+    min(backoff_base * 2 ** (attempts - 1), backoff_max) seconds (plus
+    jitter) before its next attempt.
+    :param lease_seconds: a running job not finished after that long is
+    taken as abandoned (its run crashed) and can be claimed again. Several
+    processes can share the queue: a job still in its lease is never
+    taken from the one running it.
+    """
+    sql_path:str
+    max_attempts:int = 5
+    backoff_base:float = 30
+    backoff_max:float = 3600
+    lease_seconds:float = 3600
+    _conn:sqlite3.Connection = field(init=False, repr=False, default=None)
+
+    # --------------------------------------------------
+    def __post_init__(self):
+        self._conn = sqlite3.connect(
+            self.sql_path, timeout=30, isolation_level=None,
+            check_same_thread=False
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                report TEXT NOT NULL,
+                params TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_run_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at REAL,
+                UNIQUE (report, params)
+            )
+        """)
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, next_run_at)'
+        )
+
+    # --------------------------------------------------
+    def close(self) -> None:
+        self._conn.close()
+
+    # --------------------------------------------------
+    @staticmethod
+    def _key(params:dict) -> str:
+        return json.dumps(params, sort_keys=True, default=str)
+
+    # --------------------------------------------------
+    def _to_job(self, row:tuple) -> Job:
+        return Job(
+            id=row[0], report=row[1], params=json.loads(row[2]), state=row[3],
+            attempts=row[4], next_run_at=row[5], last_error=row[6]
+        )
+
+    # --------------------------------------------------
+    def add(self, report:str, params:dict) -> None:
+        """Queue a job (no-op if it was already queued, whatever its state)"""
+        self.add_many(report, [params])
+
+    # --------------------------------------------------
+    def add_many(self, report:str, params_list:list[dict]) -> None:
+        self._conn.executemany(
+            'INSERT OR IGNORE INTO jobs (report, params, updated_at) '
+            'VALUES (?, ?, ?)',
+            [(report, self._key(params), time.time()) for params in params_list]
+        )
+
+    # --------------------------------------------------
+    def retry_failed(self, report:str = None) -> None:
+        """Give failed jobs a new round of attempts"""
+        sql = 'UPDATE jobs SET state = ?, attempts = 0, next_run_at = 0 WHERE state = ?'
+        args = [PENDING, FAILED]
+        if report is not None:
+            sql += ' AND report = ?'
+            args.append(report)
+        self._conn.execute(sql, args)
+
+    # --------------------------------------------------
+    def claim(self, report:str = None) -> Job:
+        """Take the next due job, or a running one whose lease expired
+        (None if there is none)"""
+        now = time.time()
+        sql = (
+            'SELECT id, report, params, state, attempts, next_run_at, last_error '
+            'FROM jobs WHERE ((state = ? AND next_run_at <= ?) '
+            'OR (state = ? AND updated_at <= ?))'
+        )
+        args = [PENDING, now, RUNNING, now - self.lease_seconds]
+        if report is not None:
+            sql += ' AND report = ?'
+            args.append(report)
+        sql += ' ORDER BY next_run_at, id LIMIT 1'
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = self._conn.execute(sql, args).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    'UPDATE jobs SET state = ?, attempts = attempts + 1, '
+                    'updated_at = ? WHERE id = ?',
+                    (RUNNING, now, row[0])
+                )
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        if row is None:
+            return None
+        job = self._to_job(row)
+        job.state = RUNNING
+        job.attempts += 1
+        return job
+
+    # --------------------------------------------------
+    def complete(self, job:Job) -> None:
+        self._conn.execute(
+            'UPDATE jobs SET state = ?, last_error = NULL, updated_at = ? '
+            'WHERE id = ?', (DONE, time.time(), job.id)
+        )
+
+    # --------------------------------------------------
+    def fail(self, job:Job, error:str) -> None:
+        """Reschedule job with exponential backoff, or give it up"""
+        if job.attempts >= self.max_attempts:
+            state, next_run_at = FAILED, 0
+        else:
+            delay = min(
+                self.backoff_base * 2 ** (job.attempts - 1), self.backoff_max
+            )
+            state = PENDING
+            next_run_at = time.time() + delay * random.uniform(1, 1.25)
+        self._conn.execute(
+            'UPDATE jobs SET state = ?, next_run_at = ?, last_error = ?, '
+            'updated_at = ? WHERE id = ?',
+            (state, next_run_at, str(error), time.time(), job.id)
+        )
+
+    # --------------------------------------------------
+    def counts(self) -> dict:
+        """Number of jobs by state"""
+        with closing(self._conn.execute(
+            'SELECT state, COUNT(*) FROM jobs GROUP BY state'
+        )) as cursor:
+            return dict(cursor.fetchall())
+
+    # --------------------------------------------------
+    def jobs(self, state:str = None) -> list[Job]:
+        sql = (
+            'SELECT id, report, params, state, attempts, next_run_at, last_error '
+            'FROM jobs'
+        )
+        args = []
+        if state is not None:
+            sql += ' WHERE state = ?'
+            args.append(state)
+        rows = self._conn.execute(sql + ' ORDER BY id', args).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    # --------------------------------------------------
+    def run(
+        self, handlers:dict, is_done:dict = None, wait:bool = True
+    ) -> dict:
+        """Run queued jobs until none is left pending.
+        :param handlers: report -> callable(**params) doing the job.
+        :param is_done: report -> callable(**params) telling whether the
+        job output already exists. Done jobs are not run again, and a job
+        whose handler returns without its output counts as failed (many
+        download_report methods print their errors instead of raising).
+        :param wait: sleep until backed off jobs are due; otherwise return
+        as soon as no job is due.
+        Returns counts().
+        """
+        is_done = is_done or {}
+        while True:
+            job = None
+            for report in handlers:
+                job = self.claim(report)
+                if job is not None:
+                    break
+            if job is None:
+                next_run_at = self._conn.execute(
+                    'SELECT MIN(next_run_at) FROM jobs WHERE state = ? '
+                    'AND report IN (%s)' % ','.join('?' * len(handlers)),
+                    [PENDING, *handlers]
+                ).fetchone()[0]
+                if next_run_at is None or not wait:
+                    return self.counts()
+                time.sleep(max(next_run_at - time.time(), 0))
+                continue
+
+            check = is_done.get(job.report)
+            if check is not None and check(**job.params):
+                self.complete(job)
+                continue
+            try:
+                handlers[job.report](**job.params)
+                if check is not None and not check(**job.params):
+                    raise RuntimeError('Job finished without its output')
+            except Exception as e:
+                print(f"Job {job.report} {job.params} failed: {e}, {type(e)}")
+                self.fail(job, f'{type(e).__name__}: {e}')
+            else:
+                self.complete(job)
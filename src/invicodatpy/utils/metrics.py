@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Stage timing and throughput records (wall time, rows, bytes, peak
+memory) exported as a JSON run report and a Prometheus textfile
+"""
+
+__all__ = ['StageRecord', 'Metrics', 'metrics', 'instrument']
+
+import atexit
+import datetime as dt
+import functools
+import json
+import multiprocessing
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+from ..config import settings
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+
+# --------------------------------------------------
+def _rows(df) -> int:
+    return None if df is None else len(df)
+
+# --------------------------------------------------
+def _process_peak_memory() -> int:
+    """High-water mark (bytes) of the process resident memory"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if os.uname().sysname == 'Darwin' else peak * 1024
+
+
+@dataclass
+class StageRecord():
+    """
+    One run of a stage (read, transform, delete, insert, download, ...)
+    :param peak_memory: bytes allocated at the stage peak when tracemalloc
+    is on (INVICODAT_TRACE_MEMORY=1), otherwise the process high-water mark.
+    :param file: file the stage worked on. Only in the JSON run report: the
+    Prometheus series are labelled by report and stage alone.
+    """
+    report:str
+    stage:str
+    started_at:str
+    seconds:float = 0.0
+    rows_in:int = None
+    rows_out:int = None
+    bytes_read:int = None
+    peak_memory:int = None
+    error:str = None
+    file:str = None
+
+
+@dataclass
+class Metrics():
+    """Records of the current process. Exported at exit to
+    INVICODAT_METRICS_DIR, if set."""
+    records:list = field(default_factory=list)
+    started_at:str = field(
+        default_factory=lambda: dt.datetime.now().isoformat(timespec='seconds')
+    )
+    _lock:threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _exit_hook:bool = field(init=False, repr=False, default=False)
+
+    # --------------------------------------------------
+    @contextmanager
+    def stage(
+        self, report:str, stage:str, rows_in:int = None, bytes_read:int = None
+    ):
+        """Time the block; it may fill rows_out / bytes_read of the yielded
+        record"""
+        if settings.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        record = StageRecord(
+            report, stage, dt.datetime.now().isoformat(timespec='milliseconds'),
+            rows_in=rows_in, bytes_read=bytes_read
+        )
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record.error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            record.seconds = time.perf_counter() - start
+            record.peak_memory = (
+                tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing()
+                else _process_peak_memory()
+            )
+            self.add([record])
+
+    # --------------------------------------------------
+    def add(self, records:list) -> None:
+        """Append records (also the ones made by worker processes)"""
+        with self._lock:
+            self.records.extend(records)
+            # Worker processes send their records to the parent instead
+            if (
+                not self._exit_hook and settings.metrics_dir
+                and multiprocessing.parent_process() is None
+            ):
+                atexit.register(self.export, settings.metrics_dir)
+                self._exit_hook = True
+
+    # --------------------------------------------------
+    def since(self, n:int) -> list:
+        """Records made after the first n"""
+        with self._lock:
+            return self.records[n:]
+
+    # --------------------------------------------------
+    def clear(self) -> None:
+        with self._lock:
+            self.records = []
+
+    # --------------------------------------------------
+    def summary(self) -> list[dict]:
+        """Totals by report and stage, slowest first"""
+        totals = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            total = totals.setdefault((record.report, record.stage), {
+                'report': record.report, 'stage': record.stage, 'runs': 0,
+                'errors': 0, 'seconds': 0.0, 'rows_out': 0, 'bytes_read': 0,
+                'peak_memory': 0,
+            })
+            total['runs'] += 1
+            total['errors'] += record.error is not None
+            total['seconds'] += record.seconds
+            total['rows_out'] += record.rows_out or 0
+            total['bytes_read'] += record.bytes_read or 0
+            total['peak_memory'] = max(total['peak_memory'], record.peak_memory or 0)
+        for total in totals.values():
+            total['rows_per_second'] = (
+                total['rows_out'] / total['seconds'] if total['seconds'] else 0.0
+            )
+        return sorted(totals.values(), key=lambda total: -total['seconds'])
+
+    # --------------------------------------------------
+    def to_json(self, path:str) -> None:
+        with self._lock:
+            records = [asdict(record) for record in self.records]
+        report = {
+            'started_at': self.started_at,
+            'finished_at': dt.datetime.now().isoformat(timespec='seconds'),
+            'pid': os.getpid(),
+            'summary': self.summary(),
+            'records': records,
+        }
+        _write_atomic(path, json.dumps(report, indent=2))
+
+    # --------------------------------------------------
+    def to_prometheus(self, path:str) -> None:
+        """node_exporter textfile collector format"""
+        series = {
+            'seconds': ('invicodat_stage_seconds', 'Wall time spent in the stage'),
+            'runs': ('invicodat_stage_runs', 'Times the stage ran'),
+            'errors': ('invicodat_stage_errors', 'Stage runs that raised'),
+            'rows_out': ('invicodat_stage_rows', 'Rows the stage produced'),
+            'bytes_read': ('invicodat_stage_bytes_read', 'Bytes the stage read'),
+            'peak_memory': (
+                'invicodat_stage_peak_memory_bytes', 'Peak memory during the stage'
+            ),
+        }
+        summary = self.summary()
+        lines = []
+        for key, (name, help_text) in series.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            for total in summary:
+                labels = 'report="{}",stage="{}"'.format(
+                    _escape(total['report']), _escape(total['stage'])
+                )
+                lines.append(f'{name}{{{labels}}} {total[key]}')
+        lines.append('# HELP invicodat_last_run_timestamp_seconds End of the last run')
+        lines.append('# TYPE invicodat_last_run_timestamp_seconds gauge')
+        lines.append(f'invicodat_last_run_timestamp_seconds {time.time():.0f}')
+        _write_atomic(path, '\n'.join(lines) + '\n')
+
+    # --------------------------------------------------
+    def export(self, dir_path:str) -> None:
+        """invicodat_run.json and invicodat.prom in dir_path"""
+        if not self.records:
+            return
+        os.makedirs(dir_path, exist_ok=True)
+        self.to_json(os.path.join(dir_path, 'invicodat_run.json'))
+        self.to_prometheus(os.path.join(dir_path, 'invicodat.prom'))
+
+
+metrics = Metrics()
+
+
+# --------------------------------------------------
+def _escape(value:str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+# --------------------------------------------------
+def _write_atomic(path:str, text:str) -> None:
+    # The textfile collector may read at any time
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(path + '.tmp', path)
+
+# --------------------------------------------------
+def _dir_sizes(dir_path) -> dict:
+    if not isinstance(dir_path, str) or not os.path.isdir(dir_path):
+        return {}
+    return {
+        entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in os.scandir(dir_path) if entry.is_file()
+    }
+
+# --------------------------------------------------
+def instrument(method, stage:str):
+    """Record every call of a report method (self.df rows in and out;
+    for downloads, bytes of the files written to dir_path)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        report = getattr(self, '_TABLE_NAME', '') or type(self).__name__
+        if stage == 'download':
+            dir_path = args[0] if args else kwargs.get('dir_path')
+            before = _dir_sizes(dir_path)
+            with metrics.stage(report, stage) as record:
+                result = method(self, *args, **kwargs)
+                after = _dir_sizes(dir_path)
+                record.bytes_read = sum(
+                    size for name, (mtime, size) in after.items()
+                    if before.get(name) != (mtime, size)
+                )
+            return result
+        with metrics.stage(report, stage, rows_in=_rows(self.df)) as record:
+            result = method(self, *args, **kwargs)
+            record.rows_out = _rows(self.df)
+        return result
+    wrapper._instrumented = True
+    return wrapper
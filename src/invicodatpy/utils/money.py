@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Parse report amounts ('1,234.56' or '1.234,56') a whole block
+of columns at once
+"""
+
+
+__all__ = ["detect_decimal", "parse_money"]
+
+
+import numpy as np
+import pandas as pd
+
+
+# --------------------------------------------------
+def detect_decimal(values, sample_size:int = 1000) -> str:
+    """Guess the decimal separator ('.' or ',') of text amounts from a
+    sample. When both separators show up, the last one is the decimal
+    separator. A lone separator followed by exactly three digits is
+    ambiguous ('1,234' / '1.234') and does not vote. Defaults to '.'.
+    """
+    sample = pd.Series(np.asarray(values, dtype=object).ravel())
+    sample = sample[sample.notna()].astype(str).str.strip()
+    sample = sample[sample != ''].head(sample_size)
+    if sample.empty:
+        return '.'
+    last_dot = sample.str.rfind('.')
+    last_comma = sample.str.rfind(',')
+    lengths = sample.str.len()
+    both = (last_dot >= 0) & (last_comma >= 0)
+    dot_only = (last_dot >= 0) & (last_comma < 0)
+    comma_only = (last_comma >= 0) & (last_dot < 0)
+    # A separator repeated is the thousands one
+    dot_decimal = (
+        (both & (last_dot > last_comma))
+        | (dot_only & (sample.str.count(r'\.') == 1)
+           & (lengths - last_dot - 1 != 3))
+        | (comma_only & (sample.str.count(',') > 1))
+    )
+    comma_decimal = (
+        (both & (last_comma > last_dot))
+        | (comma_only & (sample.str.count(',') == 1)
+           & (lengths - last_comma - 1 != 3))
+        | (dot_only & (sample.str.count(r'\.') > 1))
+    )
+    return ',' if comma_decimal.sum() > dot_decimal.sum() else '.'
+
+# --------------------------------------------------
+def _print_invalid(invalid:pd.DataFrame):
+    print(f"Unparseable amounts (set to NaN):\n{invalid.to_string()}")
+
+# --------------------------------------------------
+def parse_money(
+    data, decimal:str = None, on_invalid = _print_invalid
+):
+    """Convert text amounts of a Series or DataFrame to float64 in one
+    vectorized pass over every cell.
+    :param decimal: '.' ('1,234.56') or ',' ('1.234,56'). If None, it is
+    detected from a sample (see detect_decimal).
+    :param on_invalid: callable receiving a DataFrame (index, column, value)
+    with the cells that are not amounts. Those cells become NaN instead of
+    raising. Empty cells are NaN and are not reported.
+    """
+    values = np.asarray(data, dtype=object)
+    if decimal is None:
+        decimal = detect_decimal(values)
+    if decimal not in ('.', ','):
+        raise ValueError(f"decimal must be '.' or ',', not {decimal!r}")
+    thousands = ',' if decimal == '.' else '.'
+
+    cells = pd.Series(values.ravel())
+    text = cells.astype(str).str.strip()
+    blank = cells.isna().to_numpy() | (text == '').to_numpy()
+    text = text.str.replace(thousands, '', regex=False)
+    if decimal == ',':
+        text = text.str.replace(',', '.', regex=False)
+    parsed = pd.to_numeric(text, errors='coerce').to_numpy(dtype=np.float64)
+    parsed[blank] = np.nan
+
+    invalid = np.isnan(parsed) & ~blank
+    if invalid.any() and on_invalid is not None:
+        if isinstance(data, pd.DataFrame):
+            rows, cols = np.divmod(np.flatnonzero(invalid), data.shape[1])
+            columns = data.columns[cols]
+        else:
+            rows = np.flatnonzero(invalid)
+            columns = [getattr(data, 'name', None)] * len(rows)
+        on_invalid(pd.DataFrame({
+            'index': data.index[rows],
+            'column': columns,
+            'value': cells.to_numpy()[invalid],
+        }))
+
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(
+            parsed.reshape(data.shape), index=data.index, columns=data.columns
+        )
+    return pd.Series(
+        parsed, index=data.index, name=getattr(data, 'name', None)
+    )
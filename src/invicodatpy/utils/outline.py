@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Parse indented outline reports (programa / subprograma / ... )
+in a single pass
+"""
+
+
+__all__ = ["OutlineLevel", "parse_outline"]
+
+
+import re
+from dataclasses import dataclass
+
+import pandas as pd
+
+
+# --------------------------------------------------
+@dataclass
+class OutlineLevel():
+    """One level of an outline report
+    :param name: output column name.
+    :param column: source column of the read report.
+    :param prefix: if given, a row opens this level when column starts
+    with prefix (several levels may share the same column). Otherwise
+    any non empty cell of column opens the level.
+    :param start, stop: slice applied to the cell to get the level value.
+    """
+    name:str
+    column:str
+    prefix:str = None
+    start:int = None
+    stop:int = None
+
+# --------------------------------------------------
+def parse_outline(df:pd.DataFrame, levels:list[OutlineLevel]) -> pd.DataFrame:
+    """Classify each row of df by outline level and forward fill every
+    level at once. Returns a DataFrame (same index as df) with one column
+    per level, in the given order.
+    """
+    values = {}
+
+    # Rows are classified once per source column, whatever the number of
+    # levels sharing it
+    by_column = {}
+    for level in levels:
+        by_column.setdefault(level.column, []).append(level)
+
+    for column, column_levels in by_column.items():
+        col = df[column]
+        prefixed = [level for level in column_levels if level.prefix is not None]
+        if prefixed:
+            prefixes = sorted(
+                {level.prefix for level in prefixed}, key=len, reverse=True
+            )
+            label = col.str.extract(
+                '^(' + '|'.join(re.escape(p) for p in prefixes) + ')',
+                expand=False
+            )
+        for level in column_levels:
+            if level.prefix is not None:
+                mask = label == level.prefix
+            else:
+                mask = col.notna() & (col != '')
+            value = col[mask]
+            if level.start is not None or level.stop is not None:
+                value = value.str[level.start:level.stop]
+            values[level.name] = value
+
+    outline = pd.DataFrame(values, index=df.index, dtype=object)
+    outline = outline.loc[:, [level.name for level in levels]]
+    return outline.ffill()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Parse dates and derive ejercicio / mes / nro_comprobante keys
+"""
+
+
+__all__ = [
+    "parse_date", "parse_dates", "ejercicio_from",
+    "mes_from", "nro_comprobante_from"
+]
+
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# --------------------------------------------------
+@lru_cache(maxsize=1024)
+def parse_date(value:str, format:str = None) -> pd.Timestamp:
+    """Parse a single date string (i.e. a report header cell)"""
+    return pd.to_datetime(value, format=format)
+
+# --------------------------------------------------
+def parse_dates(
+    dates:pd.Series, format:str = None, errors:str = 'raise'
+) -> pd.Series:
+    """Parse a column of date strings. Reports repeat the same few dates
+    over thousands of rows, so each distinct string is parsed only once.
+    """
+    codes, uniques = pd.factorize(dates)
+    parsed = pd.to_datetime(uniques, format=format, errors=errors)
+    # Missing values get code -1, which takes the trailing NaT
+    values = np.append(
+        np.asarray(parsed, dtype='datetime64[ns]'), np.datetime64('NaT', 'ns')
+    )
+    return pd.Series(values.take(codes), index=dates.index, name=dates.name)
+
+# --------------------------------------------------
+def _year_month(fecha:pd.Series) -> tuple:
+    """Year and month (1-12) of datetime64 values as integer arrays, plus
+    the NaT mask"""
+    values = np.asarray(fecha, dtype='datetime64[ns]')
+    nat = np.isnat(values)
+    months = values.astype('datetime64[M]').astype(np.int64)
+    year, month = np.divmod(months, 12)
+    return year + 1970, month + 1, nat
+
+# --------------------------------------------------
+def _label(keys:np.ndarray, nat:np.ndarray, make_label, index) -> pd.Series:
+    """Build string labels formatting each distinct integer key once"""
+    keys = np.where(nat, -1, keys)
+    codes, uniques = pd.factorize(keys)
+    labels = np.array(
+        [None if key == -1 else make_label(key) for key in uniques] + [None],
+        dtype=object
+    )
+    return pd.Series(labels.take(codes), index=index)
+
+# --------------------------------------------------
+def ejercicio_from(fecha:pd.Series) -> pd.Series:
+    """'yyyy' of each date (None for NaT)"""
+    year, _, nat = _year_month(fecha)
+    return _label(year, nat, str, fecha.index)
+
+# --------------------------------------------------
+def mes_from(fecha:pd.Series, ejercicio = None) -> pd.Series:
+    """'mm/yyyy' of each date (None for NaT)
+    :param ejercicio: if given (str or Series), it replaces the year of the
+    date, as SIIF reports close every movement into its ejercicio.
+    """
+    year, month, nat = _year_month(fecha)
+    if ejercicio is None:
+        return _label(
+            year * 100 + month, nat,
+            lambda key: f'{key % 100:02d}/{key // 100}', fecha.index
+        )
+    if isinstance(ejercicio, pd.Series):
+        ejercicio = ejercicio.reindex(fecha.index)
+    else:
+        ejercicio = pd.Series(ejercicio, index=fecha.index)
+    eje_codes, eje_uniques = pd.factorize(ejercicio)
+    nat = nat | (eje_codes == -1)
+    return _label(
+        eje_codes * 12 + month - 1, nat,
+        lambda key: f'{key % 12 + 1:02d}/{eje_uniques[key // 12]}', fecha.index
+    )
+
+# --------------------------------------------------
+def nro_comprobante_from(nro:pd.Series, mes:pd.Series) -> pd.Series:
+    """'nnnnn/yy' comprobante key from its number and 'mm/yyyy' mes"""
+    codes, uniques = pd.factorize(mes)
+    suffixes = np.array(
+        ['/' + str(value)[-2:] for value in uniques] + [None], dtype=object
+    )
+    return nro.str.zfill(5) + suffixes.take(codes)
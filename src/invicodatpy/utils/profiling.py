@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Opt-in cProfile dumps of report methods (transform_df,
+from_external_report, to_sql, download_report) and a hot functions summary
+by report class
+"""
+
+__all__ = ['Profiler', 'profiler', 'profiled']
+
+import atexit
+import cProfile
+import functools
+import glob
+import io
+import itertools
+import multiprocessing
+import os
+import pstats
+import threading
+from dataclasses import dataclass, field
+
+from ..config import settings
+
+
+@dataclass
+class Profiler():
+    """
+    Off unless dir_path is given (invicodat --profile-dir, or
+    INVICODAT_PROFILE_DIR). Every profiled call writes
+    {Class}.{method}.{pid}.{n}.prof to dir_path; at exit
+    profile_summary.txt lists the top hot functions of each class.
+    Calls made inside a profiled call are part of its dump.
+    """
+    dir_path:str = None
+    top:int = None
+    _resolved:bool = field(init=False, repr=False, default=False)
+    _local:threading.local = field(
+        init=False, repr=False, default_factory=threading.local
+    )
+    _calls:itertools.count = field(
+        init=False, repr=False, default_factory=itertools.count
+    )
+    _exit_hook:bool = field(init=False, repr=False, default=False)
+
+    # --------------------------------------------------
+    @property
+    def enabled(self) -> bool:
+        if not self._resolved:
+            self.dir_path = self.dir_path or settings.profile_dir
+            self._resolved = True
+        return self.dir_path is not None
+
+    # --------------------------------------------------
+    def enable(self, dir_path:str, top:int = None) -> None:
+        """Profile from now on, also in worker processes started later"""
+        os.environ['INVICODAT_PROFILE_DIR'] = dir_path
+        if top is not None:
+            os.environ['INVICODAT_PROFILE_TOP'] = str(top)
+        settings.reload()
+        self.dir_path, self.top, self._resolved = dir_path, top, True
+
+    # --------------------------------------------------
+    def call(self, label:str, method, *args, **kwargs):
+        """method(*args, **kwargs) under cProfile, unless another profiled
+        call of this thread is running"""
+        if getattr(self._local, 'active', False):
+            return method(*args, **kwargs)
+        os.makedirs(self.dir_path, exist_ok=True)
+        if (
+            not self._exit_hook and multiprocessing.parent_process() is None
+        ):
+            atexit.register(self.write_summary)
+            self._exit_hook = True
+        profile = cProfile.Profile()
+        self._local.active = True
+        try:
+            return profile.runcall(method, *args, **kwargs)
+        finally:
+            self._local.active = False
+            profile.dump_stats(os.path.join(
+                self.dir_path,
+                f'{label}.{os.getpid()}.{next(self._calls)}.prof'
+            ))
+
+    # --------------------------------------------------
+    def summary(self, top:int = None) -> str:
+        """Top hot functions (cumulative time) of the dumps in dir_path,
+        grouped by report class"""
+        top = top or self.top or settings.profile_top
+        dumps = {}
+        for path in sorted(glob.glob(os.path.join(self.dir_path, '*.prof'))):
+            dumps.setdefault(os.path.basename(path).split('.')[0], []).append(path)
+        text = io.StringIO()
+        for report, paths in dumps.items():
+            text.write(f"{'=' * 80}\n{report} ({len(paths)} calls)\n")
+            stats = pstats.Stats(*paths, stream=text)
+            stats.strip_dirs().sort_stats('cumulative').print_stats(top)
+        return text.getvalue()
+
+    # --------------------------------------------------
+    def write_summary(self, top:int = None) -> str:
+        """profile_summary.txt in dir_path. Returns its path."""
+        if not self.enabled or not glob.glob(os.path.join(self.dir_path, '*.prof')):
+            return None
+        path = os.path.join(self.dir_path, 'profile_summary.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.summary(top))
+        return path
+
+
+profiler = Profiler()
+
+
+# --------------------------------------------------
+def profiled(method):
+    """Profile the method calls when profiler is enabled; otherwise call
+    it straight"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not profiler.enabled:
+            return method(self, *args, **kwargs)
+        return profiler.call(
+            f'{type(self).__name__}.{method.__name__}',
+            method, self, *args, **kwargs
+        )
+    wrapper._profiled = True
+    return wrapper
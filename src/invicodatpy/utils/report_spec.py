@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Declarative specification of positional (SIIF, SGV, ...) reports
+and its vectorized executor
+"""
+
+
+__all__ = ["Cell", "ReportSpec"]
+
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .periods import parse_dates
+
+
+# --------------------------------------------------
+@dataclass(frozen=True)
+class Cell():
+    """Single cell of a read report
+    :param row, col: position of the cell (as in df.iat[row, col]).
+    :param start, stop: slice applied to the cell text.
+    """
+    row:int
+    col:int
+    start:int = None
+    stop:int = None
+
+    def __call__(self, df:pd.DataFrame) -> str:
+        return df.iat[self.row, self.col][self.start:self.stop]
+
+# --------------------------------------------------
+@dataclass(frozen=True)
+class ReportSpec():
+    """Positional layout of a read report and how to tidy it
+    :param title: cell holding the report title.
+    :param columns: read column label -> output column name.
+    :param data_start, data_stop: rows holding data (df.iloc[data_start:data_stop]).
+    :param header: constant output columns, taken from a Cell or from any
+    callable receiving the read DataFrame.
+    :param required: output columns that must not be empty (other rows are dropped).
+    :param numeric: output columns converted to float64.
+    :param integer: output columns converted to int.
+    :param dates: output column -> date format.
+    :param flags: output column -> cell value meaning True.
+    :param zfill: output column -> width to left pad codes with zeros.
+    :param derived: output column -> callable receiving the tidy DataFrame,
+    evaluated in order after every conversion.
+    :param order: output columns order (default: header, columns, derived).
+    :param blank_as_null: replace empty cells by None.
+    """
+    title:Cell
+    columns:dict
+    data_start:int = 0
+    data_stop:int = None
+    header:dict = field(default_factory=dict)
+    required:tuple = ()
+    numeric:tuple = ()
+    integer:tuple = ()
+    dates:dict = field(default_factory=dict)
+    flags:dict = field(default_factory=dict)
+    zfill:dict = field(default_factory=dict)
+    derived:dict = field(default_factory=dict)
+    order:tuple = None
+    blank_as_null:bool = True
+
+    # --------------------------------------------------
+    def __post_init__(self):
+        # Compile once everything that does not depend on the read file
+        names = list(self.columns.values())
+        order = self.order
+        if order is None:
+            order = dict.fromkeys(
+                list(self.header) + names + list(self.derived)
+            )
+        object.__setattr__(self, '_labels', list(self.columns.keys()))
+        object.__setattr__(self, '_names', names)
+        object.__setattr__(
+            self, '_required', [names.index(col) for col in self.required]
+        )
+        object.__setattr__(self, '_order', list(order))
+
+    # --------------------------------------------------
+    def read_title(self, df:pd.DataFrame) -> str:
+        """Title of the read report"""
+        return self.title(df)
+
+    # --------------------------------------------------
+    def transform(self, df:pd.DataFrame) -> pd.DataFrame:
+        """Tidy a read report (as returned by read_xls / read_csv)"""
+        positions = df.columns.get_indexer(self._labels)
+        if (positions < 0).any():
+            missing = [
+                label for label, pos in zip(self._labels, positions) if pos < 0
+            ]
+            raise KeyError(f"Columns not found in report: {missing}")
+
+        # Only the needed block is copied, and only once
+        values = df.to_numpy(dtype=object)[
+            self.data_start:self.data_stop, positions
+        ]
+        index = df.index[self.data_start:self.data_stop]
+        if self.blank_as_null:
+            values[values == ''] = None
+
+        if self._required:
+            keys = values[:, self._required]
+            empty = pd.isna(keys)
+            if not self.blank_as_null:
+                empty |= keys == ''
+            keep = ~empty.any(axis=1)
+            values = values[keep]
+            index = index[keep]
+
+        tidy = pd.DataFrame(values, index=index, columns=self._names, copy=False)
+
+        for col, source in self.header.items():
+            tidy[col] = source(df)
+        for col in self.numeric:
+            tidy[col] = pd.to_numeric(tidy[col]).astype(np.float64)
+        for col in self.integer:
+            tidy[col] = tidy[col].astype(int)
+        for col, format in self.dates.items():
+            tidy[col] = parse_dates(tidy[col], format=format)
+        for col, true_value in self.flags.items():
+            tidy[col] = tidy[col] == true_value
+        for col, width in self.zfill.items():
+            tidy[col] = tidy[col].str.zfill(width)
+        for col, func in self.derived.items():
+            tidy[col] = func(tidy)
+
+        return tidy.loc[:, self._order]
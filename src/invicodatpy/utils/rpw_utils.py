@@ -8,20 +8,63 @@ Purpose: Read, process and write combined utils
 __all__ = ['RPWUtils']
 
 
+import os
+
+from .freshness import FreshnessPolicy
 from .handling_files import read_csv, read_xls, get_list_of_files
+from .metrics import instrument, metrics
 from .print_tidyverse import PrintTidyverse
+from .profiling import profiled
 import pandas as pd
 from .sql_utils import SQLUtils
 
 
+def _file_size(path) -> int:
+    return os.path.getsize(path) if isinstance(path, str) else None
+
+
 class RPWUtils(SQLUtils):
+    # Set it to skip downloads of unchanged periods
+    freshness:FreshnessPolicy = None
+    # Reports whose tables must be loaded before downloading this one
+    # (see download_params)
+    _INPUTS:tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Time each report's download_report and transform_df (see
+        utils.metrics) and profile them and from_external_report when
+        asked to (see utils.profiling)"""
+        super().__init_subclass__(**kwargs)
+        for name, stage in (
+            ('download_report', 'download'), ('transform_df', 'transform'),
+            ('from_external_report', None)
+        ):
+            method = cls.__dict__.get(name)
+            if not callable(method) or getattr(method, '_profiled', False):
+                continue
+            if stage is not None:
+                method = instrument(method, stage)
+            setattr(cls, name, profiled(method))
+
 
     def read_csv(self, PATH:str, names=None, header=None) -> pd.DataFrame:
-        return read_csv(PATH=PATH, names=names, header=header)
+        with metrics.stage(
+            self._TABLE_NAME or type(self).__name__, 'read',
+            bytes_read=_file_size(PATH)
+        ) as record:
+            df = read_csv(PATH=PATH, names=names, header=header)
+            record.rows_out = len(df)
+        return df
 
 
     def read_xls(self, PATH:str, header:int = None) -> pd.DataFrame:
-        return read_xls(PATH=PATH, header=header)
+        with metrics.stage(
+            self._TABLE_NAME or type(self).__name__, 'read',
+            bytes_read=_file_size(PATH)
+        ) as record:
+            df = read_xls(PATH=PATH, header=header)
+            record.rows_out = len(df)
+        return df
 
 
     def get_list_of_files(self, path:str, years:list[str] = None) -> list:
@@ -31,4 +74,35 @@ class RPWUtils(SQLUtils):
     def print_tidyverse(self, data = None):
         if data is None:
             data = self.df
-        print(PrintTidyverse(data))
\ No newline at end of file
+        print(PrintTidyverse(data))
+
+
+    def periods_to_download(
+        self, dir_path:str, periods:list, file_name, grace_months:int = None
+    ) -> list:
+        """Periods (ejercicios, meses) whose file_name(period) is missing or
+        stale according to self.freshness (every period if it is not set)"""
+        if not isinstance(periods, list):
+            periods = [periods]
+        if self.freshness is None:
+            return periods
+        selected = self.freshness.select(
+            self._TABLE_NAME, dir_path, periods, file_name, grace_months
+        )
+        skipped = [period for period in periods if period not in selected]
+        if skipped:
+            print(f"{self._TABLE_NAME}: {skipped} up to date, not downloaded")
+        return selected
+
+
+    @classmethod
+    def download_params(cls, period:str, sql_path:str) -> dict:
+        """Extra download_report arguments of a period, read from the
+        _INPUTS tables in sql_path"""
+        return {}
+
+
+    def mark_downloaded(self, dir_path:str, period:str, file_name:str):
+        """Record a finished download in the freshness manifest"""
+        if self.freshness is not None:
+            self.freshness.record(self._TABLE_NAME, dir_path, period, file_name)
@@ -5,12 +5,34 @@ Purpose: SQL methods
 """
 
 
-__all__ = ['SQLUtils']
+__all__ = ['SQLUtils', 'sqlite_engine']
 
 from dataclasses import dataclass
 
 import pandas as pd
-from sqlalchemy import MetaData, Table, and_, create_engine, delete, engine
+from sqlalchemy import (MetaData, Table, and_, create_engine, delete, engine,
+                        event)
+
+from ..config import settings
+from .metrics import metrics
+from .profiling import profiled
+
+
+# --------------------------------------------------
+def sqlite_engine(sql_path:str, pragmas:dict = None):
+    """SQLite engine that sets pragmas (default: the configured
+    INVICODAT_SQLITE_PROFILE ones) on every new connection"""
+    sqlite = create_engine(f'sqlite:///{sql_path}')
+    pragmas = settings.sqlite_pragmas if pragmas is None else pragmas
+    if pragmas:
+        @event.listens_for(sqlite, 'connect')
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for key, value in pragmas.items():
+                cursor.execute(f'PRAGMA {key}={value}')
+            cursor.close()
+    return sqlite
+
 
 
 @dataclass
@@ -63,25 +85,32 @@ class SQLUtils():
         return result
 
     # --------------------------------------------------
+    @profiled
     def to_sql(self, sql_path:str, replace:bool = False):
         """From DataFrame to sql DataBase"""     
-        if replace:
-            self.delete_all_rows(sql_path)            
-        else:
-            self.delete_rows_with_df_col(sql_path)
+        with metrics.stage(self._TABLE_NAME, 'delete') as record:
+            if replace:
+                result = self.delete_all_rows(sql_path)            
+            else:
+                result = self.delete_rows_with_df_col(sql_path)
+            record.rows_out = result.rowcount
         
-        self.df.to_sql(
-            name = self._TABLE_NAME,
-            con = self.engine,
-            if_exists = 'append',
-            index=False
-        )
+        with metrics.stage(
+            self._TABLE_NAME, 'insert', rows_in=len(self.df)
+        ) as record:
+            self.df.to_sql(
+                name = self._TABLE_NAME,
+                con = self.engine,
+                if_exists = 'append',
+                index=False
+            )
+            record.rows_out = len(self.df)
         self.engine.dispose()
 
     # --------------------------------------------------
     def from_sql(self, sql_path:str, table_name:str = None) -> pd.DataFrame:
         """From sql DataBase to sql DataFrame"""
-        engine = create_engine(f'sqlite:///{sql_path}')
+        engine = sqlite_engine(sql_path)
         if table_name is None:
             table_name = self._TABLE_NAME
         self.df = pd.read_sql_table(
@@ -124,7 +153,7 @@ class SQLUtils():
     # --------------------------------------------------
     def test_sql(self, sql_path:str):
         """Create DB for testing purposes"""
-        engine = create_engine(f'sqlite:///{sql_path}')
+        engine = sqlite_engine(sql_path)
         self.df.to_sql(
             name = 'test',
             con = engine,
@@ -0,0 +1,24 @@
+from src.invicodatpy.cli import REPORTS
+
+
+def test_rcocc31_jobs_per_account(monkeypatch):
+    report = REPORTS['rcocc31']
+    report_cls = report.load(download=True)
+    monkeypatch.setattr(
+        report_cls, 'download_params',
+        classmethod(lambda cls, ejercicio, sql_path: {
+            'ctas_contables': ['1112-2-6', '2113-2-9']
+        })
+    )
+    jobs = report.jobs(['2023', '2024'])
+    assert jobs == [
+        {'ejercicios': ejercicio, 'ctas_contables': cta}
+        for ejercicio in ['2023', '2024'] for cta in ['1112-2-6', '2113-2-9']
+    ]
+    assert report.expected_files(jobs[1]) == ['2023-rcocc31 (2113-2-9).xls']
+
+def test_siif_jobs_per_period():
+    report = REPORTS['rf602']
+    jobs = report.jobs(['2023', '2024'])
+    assert jobs == [{'ejercicios': '2023'}, {'ejercicios': '2024'}]
+    assert report.expected_files(jobs[0]) == ['2023-rf602.xls']
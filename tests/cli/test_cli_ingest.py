@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+from src.invicodatpy.cli import REPORTS, main
+from src.invicodatpy.utils.fixtures import FIXTURES, write_fixture
+
+@pytest.mark.parametrize(
+    'name', [name for name in REPORTS if name in FIXTURES]
+)
+def test_ingest_fixture(name, tmp_path):
+    path = write_fixture(name, str(tmp_path), rows=50)
+    sql_path = os.path.join(tmp_path, 'test.sqlite')
+    report = REPORTS[name].load()
+    # Twice: the second run deletes (filtered or whole) before inserting
+    for _ in range(2):
+        main(['ingest', name, path, '--sql', sql_path, '-w', '1', '--force'])
+        df = report().from_sql(sql_path)
+        assert len(df) > 0
+    assert len(report().from_sql(sql_path)) == len(df)
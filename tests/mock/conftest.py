@@ -0,0 +1,18 @@
+import pytest
+
+import sys
+import os
+
+# Adding invicodatpy root to sys.path
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(os.path.dirname(current))
+sys.path.append(parent)
+
+from tests.mock.siif_sgv_server import MockServer
+
+@pytest.fixture(scope = 'class')
+def setup_and_teardown_mock_server(request):
+    mock = MockServer().start()
+    request.cls.mock = mock
+    yield
+    mock.stop()
@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Author: Fernando Corrales <fscpython@gmail.com>
+Purpose: Local stand-in for SIIF and Gestión Vivienda (SGV) web apps, to run
+the selenium download code offline (tests and benchmarks)
+"""
+
+import argparse
+import html
+import os
+import random
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+SIIF_PREFIX = '/mainSiif/faces'
+SGV_PREFIX = '/gv'
+
+# Same visible texts as siif.connect_siif.ReportCategory
+REPORT_CATEGORIES = [
+    "SUB - SISTEMA DE CONTROL DE GASTOS",
+    "SUB - SISTEMA DE CONTROL de RECURSOS",
+    "SUB - SISTEMA DE CONTABILIDAD PATRIMONIAL",
+    "SUB - SISTEMA DE FORMULACION PRESUPUESTARIA",
+    "SUB - SISTEMA DE CLASIFICADORES",
+]
+
+# SIIF report id -> downloaded file name
+SIIF_REPORTS = {
+    '7': 'rf610.xls',
+    '28': 'ri102.xls',
+    '33': 'rci02.xls',
+    '38': 'rf602.xls',
+    '267': 'rdeu012.xls',
+    '387': 'rcocc31.xls',
+    '839': 'rcg01_uejp.xls',
+    '890': 'rfp_p605b.xls',
+    '1175': 'gto_rpa03g.xls',
+    '2070': 'rfondo07tp.xls',
+    '2079': 'rvicon03.xls',
+}
+
+# Every input any SIIF report form reads
+SIIF_FORM_INPUTS = [
+    'txtAnioEjercicio', 'idFechaDesde', 'idFechaHasta', 'txtMesDesde',
+    'txtMesHasta', 'txtUnidadEjecutora', 'txtTipoCte', 'txtGrupoPartida',
+    'txtNivel', 'txtMayor', 'txtSubCuenta', 'inputText3',
+]
+
+# SGV informe page -> (ejercicio input id, exported file name)
+SGV_INFORMES = {
+    'InformeSaldosPorBarrio': (
+        'ctl00_ContentPlacePrincipal_ucInformeSaldosPorBarrio_txtAño_TextBox1',
+        'Informe Saldos Por Barrio.xlsx',
+    ),
+}
+# Where saldo_barrio waits for the rendered report
+SGV_REPORT_XPATH = (
+    '/html/body/form/div[3]/table/tbody/tr/td[1]/div/table[2]/tbody/tr/td[3]'
+    '/span/div/table/tbody/tr[4]/td[3]/div/div[1]/div/table/tbody/tr/td/table'
+    '/tbody/tr[1]/td/table/tbody/tr/td/table'
+)
+SGV_EXPORT_ID = (
+    'ctl00_ContentPlacePrincipal_uc{informe}_rp{informe}'
+    '_ctl05_ctl04_ctl00_ButtonLink'
+)
+
+
+# --------------------------------------------------
+def nest_xpath(xpath:str, inner:str) -> str:
+    """HTML (below body) whose element at the absolute xpath holds inner.
+    Positional steps (div[3]) get empty preceding siblings."""
+    steps = xpath.split('/')[3:]  # '', 'html', 'body'
+    out = inner
+    for step in reversed(steps):
+        tag, _, position = step.partition('[')
+        position = int(position.rstrip(']') or 1)
+        siblings = f'<{tag}></{tag}>' * (position - 1)
+        if tag == 'table':
+            siblings = '<table><tbody></tbody></table>' * (position - 1)
+        out = f'{siblings}<{tag}>{out}</{tag}>'
+    return out
+
+# --------------------------------------------------
+def page(title:str, body:str) -> bytes:
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        f'<title>{title}</title></head><body>{body}</body></html>'
+    ).encode('utf-8')
+
+
+@dataclass
+class MockServer():
+    """
+    Threaded HTTP server mimicking the SIIF and SGV pages the scrapers walk
+    through (same DOM ids), serving fixture files as downloads.
+    :param fixtures_dir: files served by name (rf602.xls, ...). Missing
+    fixtures are served as a few placeholder bytes.
+    :param latency: seconds each download takes (plus latency_jitter).
+    :param fail_rate: share of downloads answered with a 503.
+    :param session_ttl: seconds before a login expires (None: never).
+    :param down: SIIF answers with its 'SIIF no disponible!' page.
+    """
+    fixtures_dir:str = None
+    host:str = '127.0.0.1'
+    port:int = 0
+    latency:float = 0.0
+    latency_jitter:float = 0.0
+    fail_rate:float = 0.0
+    session_ttl:float = None
+    down:bool = False
+    users:dict = None
+    downloads:list = field(init=False, repr=False, default_factory=list)
+    _sessions:dict = field(init=False, repr=False, default_factory=dict)
+    _lock:threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _httpd:ThreadingHTTPServer = field(init=False, repr=False, default=None)
+    _thread:threading.Thread = field(init=False, repr=False, default=None)
+
+    # --------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        return f'http://{self.host}:{self._httpd.server_address[1]}'
+
+    # --------------------------------------------------
+    @property
+    def siif_url(self) -> str:
+        """Value for ConnectSIIF.url"""
+        return self.base_url + SIIF_PREFIX + '/login.jspx'
+
+    # --------------------------------------------------
+    @property
+    def sgv_url(self) -> str:
+        """Value for ConnectSGV(url=...)"""
+        return self.base_url + SGV_PREFIX
+
+    # --------------------------------------------------
+    def start(self) -> 'MockServer':
+        handler = type('Handler', (_Handler,), {'mock': self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    # --------------------------------------------------
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    # --------------------------------------------------
+    def __enter__(self) -> 'MockServer':
+        return self.start()
+
+    # --------------------------------------------------
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # --------------------------------------------------
+    def login(self, username:str, password:str) -> str:
+        """New session token (None for bad credentials)"""
+        if not username or not password:
+            return None
+        if self.users is not None and self.users.get(username) != password:
+            return None
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = time.monotonic()
+        return token
+
+    # --------------------------------------------------
+    def logout(self, token:str) -> None:
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    # --------------------------------------------------
+    def expire_sessions(self) -> None:
+        """Log every client out (SIIF drops sessions now and then)"""
+        with self._lock:
+            self._sessions.clear()
+
+    # --------------------------------------------------
+    def is_logged(self, token:str) -> bool:
+        with self._lock:
+            started = self._sessions.get(token)
+        if started is None:
+            return False
+        if self.session_ttl is not None:
+            return time.monotonic() - started < self.session_ttl
+        return True
+
+    # --------------------------------------------------
+    def fixture(self, file_name:str) -> bytes:
+        if self.fixtures_dir is not None:
+            path = os.path.join(self.fixtures_dir, file_name)
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    return f.read()
+        return f'mock {file_name}'.encode('utf-8')
+
+    # --------------------------------------------------
+    def serve_download(self, file_name:str, params:dict) -> bytes:
+        """Fixture content after latency (raises ConnectionError on a
+        simulated failure)"""
+        time.sleep(self.latency + random.uniform(0, self.latency_jitter))
+        failed = random.random() < self.fail_rate
+        with self._lock:
+            self.downloads.append({
+                'file': file_name, 'params': params, 'failed': failed,
+                'at': time.time(),
+            })
+        if failed:
+            raise ConnectionError(file_name)
+        return self.fixture(file_name)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    mock:MockServer = None
+    protocol_version = 'HTTP/1.1'
+
+    # --------------------------------------------------
+    def log_message(self, format, *args):
+        pass
+
+    # --------------------------------------------------
+    def token(self) -> str:
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        return cookie['MOCKSESSION'].value if 'MOCKSESSION' in cookie else None
+
+    # --------------------------------------------------
+    def send(
+        self, status:int, body:bytes = b'', content_type:str = 'text/html; charset=utf-8',
+        headers:dict = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    # --------------------------------------------------
+    def redirect(self, location:str, headers:dict = None) -> None:
+        self.send(303, headers={'Location': location, **(headers or {})})
+
+    # --------------------------------------------------
+    def form(self) -> dict:
+        length = int(self.headers.get('Content-Length', 0))
+        return dict(parse_qsl(self.rfile.read(length).decode('utf-8')))
+
+    # --------------------------------------------------
+    def do_GET(self):
+        self.route('GET')
+
+    # --------------------------------------------------
+    def do_POST(self):
+        self.route('POST')
+
+    # --------------------------------------------------
+    def route(self, method:str) -> None:
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        if url.path.startswith(SIIF_PREFIX + '/'):
+            name = url.path[len(SIIF_PREFIX) + 1:]
+            handler = getattr(self, 'siif_' + name.replace('.', '_'), None)
+        elif url.path.startswith(SGV_PREFIX + '/'):
+            name = url.path[len(SGV_PREFIX) + 1:]
+            if name.startswith('App/Recupero/Informes/'):
+                params['informe'] = name.rsplit('/', 1)[1].split('.')[0]
+                name = 'informe'
+            handler = getattr(self, 'sgv_' + name.replace('.', '_').replace('/', '_'), None)
+        else:
+            handler = None
+        if handler is None:
+            self.send(404, page('404', 'No encontrado'))
+            return
+        handler(method, params)
+
+    # --- SIIF -----------------------------------------
+    def siif_login_jspx(self, method:str, params:dict) -> None:
+        if self.mock.down:
+            self.send(200, page('SIIF', (
+                '<div></div><div></div><div><h3>SIIF no disponible!</h3></div>'
+            )))
+            return
+        if method == 'POST':
+            data = self.form()
+            token = self.mock.login(data.get('username'), data.get('password'))
+            if token is not None:
+                self.redirect('main.jspx', {
+                    'Set-Cookie': f'MOCKSESSION={token}; Path=/'
+                })
+                return
+        self.send(200, page('SIIF - Login', (
+            '<form method="post" action="login.jspx">'
+            '<input id="pt1:it1::content" name="username">'
+            '<input id="pt1:it2::content" name="password" type="password">'
+            '<button id="pt1:cb1" type="submit">Ingresar</button>'
+            '</form>'
+        )))
+
+    # --------------------------------------------------
+    def siif_logged(self) -> bool:
+        if self.mock.is_logged(self.token()):
+            return True
+        self.redirect('login.jspx')
+        return False
+
+    # --------------------------------------------------
+    def siif_main_jspx(self, method:str, params:dict) -> None:
+        if not self.siif_logged():
+            return
+        self.send(200, page('SIIF', (
+            '<a id="pt1:pt_np1:pt_cni1" href="logout.jspx">Salir</a>'
+            '<button id="pt1:cb12" onclick="'
+            "document.getElementById('pt1:cb14').style.display='inline'"
+            '">Reportes</button>'
+            '<button id="pt1:cb14" style="display:none" onclick="'
+            "window.open('reportes.jspx', '_blank')"
+            '">Ver reportes</button>'
+        )))
+
+    # --------------------------------------------------
+    def siif_logout_jspx(self, method:str, params:dict) -> None:
+        self.mock.logout(self.token())
+        self.redirect('login.jspx')
+
+    # --------------------------------------------------
+    def siif_reportes_jspx(self, method:str, params:dict) -> None:
+        if not self.siif_logged():
+            return
+        options = ''.join(
+            f'<option>{html.escape(category)}</option>'
+            for category in REPORT_CATEGORIES
+        )
+        self.send(200, page('SIIF - Reportes', (
+            f'<select id="pt1:socModulo::content">{options}</select>'
+            '<input id="_afrFilterpt1_afr_pc1_afr_tableReportes_afr_c1::content">'
+            '<div id="pt1:pc1:btnSiguiente" onclick="'
+            "location.href='reporte.jspx?id=' + encodeURIComponent(document"
+            ".getElementById('_afrFilterpt1_afr_pc1_afr_tableReportes_afr_c1::content')"
+            '.value.trim())">Siguiente</div>'
+        )))
+
+    # --------------------------------------------------
+    def siif_reporte_jspx(self, method:str, params:dict) -> None:
+        if not self.siif_logged():
+            return
+        report_id = params.get('id', '')
+        if report_id not in SIIF_REPORTS:
+            self.send(404, page('SIIF', f'Reporte {html.escape(report_id)} inexistente'))
+            return
+        inputs = ''.join(
+            f'<input id="pt1:{name}::content" name="{name}">'
+            for name in SIIF_FORM_INPUTS
+        )
+        export = (
+            "var q = 'id=" + report_id + "';"
+            "document.querySelectorAll('input[name]').forEach(function(i) {"
+            "q += '&' + i.name + '=' + encodeURIComponent(i.value);});"
+            "window.open('exportar.jspx?' + q, '_blank');"
+        )
+        self.send(200, page('SIIF - Reporte ' + report_id, (
+            f'{inputs}'
+            '<input id="pt1:rbtnXLS::content" type="radio" name="formato_radio" value="xls">'
+            f'<div id="pt1:btnVerReporte" onclick="{export}">Ver Reporte</div>'
+            f'<div id="pt1:btnEjecutarReporte" onclick="{export}">Ejecutar</div>'
+            '<div id="pt1:btnVolver" onclick="location.href=\'reportes.jspx\'">Volver</div>'
+        )))
+
+    # --------------------------------------------------
+    def siif_exportar_jspx(self, method:str, params:dict) -> None:
+        """Window the report opens; it then asks for the file"""
+        if not self.siif_logged():
+            return
+        query = urlencode(params)
+        self.send(200, page('SIIF - Exportando', (
+            f'<script>location.href = "descargar.jspx?{query}";</script>'
+        )))
+
+    # --------------------------------------------------
+    def siif_descargar_jspx(self, method:str, params:dict) -> None:
+        if not self.siif_logged():
+            return
+        file_name = SIIF_REPORTS.get(params.get('id'))
+        if file_name is None:
+            self.send(404, page('SIIF', 'Reporte inexistente'))
+            return
+        self.attachment(file_name, params, 'application/vnd.ms-excel')
+
+    # --------------------------------------------------
+    def attachment(self, file_name:str, params:dict, content_type:str) -> None:
+        try:
+            content = self.mock.serve_download(file_name, params)
+        except ConnectionError:
+            self.send(503, page('503', 'Servicio no disponible'))
+            return
+        self.send(200, content, content_type, {
+            'Content-Disposition': f'attachment; filename="{file_name}"'
+        })
+
+    # --- SGV ------------------------------------------
+    def sgv_login_aspx(self, method:str, params:dict) -> None:
+        if method == 'POST':
+            data = self.form()
+            token = self.mock.login(data.get('usuario'), data.get('clave'))
+            if token is not None:
+                self.redirect('App/Inicio.aspx', {
+                    'Set-Cookie': f'MOCKSESSION={token}; Path=/'
+                })
+                return
+        self.send(200, page('Gestión Vivienda', (
+            '<div class="login"><form method="post" action="login.aspx"><table>'
+            '<tr><td><input name="usuario"></td></tr>'
+            '<tr><td><input name="clave" type="password"></td></tr>'
+            '<tr><td><input type="submit" value="Ingresar"></td></tr>'
+            '</table></form></div>'
+        )))
+
+    # --------------------------------------------------
+    def sgv_logged(self) -> bool:
+        if self.mock.is_logged(self.token()):
+            return True
+        self.redirect(SGV_PREFIX + '/login.aspx')
+        return False
+
+    # --------------------------------------------------
+    def sgv_user_panel(self) -> str:
+        return (
+            '<span id="ctl00_UcPanelArribaUsuarioActual1_lblUsuario">usuario</span>'
+            f'<a id="ctl00_UcPanelArribaUsuarioActual1_linkCerrar" href="{SGV_PREFIX}/logout.aspx">Cerrar</a>'
+        )
+
+    # --------------------------------------------------
+    def sgv_App_Inicio_aspx(self, method:str, params:dict) -> None:
+        if not self.sgv_logged():
+            return
+        self.send(200, page('Gestión Vivienda', self.sgv_user_panel()))
+
+    # --------------------------------------------------
+    def sgv_logout_aspx(self, method:str, params:dict) -> None:
+        self.mock.logout(self.token())
+        self.redirect(SGV_PREFIX + '/login.aspx')
+
+    # --------------------------------------------------
+    def sgv_informe(self, method:str, params:dict) -> None:
+        if not self.sgv_logged():
+            return
+        informe = params.pop('informe')
+        if informe not in SGV_INFORMES:
+            self.send(404, page('404', 'Informe no simulado'))
+            return
+        input_id, _ = SGV_INFORMES[informe]
+        anio = params.get('anio', '')
+        mes = params.get('mes', '')
+        filters = (
+            '<table class="tablaFiltros"><tr>'
+            f'<td><input id="{input_id}" name="anio" value="{html.escape(anio)}"></td>'
+            f'<td><input name="mes" value="{html.escape(mes)}"></td>'
+            '</tr></table>'
+        )
+        report = ''
+        if anio:
+            query = urlencode({'informe': informe, 'anio': anio, 'mes': mes})
+            report = (
+                f'<a id="{SGV_EXPORT_ID.format(informe=informe)}" href="#" onclick="'
+                "document.getElementById('menu_exportar').style.display='block';"
+                'return false;">Exportar</a>'
+                '<div id="menu_exportar" style="display:none">'
+                f'<a title="Excel" href="{SGV_PREFIX}/exportar.aspx?{query}">Excel</a></div>'
+            )
+        body = nest_xpath(
+            SGV_REPORT_XPATH, f'<tbody><tr><td>{report}</td></tr></tbody>'
+        )
+        # The form is the page's body/form: filters go before the report
+        body = body.replace(
+            '<form>', f'<form method="get">{filters}{self.sgv_user_panel()}', 1
+        )
+        self.send(200, page('Gestión Vivienda - ' + informe, body))
+
+    # --------------------------------------------------
+    def sgv_exportar_aspx(self, method:str, params:dict) -> None:
+        if not self.sgv_logged():
+            return
+        informe = params.get('informe')
+        if informe not in SGV_INFORMES:
+            self.send(404, page('404', 'Informe no simulado'))
+            return
+        _, file_name = SGV_INFORMES[informe]
+        self.attachment(
+            file_name, params,
+            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+
+# --------------------------------------------------
+def get_args():
+    """Get needed params from user input"""
+    parser = argparse.ArgumentParser(
+        description = "Local SIIF and Gestión Vivienda stand-in",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        '-p', '--port',
+        default = 8900,
+        type=int,
+        help = "Port to listen on")
+
+    parser.add_argument(
+        '-f', '--fixtures',
+        default = None,
+        type=str,
+        help = "Folder with the files to serve (rf602.xls, ...)")
+
+    parser.add_argument(
+        '-l', '--latency',
+        default = 0.0,
+        type=float,
+        help = "Seconds each download takes")
+
+    parser.add_argument(
+        '--fail-rate',
+        default = 0.0,
+        type=float,
+        help = "Share of downloads answered with a 503")
+
+    return parser.parse_args()
+
+# --------------------------------------------------
+def main():
+    """Let's try it"""
+    args = get_args()
+    mock = MockServer(
+        fixtures_dir=args.fixtures, port=args.port, latency=args.latency,
+        fail_rate=args.fail_rate
+    ).start()
+    print(f"SIIF: {mock.siif_url}")
+    print(f"SGV:  {mock.sgv_url}")
+    try:
+        mock._thread.join()
+    except KeyboardInterrupt:
+        mock.stop()
+
+# --------------------------------------------------
+if __name__ == '__main__':
+    main()
+    # From invicodatpy root
+    # python -m tests.mock.siif_sgv_server -f tests/fixtures -l 0.5
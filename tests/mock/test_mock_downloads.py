@@ -0,0 +1,316 @@
+import os
+import threading
+import time
+
+import pytest
+import requests
+
+from src.invicodatpy.siif import siif_session_pool
+from src.invicodatpy.siif.connect_siif import ConnectSIIF
+from src.invicodatpy.siif.siif_http_fetcher import ReportRequest, SIIFHttpFetcher
+from src.invicodatpy.siif.siif_session_pool import SIIFSessionPool
+from src.invicodatpy.utils.downloads import move_download
+from src.invicodatpy.utils.job_queue import JobQueue
+from tests.mock.siif_sgv_server import SIIF_PREFIX, MockServer
+
+
+class HttpDriver():
+    """What the download code uses of a logged in webdriver, over HTTP"""
+    def __init__(self, login_url:str, username:str, password:str):
+        self.http = requests.Session()
+        response = self.http.post(
+            login_url, data={'username': username, 'password': password}
+        )
+        if not response.url.endswith('/main.jspx'):
+            raise ConnectionError("Login rejected by the mock server")
+        self.quitted = False
+
+    def get_cookies(self) -> list[dict]:
+        return [
+            {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path}
+            for c in self.http.cookies
+        ]
+
+    def execute_script(self, script:str) -> str:
+        return 'Mozilla/5.0 (mock)'
+
+    def quit(self) -> None:
+        self.quitted = True
+        self.http.close()
+
+
+class HttpSIIF(ConnectSIIF):
+    """Scoped SIIF session logged in to the mock server without a browser"""
+    def connect(self, username:str = '', password:str = '', invisible:bool = False):
+        if username != '':
+            self.username = username
+        if password != '':
+            self.password = password
+        self.invisible = invisible
+        self.driver = HttpDriver(self.url, self.username, self.password)
+        self.wait = None
+        self.logins = getattr(self, 'logins', 0) + 1
+
+    def go_to_reports(self):
+        pass
+
+    def disconnect(self):
+        self.driver.http.get(self.url.replace('login.jspx', 'logout.jspx'))
+
+    def quit(self):
+        self.driver.quit()
+
+
+class Rf602Download(HttpSIIF):
+    """Downloads rf602 as PptoGtosFteRf602 does (errors printed, session
+    disconnected unless raise_errors), over the session's HTTP client"""
+    running = 0
+    max_running = 0
+    raised = 0
+    lock = threading.Lock()
+
+    def download_report(
+        self, dir_path:str, ejercicios:str = '2024', raise_errors:bool = False
+    ):
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        try:
+            response = self.driver.http.get(
+                self.url.replace('login.jspx', 'descargar.jspx'),
+                params={'id': '38', 'txtAnioEjercicio': ejercicios}
+            )
+            response.raise_for_status()
+            if 'Content-Disposition' not in response.headers:
+                raise ConnectionError("Session expired")
+            with open(os.path.join(dir_path, 'rf602.xls'), 'wb') as f:
+                f.write(response.content)
+            self.rename_report(dir_path, 'rf602.xls', ejercicios + '-rf602.xls')
+        except Exception as e:
+            if raise_errors:
+                with cls.lock:
+                    cls.raised += 1
+                raise
+            print(f"Ocurrió un error: {e}, {type(e)}")
+            self.disconnect()
+        finally:
+            with cls.lock:
+                cls.running -= 1
+
+
+@pytest.fixture()
+def mock():
+    with MockServer(latency=0.05) as mock:
+        yield mock
+
+@pytest.fixture()
+def http_siif(mock, monkeypatch):
+    monkeypatch.setattr(ConnectSIIF, 'url', mock.siif_url)
+    monkeypatch.setattr(siif_session_pool, 'ConnectSIIF', HttpSIIF)
+    Rf602Download.running = Rf602Download.max_running = 0
+    Rf602Download.raised = 0
+    return mock
+
+def descargar_url(mock:MockServer) -> str:
+    return mock.base_url + SIIF_PREFIX + '/descargar.jspx'
+
+# --- SIIFSessionPool ------------------------------
+@pytest.mark.mock_server
+class TestMockSessionPool:
+    ejercicios = ['2019', '2020', '2021', '2022', '2023', '2024']
+
+    def download(
+        self, pool:SIIFSessionPool, dir_path:str, expected = None
+    ) -> list[dict]:
+        return pool.download_reports(Rf602Download, dir_path, [
+            {'ejercicios': ejercicio} for ejercicio in self.ejercicios
+        ], expected=expected)
+
+    def assert_downloaded(self, dir_path:str):
+        assert sorted(os.listdir(dir_path)) == [
+            ejercicio + '-rf602.xls' for ejercicio in self.ejercicios
+        ]
+
+    def test_every_job_downloaded(self, http_siif, tmp_path):
+        with SIIFSessionPool('u', 'p', size=3) as pool:
+            assert self.download(pool, str(tmp_path)) == []
+        self.assert_downloaded(str(tmp_path))
+        assert len(http_siif.downloads) == len(self.ejercicios)
+
+    def test_each_pool_keeps_its_host_limit(self, http_siif, tmp_path):
+        with SIIFSessionPool('u', 'p', size=3, max_per_host=3) as pool:
+            self.download(pool, str(tmp_path / 'a'))
+        Rf602Download.max_running = 0
+        with SIIFSessionPool('u', 'p', size=3, max_per_host=1) as pool:
+            assert self.download(pool, str(tmp_path / 'b')) == []
+        assert Rf602Download.max_running == 1
+        self.assert_downloaded(str(tmp_path / 'b'))
+
+    def test_sessions_log_in_again_after_a_failure(self, http_siif, tmp_path):
+        with SIIFSessionPool('u', 'p', size=2) as pool:
+            http_siif.expire_sessions()
+            assert self.download(pool, str(tmp_path)) == []
+            assert all(session.logins == 2 for session in pool.sessions)
+        # Errors were raised to the pool instead of printed
+        assert Rf602Download.raised == 2
+        self.assert_downloaded(str(tmp_path))
+
+    def test_jobs_missing_expected_files_fail(self, http_siif, tmp_path):
+        def expected(job):
+            return [job['ejercicios'] + '-rf602.xls', job['ejercicios'] + '-*.csv']
+
+        with SIIFSessionPool('u', 'p', size=2, retries=1) as pool:
+            failed = self.download(pool, str(tmp_path), expected)
+        assert sorted(job['ejercicios'] for job in failed) == self.ejercicios
+        # Every failed job was tried again
+        assert len(http_siif.downloads) == 2 * len(self.ejercicios)
+        self.assert_downloaded(str(tmp_path))
+
+    def test_sessions_retired_when_login_fails(self, http_siif, tmp_path):
+        with SIIFSessionPool('u', 'p', size=2, retries=3) as pool:
+            http_siif.users = {'u': 'changed'}
+            http_siif.expire_sessions()
+            failed = self.download(pool, str(tmp_path))
+        assert sorted(job['ejercicios'] for job in failed) == self.ejercicios
+        assert os.listdir(tmp_path) == []
+
+    def test_each_session_has_its_own_profile(self, http_siif, monkeypatch):
+        monkeypatch.setattr(HttpSIIF, 'user_data_dir', '/tmp/siif-profile')
+        with SIIFSessionPool('u', 'p', size=2) as pool:
+            profiles = [session.user_data_dir for session in pool.sessions]
+        assert sorted(profiles) == [
+            '/tmp/siif-profile_session_0', '/tmp/siif-profile_session_1'
+        ]
+
+# --- SIIFHttpFetcher ------------------------------
+@pytest.mark.mock_server
+class TestMockHttpFetcher:
+    def fetcher(self, mock:MockServer) -> SIIFHttpFetcher:
+        siif = HttpSIIF(scoped=True)
+        siif.connect('u', 'p', invisible=True)
+        return SIIFHttpFetcher(siif, pool_size=4)
+
+    def requests_for(self, mock:MockServer, ejercicios:list) -> list:
+        request = ReportRequest(
+            url=descargar_url(mock),
+            params={'id': '38', 'txtAnioEjercicio': '2024'}
+        )
+        return [
+            request.with_values(
+                file_name=ejercicio + '-rf602.xls', txtAnioEjercicio=ejercicio
+            ) for ejercicio in ejercicios
+        ]
+
+    def test_fetch_names_file_from_content_disposition(self, http_siif, tmp_path):
+        fetcher = self.fetcher(http_siif)
+        request = ReportRequest(url=descargar_url(http_siif), params={'id': '2079'})
+        path = fetcher.fetch(request, str(tmp_path))
+        assert path == os.path.join(tmp_path, 'rvicon03.xls')
+        assert os.listdir(tmp_path) == ['rvicon03.xls']
+
+    def test_relogin_replaces_the_expired_browser(self, http_siif, tmp_path):
+        fetcher = self.fetcher(http_siif)
+        expired_driver = fetcher.siif.driver
+        http_siif.expire_sessions()
+        fetcher.fetch(self.requests_for(http_siif, ['2024'])[0], str(tmp_path))
+        assert fetcher.siif.logins == 2
+        assert expired_driver.quitted
+        assert not fetcher.siif.driver.quitted
+        assert fetcher.siif.invisible
+        assert os.listdir(tmp_path) == ['2024-rf602.xls']
+
+    def test_fetch_many_logs_in_once(self, http_siif, tmp_path):
+        fetcher = self.fetcher(http_siif)
+        http_siif.expire_sessions()
+        ejercicios = ['2021', '2022', '2023', '2024']
+        paths = fetcher.fetch_many(
+            self.requests_for(http_siif, ejercicios), str(tmp_path)
+        )
+        assert paths == [
+            os.path.join(tmp_path, ejercicio + '-rf602.xls')
+            for ejercicio in ejercicios
+        ]
+        # Partial files are unique and always renamed or removed
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            os.path.basename(path) for path in paths
+        )
+        assert fetcher.siif.logins == 2
+        assert sorted(
+            download['params']['txtAnioEjercicio']
+            for download in http_siif.downloads
+        )[-4:] == ejercicios
+
+    def test_fetch_many_needs_distinct_file_names(self, http_siif, tmp_path):
+        fetcher = self.fetcher(http_siif)
+        request = ReportRequest(url=descargar_url(http_siif), params={'id': '38'})
+        with pytest.raises(ValueError):
+            fetcher.fetch_many([request, request], str(tmp_path))
+        named = request.with_values(file_name='rf602.xls')
+        with pytest.raises(ValueError):
+            fetcher.fetch_many([named, named], str(tmp_path))
+        assert http_siif.downloads == []
+
+# --- Download watcher -----------------------------
+@pytest.mark.mock_server
+def test_move_download_waits_for_the_browser(mock, tmp_path):
+    http = requests.Session()
+    http.post(mock.siif_url, data={'username': 'u', 'password': 'p'})
+
+    def browser_download():
+        # Chrome writes into name.crdownload and renames it when done
+        partial = tmp_path / 'rf602.xls.crdownload'
+        response = http.get(descargar_url(mock), params={'id': '38'}, stream=True)
+        with open(partial, 'wb') as f:
+            for chunk in response.iter_content(4):
+                f.write(chunk)
+                f.flush()
+                time.sleep(0.05)
+        os.replace(partial, tmp_path / 'rf602.xls')
+
+    browser = threading.Thread(target=browser_download)
+    browser.start()
+    try:
+        path = move_download(str(tmp_path), 'rf602.xls', '2024-rf602.xls', timeout=10)
+    finally:
+        browser.join()
+    with open(path, 'rb') as f:
+        assert f.read() == mock.fixture('rf602.xls')
+    assert os.listdir(tmp_path) == ['2024-rf602.xls']
+
+# --- JobQueue -------------------------------------
+@pytest.mark.mock_server
+def test_job_queue_retries_failed_downloads(mock, tmp_path):
+    http = requests.Session()
+    http.post(mock.siif_url, data={'username': 'u', 'password': 'p'})
+
+    def download(ejercicio):
+        response = http.get(
+            descargar_url(mock), params={'id': '38', 'txtAnioEjercicio': ejercicio}
+        )
+        response.raise_for_status()
+        (tmp_path / (ejercicio + '-rf602.xls')).write_bytes(response.content)
+
+    def is_done(ejercicio):
+        return (tmp_path / (ejercicio + '-rf602.xls')).exists()
+
+    job_queue = JobQueue(
+        str(tmp_path / 'jobs.sqlite'), max_attempts=3, backoff_base=0.01,
+        backoff_max=0.05
+    )
+    try:
+        job_queue.add_many('rf602', [{'ejercicio': '2023'}, {'ejercicio': '2024'}])
+        mock.fail_rate = 1.0
+        counts = job_queue.run({'rf602': download}, {'rf602': is_done})
+        assert counts == {'failed': 2}
+        assert len(mock.downloads) == 6
+        assert all(job.attempts == 3 for job in job_queue.jobs('failed'))
+        assert '503' in job_queue.jobs('failed')[0].last_error
+
+        mock.fail_rate = 0.0
+        job_queue.retry_failed()
+        counts = job_queue.run({'rf602': download}, {'rf602': is_done})
+        assert counts == {'done': 2}
+        assert is_done('2023') and is_done('2024')
+    finally:
+        job_queue.close()
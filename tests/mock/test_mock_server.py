@@ -0,0 +1,96 @@
+import os
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+import requests
+
+from tests.mock.siif_sgv_server import (
+    SGV_REPORT_XPATH, SIIF_PREFIX, nest_xpath
+)
+
+def test_nest_xpath():
+    body = ET.fromstring('<body>' + nest_xpath(SGV_REPORT_XPATH, '<p/>') + '</body>')
+    path = '/'.join(SGV_REPORT_XPATH.split('/')[3:])
+    assert body.find('./' + path + '/p') is not None
+
+@pytest.mark.mock_server
+@pytest.mark.usefixtures("setup_and_teardown_mock_server")
+class TestMockServer:
+    def login_siif(self) -> requests.Session:
+        http = requests.Session()
+        response = http.post(
+            self.mock.siif_url, data={'username': 'u', 'password': 'p'}
+        )
+        assert response.url.endswith('/main.jspx')
+        return http
+
+    def test_siif_login_page(self):
+        response = requests.get(self.mock.siif_url)
+        assert 'id="pt1:cb1"' in response.text
+        assert response.text.count('<input id="pt1:') == 2
+
+    def test_siif_requires_login(self):
+        response = requests.get(
+            self.mock.base_url + SIIF_PREFIX + '/reportes.jspx'
+        )
+        assert response.url == self.mock.siif_url
+
+    def test_siif_download(self):
+        http = self.login_siif()
+        response = http.get(
+            self.mock.base_url + SIIF_PREFIX + '/descargar.jspx',
+            params={'id': '38', 'txtAnioEjercicio': '2024'}
+        )
+        assert response.status_code == 200
+        assert 'filename="rf602.xls"' in response.headers['Content-Disposition']
+        assert self.mock.downloads[-1]['params']['txtAnioEjercicio'] == '2024'
+
+    def test_siif_failures_and_expired_sessions(self):
+        http = self.login_siif()
+        url = self.mock.base_url + SIIF_PREFIX + '/descargar.jspx?id=7'
+        self.mock.fail_rate = 1.0
+        try:
+            assert http.get(url).status_code == 503
+        finally:
+            self.mock.fail_rate = 0.0
+        self.mock.expire_sessions()
+        assert http.get(url).url == self.mock.siif_url
+
+    def test_sgv_informe(self):
+        http = requests.Session()
+        response = http.post(
+            self.mock.sgv_url + '/login.aspx',
+            data={'usuario': 'u', 'clave': 'p'}
+        )
+        assert 'lblUsuario' in response.text
+        response = http.get(
+            self.mock.sgv_url + '/App/Recupero/Informes/InformeSaldosPorBarrio.aspx',
+            params={'anio': '2024', 'mes': '12'}
+        )
+        assert 'title="Excel"' in response.text
+        response = http.get(
+            self.mock.sgv_url + '/exportar.aspx',
+            params={'informe': 'InformeSaldosPorBarrio', 'anio': '2024'}
+        )
+        assert 'Informe Saldos Por Barrio.xlsx' in response.headers['Content-Disposition']
+
+@pytest.mark.mock_server
+@pytest.mark.skipif(
+    not any(shutil.which(b) for b in ('google-chrome', 'chromium', 'chromium-browser')),
+    reason="Chrome is not installed"
+)
+@pytest.mark.usefixtures("setup_and_teardown_mock_server")
+class TestMockSIIFDownload:
+    def test_download_rf602(self, tmpdir):
+        from src.invicodatpy.siif import ConnectSIIF, PptoGtosFteRf602
+        dir_path = str(tmpdir)
+        siif_url, ConnectSIIF.url = ConnectSIIF.url, self.mock.siif_url
+        try:
+            ConnectSIIF.connect('u', 'p', invisible=True)
+            ConnectSIIF.go_to_reports()
+            PptoGtosFteRf602().download_report(dir_path, ejercicios='2024')
+            assert os.path.exists(os.path.join(dir_path, '2024-rf602.xls'))
+        finally:
+            ConnectSIIF.quit()
+            ConnectSIIF.url = siif_url
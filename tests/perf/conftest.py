@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+# Adding invicodatpy root to sys.path
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(os.path.dirname(current))
+sys.path.append(parent)
+
+BASELINES_PATH = os.path.join(current, 'baselines.json')
+
+
+class PerfBudget:
+    """
+    Time and memory budgets of perf tests: baseline * (1 + tolerance).
+    Tolerances can be widened on slow or shared machines with
+    INVICODAT_PERF_TIME_TOLERANCE / INVICODAT_PERF_MEMORY_TOLERANCE;
+    INVICODAT_PERF_UPDATE=1 stores what the tests measure as the new
+    baselines instead of checking them.
+    """
+    def __init__(self, path:str, update:bool = False):
+        self.path = path
+        self.update = update
+        with open(path, encoding='utf-8') as f:
+            self.data = json.load(f)
+        self.rows = self.data['rows']
+        self.time_tolerance = float(os.getenv(
+            'INVICODAT_PERF_TIME_TOLERANCE', self.data['time_tolerance']
+        ))
+        self.memory_tolerance = float(os.getenv(
+            'INVICODAT_PERF_MEMORY_TOLERANCE', self.data['memory_tolerance']
+        ))
+
+    def measure(self, setup, func, repeat:int = 3) -> tuple:
+        """Best time of repeat func(setup()) calls, and the peak memory
+        (tracemalloc) of one more, traced apart as tracing slows it down"""
+        timings = []
+        for _ in range(repeat):
+            args = setup()
+            start = time.perf_counter()
+            func(args)
+            timings.append(time.perf_counter() - start)
+        args = setup()
+        tracemalloc.start()
+        try:
+            func(args)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return min(timings), peak_memory
+
+    def check(self, name:str, seconds:float, peak_memory:int):
+        if self.update:
+            self.data['pipelines'][name] = {
+                'seconds': round(seconds, 4), 'peak_memory': peak_memory
+            }
+            return
+        baseline = self.data['pipelines'][name]
+        time_budget = baseline['seconds'] * (1 + self.time_tolerance)
+        memory_budget = baseline['peak_memory'] * (1 + self.memory_tolerance)
+        assert seconds <= time_budget, (
+            f"{name} took {seconds:.3f} s, budget {time_budget:.3f} s "
+            f"(baseline {baseline['seconds']:.3f} s)"
+        )
+        assert peak_memory <= memory_budget, (
+            f"{name} peaked at {peak_memory / 2**20:.1f} MiB, budget "
+            f"{memory_budget / 2**20:.1f} MiB"
+        )
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2)
+            f.write('\n')
+
+
+@pytest.fixture(scope = 'session')
+def perf_budget():
+    budget = PerfBudget(
+        BASELINES_PATH, os.getenv('INVICODAT_PERF_UPDATE', '') == '1'
+    )
+    yield budget
+    if budget.update:
+        budget.save()
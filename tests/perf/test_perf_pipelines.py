@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from src.invicodatpy.siif import (
+    ComprobantesGtosGpoPartGtoRpa03g, ComprobantesGtosRcg01Uejp,
+    DetallePartidasRog01, JoinComprobantesGtosGpoPart, MayorContableRcocc31
+)
+from src.invicodatpy.sscc import BancoINVICO
+from src.invicodatpy.utils.fixtures import synthetic_report
+
+def transformed(report_cls, name:str, rows:int):
+    report = report_cls()
+    report.df = synthetic_report(name, rows=rows)
+    report.transform_df()
+    return report
+
+@pytest.mark.perf
+class TestPerfPipelines:
+    def test_rcocc31_transform(self, perf_budget):
+        raw = synthetic_report('rcocc31', rows=perf_budget.rows)
+
+        def setup():
+            report = MayorContableRcocc31()
+            report.df = raw.copy()
+            return report
+
+        seconds, peak_memory = perf_budget.measure(
+            setup, lambda report: report.transform_df()
+        )
+        assert len(setup().transform_df()) == perf_budget.rows
+        perf_budget.check('rcocc31_transform', seconds, peak_memory)
+
+    def test_banco_invico_load(self, perf_budget, tmp_path):
+        report = transformed(BancoINVICO, 'banco_invico', perf_budget.rows)
+        sql_path = os.path.join(tmp_path, 'sscc.sqlite')
+
+        seconds, peak_memory = perf_budget.measure(
+            lambda: report, lambda report: report.to_sql(sql_path, replace=True)
+        )
+        assert len(BancoINVICO().from_sql(sql_path)) == len(report.df)
+        perf_budget.check('banco_invico_load', seconds, peak_memory)
+
+    def test_comprobantes_gtos_gpo_part_join(self, perf_budget, tmp_path):
+        sql_path = os.path.join(tmp_path, 'siif.sqlite')
+        for report_cls, name in (
+            (ComprobantesGtosGpoPartGtoRpa03g, 'rpa03g'),
+            (ComprobantesGtosRcg01Uejp, 'rcg01_uejp'),
+            (DetallePartidasRog01, 'rog01'),
+        ):
+            transformed(report_cls, name, perf_budget.rows).to_sql(
+                sql_path, replace=True
+            )
+
+        seconds, peak_memory = perf_budget.measure(
+            JoinComprobantesGtosGpoPart, lambda join: join.from_sql(sql_path)
+        )
+        df = JoinComprobantesGtosGpoPart().from_sql(sql_path)
+        assert len(df) == perf_budget.rows
+        assert df['cuit'].notna().all()
+        perf_budget.check('comprobantes_gtos_gpo_part_join', seconds, peak_memory)
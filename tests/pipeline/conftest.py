@@ -0,0 +1,7 @@
+import sys
+import os
+
+# Adding invicodatpy root to sys.path
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(os.path.dirname(current))
+sys.path.append(parent)
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from src.invicodatpy.cli import JOINS
+from src.invicodatpy.pipeline import DONE, SKIPPED, Pipeline
+from src.invicodatpy.utils.fixtures import write_fixture
+
+@pytest.mark.parametrize('join', list(JOINS))
+def test_pipeline_join_from_fixtures(join, tmp_path):
+    dir_path = str(tmp_path)
+    pipeline = Pipeline(
+        dir_path, [join], periods=['2024'], download=False,
+        output_format='csv', workers=1
+    )
+    pipeline.build()
+    for stage in pipeline.stages.values():
+        if stage.kind == 'parse':
+            write_fixture(stage.report, dir_path, rows=200)
+
+    statuses = pipeline.run()
+    join_status = statuses.pop('join:' + join)
+    assert set(statuses.values()) == {DONE}, statuses
+    output = os.path.join(dir_path, join + '.csv')
+    if join == 'resumen_mayor_contable':
+        # join_df is still a stub
+        assert join_status == SKIPPED and not os.path.exists(output)
+    else:
+        assert join_status == DONE and os.path.isfile(output)
+
+    # Nothing changed: every stage is skipped
+    rerun = Pipeline(
+        dir_path, [join], periods=['2024'], download=False,
+        output_format='csv', workers=1
+    )
+    assert DONE not in rerun.run().values()
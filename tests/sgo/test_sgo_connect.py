@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+from src.invicodatpy.sgo.connect_sgo import ConnectSGO
+from src.invicodatpy.utils.metrics import metrics
+
+
+def test_rename_report_labels_the_calling_report(tmp_path):
+    (tmp_path / 'ObrasCompleto1.xls').write_bytes(b'obras')
+    # Reports rename through their connection: self.sgo.rename_report(...)
+    sgo = SimpleNamespace()
+    ConnectSGO.rename_report(
+        sgo, str(tmp_path), 'ObrasCompleto*.xls', 'Obras Completo.xls',
+        timeout=5, report='listado_obras'
+    )
+    record = metrics.records[-1]
+    assert (record.report, record.stage) == ('listado_obras', 'download_file')
+    assert record.file == 'Obras Completo.xls'
+    ConnectSGO.rename_report(
+        sgo, str(tmp_path), 'Obras Completo.xls', 'obras.xls', timeout=5
+    )
+    assert metrics.records[-1].report == 'SimpleNamespace'
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from src.invicodatpy.sgo.lotes_certificados_pdf import (
+    LotesCertificadosPDF, parse_lote_text
+)
+
+LOTE_TEXT = """GOBIERNO DE LA PROVINCIA - LOTE DE CERTIFICADOS
+Obra Nro. Cert. Monto Certificado Retenciones Importe Neto
+1234-REFACCION   ESCUELA N 12   3  1.234.567,89  12.345,67  1.222.222,22
+987 - 40 VIVIENDAS GOYA 15 500,00 500,00
+Total del lote 1.234.567,89
+5555-OBRA SIN IMPORTES 2
+"""
+
+
+# --------------------------------------------------
+def write_pdf(path:str, lines:list[str]) -> None:
+    """Single page PDF with one text line per element"""
+    stream = 'BT /F1 10 Tf 50 800 Td 12 TL ' + ' '.join(
+        '(' + line + ') Tj T*' for line in lines
+    ) + ' ET'
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+        '/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+        f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream',
+    ]
+    content = '%PDF-1.4\n'
+    offsets = []
+    for n, body in enumerate(objects, 1):
+        offsets.append(len(content))
+        content += f'{n} 0 obj\n{body}\nendobj\n'
+    xref = len(content)
+    content += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'
+    content += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets)
+    content += (
+        f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+        f'startxref\n{xref}\n%%EOF\n'
+    )
+    with open(path, 'w', encoding='latin-1') as f:
+        f.write(content)
+
+def test_parse_lote_text():
+    rows = parse_lote_text(LOTE_TEXT)
+    assert rows == [
+        {
+            'cod_obra': '1234', 'obra': '1234-REFACCION ESCUELA N 12',
+            'nro_certificado': '3', 'monto_certificado': '1.234.567,89',
+            'importe_neto': '1.222.222,22',
+        },
+        {
+            'cod_obra': '987', 'obra': '987 - 40 VIVIENDAS GOYA',
+            'nro_certificado': '15', 'monto_certificado': '500,00',
+            'importe_neto': '500,00',
+        },
+    ]
+
+def test_parse_lote_text_ignores_other_lines():
+    assert parse_lote_text('') == []
+    assert parse_lote_text('Obra Nro. Cert. Importe\nPágina 1 de 2') == []
+
+def test_from_external_report_caches_by_hash(tmp_path):
+    pytest.importorskip('pypdf')
+    dir_path = str(tmp_path)
+    write_pdf(os.path.join(dir_path, 'lotecertificado-101.pdf'), [
+        '1234-REFACCION ESCUELA 3 1.500,00 1.450,00',
+    ])
+    write_pdf(os.path.join(dir_path, 'lotecertificado-102.pdf'), [
+        '987-VIVIENDAS GOYA 15 500,00 500,00',
+        '988-VIVIENDAS ESQUINA 1 2.000,50 1.900,25',
+    ])
+    report = LotesCertificadosPDF(max_workers=1)
+
+    # Miss: every PDF is parsed
+    df = report.from_external_report(dir_path)
+    assert report.stats['parsed'] == 2
+    assert len(df) == 3
+    assert df.loc[df['cod_obra'] == '988', 'importe_neto'].iloc[0] == 1900.25
+    assert df['nro_lote'].tolist() == ['101', '102', '102']
+
+    # Hit: same files, nothing parsed again
+    cached = report.from_external_report(dir_path)
+    assert report.stats['parsed'] == 0
+    assert cached.equals(df)
+
+    # A changed PDF has a new hash and is the only one parsed
+    write_pdf(os.path.join(dir_path, 'lotecertificado-101.pdf'), [
+        '1234-REFACCION ESCUELA 4 2.500,00 2.400,00',
+    ])
+    changed = report.from_external_report(dir_path)
+    assert report.stats['parsed'] == 1
+    assert changed.loc[changed['nro_lote'] == '101', 'nro_certificado'].tolist() == ['4']
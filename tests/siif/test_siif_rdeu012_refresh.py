@@ -0,0 +1,28 @@
+import os
+
+from src.invicodatpy.siif import DeudaFlotanteRdeu012
+from src.invicodatpy.utils.fixtures import write_fixture
+
+def test_refresh_loads_only_stale_snapshots(tmp_path):
+    dir_path = str(tmp_path)
+    sql_path = os.path.join(dir_path, 'siif.sqlite')
+    write_fixture('rdeu012', dir_path, rows=100, period='2024-06')
+    rdeu012 = DeudaFlotanteRdeu012()
+    assert rdeu012.stale_meses(sql_path, ['2024-06']) == ['2024-06']
+
+    # First refresh loads the mes, the second finds nothing stale
+    assert rdeu012.refresh(dir_path, sql_path, ['2024-06'], download=False) == ['2024-06']
+    assert rdeu012.stale_meses(sql_path, ['2024-06']) == []
+    assert rdeu012.refresh(dir_path, sql_path, ['2024-06'], download=False) == []
+    june = DeudaFlotanteRdeu012().from_sql(sql_path)
+    assert set(june['mes_hasta']) == {'06/2024'}
+
+    # A new mes is added without touching the loaded ones
+    write_fixture('rdeu012', dir_path, rows=50, period='2024-05')
+    refreshed = rdeu012.refresh(
+        dir_path, sql_path, ['2024-05', '2024-06'], download=False
+    )
+    assert refreshed == ['2024-05']
+    df = DeudaFlotanteRdeu012().from_sql(sql_path)
+    assert (df['mes_hasta'] == '06/2024').sum() == len(june)
+    assert (df['mes_hasta'] == '05/2024').sum() > 0
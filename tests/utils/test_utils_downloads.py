@@ -0,0 +1,33 @@
+import os
+import time
+
+import pytest
+
+from src.invicodatpy.utils.downloads import (
+    wait_for_download, wait_for_downloads_idle
+)
+
+def test_wait_for_download_times_out(tmp_path):
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        wait_for_download(str(tmp_path), 'rf602.xls', timeout=0.5)
+    assert 0.5 <= time.monotonic() - start < 3
+
+def test_wait_for_download_ignores_unfinished_files(tmp_path):
+    # A finished name next to its partial sibling is still downloading
+    (tmp_path / 'rf602.xls').write_bytes(b'old')
+    (tmp_path / 'rf602.xls.crdownload').write_bytes(b'new')
+    with pytest.raises(TimeoutError):
+        wait_for_download(str(tmp_path), 'rf602.xls', timeout=0.5)
+    os.remove(tmp_path / 'rf602.xls.crdownload')
+    path = wait_for_download(
+        str(tmp_path), '*.xls', timeout=2, stable_for=0.1
+    )
+    assert path == os.path.join(tmp_path, 'rf602.xls')
+
+def test_wait_for_downloads_idle_times_out(tmp_path):
+    (tmp_path / 'rf602.xls.part').write_bytes(b'')
+    with pytest.raises(TimeoutError):
+        wait_for_downloads_idle(str(tmp_path), timeout=0.3)
+    os.remove(tmp_path / 'rf602.xls.part')
+    wait_for_downloads_idle(str(tmp_path), timeout=0.3)
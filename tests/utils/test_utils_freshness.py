@@ -0,0 +1,76 @@
+import datetime as dt
+import json
+import os
+
+from src.invicodatpy.utils.freshness import FreshnessPolicy, period_end
+
+def write_report(dir_path, name:str) -> str:
+    path = os.path.join(dir_path, name)
+    with open(path, 'w') as f:
+        f.write('report')
+    return path
+
+def record(policy:FreshnessPolicy, dir_path, report:str, period:str,
+           name:str, downloaded_at:dt.datetime):
+    policy.record(report, str(dir_path), period, name)
+    manifest = policy.manifest(str(dir_path))
+    manifest.entries[report][period]['downloaded_at'] = (
+        downloaded_at.isoformat(timespec='seconds')
+    )
+
+def test_period_end_and_grace():
+    assert period_end('2024') == dt.date(2024, 12, 31)
+    assert period_end('2024-02') == dt.date(2024, 2, 29)
+    assert period_end('202312') == dt.date(2023, 12, 31)
+    policy = FreshnessPolicy(grace_months=3)
+    assert policy.closed_on('2024') == dt.date(2025, 3, 31)
+    assert policy.closed_on('2024-11') == dt.date(2025, 2, 28)
+    assert policy.closed_on('2024', grace_months=0) == dt.date(2024, 12, 31)
+
+def test_open_period_ttl(tmp_path):
+    policy = FreshnessPolicy(ttl_hours=6)
+    path = str(tmp_path / '2025-rf602.xls')
+    assert policy.needs_download('rf602', '2025', path)
+    write_report(tmp_path, '2025-rf602.xls')
+    downloaded_at = dt.datetime(2025, 6, 1, 8)
+    record(policy, tmp_path, 'rf602', '2025', '2025-rf602.xls', downloaded_at)
+    now = downloaded_at + dt.timedelta(hours=5)
+    assert not policy.needs_download('rf602', '2025', path, now=now)
+    now = downloaded_at + dt.timedelta(hours=7)
+    assert policy.needs_download('rf602', '2025', path, now=now)
+
+def test_closed_period_after_grace(tmp_path):
+    policy = FreshnessPolicy(ttl_hours=6, grace_months=3)
+    path = write_report(tmp_path, '2023-rf602.xls')
+    now = dt.datetime(2026, 1, 1)
+    # Downloaded while ejercicio 2023 still took entries: stale
+    record(policy, tmp_path, 'rf602', '2023', '2023-rf602.xls', dt.datetime(2024, 3, 31))
+    assert policy.needs_download('rf602', '2023', path, now=now)
+    # Downloaded once closed: never again
+    record(policy, tmp_path, 'rf602', '2023', '2023-rf602.xls', dt.datetime(2024, 4, 1))
+    assert not policy.needs_download('rf602', '2023', path, now=now)
+    # A longer grace for this report reopens it
+    assert policy.needs_download('rf602', '2023', path, grace_months=6, now=now)
+
+def test_files_without_manifest_use_their_mtime(tmp_path):
+    policy = FreshnessPolicy(ttl_hours=6)
+    now = dt.datetime.now()
+    ejercicio = str(now.year)
+    path = write_report(tmp_path, ejercicio + '-rf602.xls')
+    assert not policy.needs_download('rf602', ejercicio, path, now=now)
+    old = (now - dt.timedelta(hours=7)).timestamp()
+    os.utime(path, (old, old))
+    assert policy.needs_download('rf602', ejercicio, path, now=now)
+
+def test_select_and_persisted_manifest(tmp_path):
+    policy = FreshnessPolicy()
+    write_report(tmp_path, '2024-rf602.xls')
+    policy.record('rf602', str(tmp_path), '2024', '2024-rf602.xls')
+    periods = policy.select(
+        'rf602', str(tmp_path), ['2023', '2024'],
+        lambda period: period + '-rf602.xls'
+    )
+    assert periods == ['2023']
+    with open(tmp_path / policy.manifest_name, encoding='utf-8') as f:
+        entry = json.load(f)['rf602']['2024']
+    assert entry['file'] == '2024-rf602.xls' and entry['size'] == 6
@@ -0,0 +1,95 @@
+import time
+
+import pytest
+
+from src.invicodatpy.utils.job_queue import JobQueue
+
+@pytest.fixture()
+def job_queue(tmp_path):
+    job_queue = JobQueue(
+        str(tmp_path / 'jobs.sqlite'), max_attempts=3, backoff_base=10,
+        backoff_max=15
+    )
+    yield job_queue
+    job_queue.close()
+
+def test_claim_takes_each_job_once(job_queue):
+    job_queue.add_many('rf602', [{'ejercicio': '2023'}, {'ejercicio': '2024'}])
+    # Same (report, params): not queued twice
+    job_queue.add('rf602', {'ejercicio': '2023'})
+    first, second = job_queue.claim('rf602'), job_queue.claim('rf602')
+    assert [first.params, second.params] == [
+        {'ejercicio': '2023'}, {'ejercicio': '2024'}
+    ]
+    assert first.state == 'running' and first.attempts == 1
+    assert job_queue.claim('rf602') is None
+    assert job_queue.claim('rci02') is None
+    assert job_queue.counts() == {'running': 2}
+
+def test_fail_backs_off_then_gives_up(job_queue):
+    job_queue.add('rf602', {'ejercicio': '2024'})
+    for attempt, delay in ((1, 10), (2, 15)):
+        job = job_queue.claim()
+        assert job.attempts == attempt
+        before = time.time()
+        job_queue.fail(job, 'HTTPError: 503')
+        (pending,) = job_queue.jobs('pending')
+        # min(backoff_base * 2 ** (attempts - 1), backoff_max) plus jitter
+        assert before + delay <= pending.next_run_at <= time.time() + delay * 1.25
+        assert job_queue.claim() is None
+        job_queue._conn.execute('UPDATE jobs SET next_run_at = 0')
+    job = job_queue.claim()
+    job_queue.fail(job, 'HTTPError: 503')
+    (failed,) = job_queue.jobs('failed')
+    assert failed.attempts == 3 and failed.last_error == 'HTTPError: 503'
+
+    job_queue.retry_failed()
+    job = job_queue.claim()
+    assert job.attempts == 1
+    job_queue.complete(job)
+    assert job_queue.counts() == {'done': 1}
+
+def test_running_jobs_are_leased(tmp_path):
+    sql_path = str(tmp_path / 'jobs.sqlite')
+    crashed = JobQueue(sql_path, lease_seconds=0.3)
+    crashed.add_many('rf602', [{'ejercicio': '2023'}, {'ejercicio': '2024'}])
+    abandoned = crashed.claim()
+    crashed.close()
+
+    live = JobQueue(sql_path, lease_seconds=0.3)
+    running = live.claim()
+    # Opening the queue again does not take jobs from a live process
+    other = JobQueue(sql_path, lease_seconds=0.3)
+    assert other.claim() is None
+    time.sleep(0.4)
+    # Leases expired: both jobs can be taken again
+    recovered = [other.claim(), other.claim()]
+    assert sorted(job.id for job in recovered) == sorted(
+        [abandoned.id, running.id]
+    )
+    assert all(job.attempts == 2 for job in recovered)
+    live.close()
+    other.close()
+
+def test_run_checks_job_output(job_queue):
+    job_queue.backoff_base = 0
+    job_queue.add_many('rf602', [{'ejercicio': e} for e in ('2022', '2023', '2024')])
+    downloaded = {'2022'}
+    calls = []
+
+    def download(ejercicio):
+        calls.append(ejercicio)
+        # Prints its error instead of raising, as many download_report do
+        if ejercicio != '2024':
+            downloaded.add(ejercicio)
+
+    counts = job_queue.run(
+        {'rf602': download},
+        {'rf602': lambda ejercicio: ejercicio in downloaded}
+    )
+    assert counts == {'done': 2, 'failed': 1}
+    # Already there: not downloaded again
+    assert '2022' not in calls
+    assert calls.count('2024') == 3
+    (failed,) = job_queue.jobs('failed')
+    assert 'without its output' in failed.last_error
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.invicodatpy.utils.money import detect_decimal, parse_money
+
+def test_parse_money_dot_decimal():
+    amounts = pd.Series(['1,234.56', '-10.5', '1234', '', None], name='importe')
+    parsed = parse_money(amounts, decimal='.')
+    assert parsed.name == 'importe'
+    assert parsed.tolist()[:3] == [1234.56, -10.5, 1234.0]
+    assert parsed.iloc[3:].isna().all()
+
+def test_parse_money_comma_decimal_dataframe():
+    df = pd.DataFrame(
+        {'debitos': ['1.234.567,89', '0,50'], 'creditos': ['12,00', '-3,1']},
+        index=[10, 11]
+    )
+    parsed = parse_money(df, decimal=',')
+    expected = pd.DataFrame(
+        {'debitos': [1234567.89, 0.5], 'creditos': [12.0, -3.1]}, index=[10, 11]
+    )
+    pd.testing.assert_frame_equal(parsed, expected)
+
+def test_parse_money_detects_decimal():
+    assert detect_decimal(['1.234,56', '10,5', '7']) == ','
+    assert detect_decimal(['1,234.56', '10.5']) == '.'
+    # Ambiguous thousands only: defaults to '.'
+    assert detect_decimal(['1,234', '']) == '.'
+    assert parse_money(pd.Series(['1.234,56', '2,5'])).tolist() == [1234.56, 2.5]
+
+def test_parse_money_reports_invalid_values():
+    reported = []
+    df = pd.DataFrame({'a': ['1,00', 'n/a'], 'b': ['abc', '']}, index=['x', 'y'])
+    parsed = parse_money(df, decimal=',', on_invalid=reported.append)
+    assert np.isnan(parsed.loc['y', 'a']) and np.isnan(parsed.loc['x', 'b'])
+    assert parsed.loc['x', 'a'] == 1.0
+    invalid = reported[0]
+    assert invalid.values.tolist() == [['x', 'b', 'abc'], ['y', 'a', 'n/a']]
+
+def test_parse_money_rejects_unknown_decimal():
+    with pytest.raises(ValueError):
+        parse_money(pd.Series(['1']), decimal=';')
@@ -0,0 +1,31 @@
+import pandas as pd
+
+from src.invicodatpy.utils.periods import (
+    ejercicio_from, mes_from, nro_comprobante_from, parse_date, parse_dates
+)
+
+def test_parse_dates_matches_to_datetime():
+    dates = pd.Series(
+        ['31/01/2024', '15/02/2024', None, '31/01/2024'], index=[3, 5, 7, 9],
+        name='fecha'
+    )
+    parsed = parse_dates(dates, format='%d/%m/%Y')
+    expected = pd.to_datetime(dates, format='%d/%m/%Y')
+    pd.testing.assert_series_equal(parsed, expected)
+
+def test_parse_date_is_cached():
+    assert parse_date('2024-03-31') is parse_date('2024-03-31')
+
+def test_ejercicio_and_mes():
+    fecha = pd.Series(pd.to_datetime(['2023-12-31', '2024-01-02', None]))
+    assert ejercicio_from(fecha).tolist() == ['2023', '2024', None]
+    assert mes_from(fecha).tolist() == ['12/2023', '01/2024', None]
+    # SIIF closes movements into their ejercicio
+    ejercicio = pd.Series(['2024', '2024', '2024'])
+    assert mes_from(fecha, ejercicio).tolist() == ['12/2024', '01/2024', None]
+    assert mes_from(fecha, '2025').tolist() == ['12/2025', '01/2025', None]
+
+def test_nro_comprobante():
+    nro = pd.Series(['12', '34567'])
+    mes = pd.Series(['01/2024', '12/2023'])
+    assert nro_comprobante_from(nro, mes).tolist() == ['00012/24', '34567/23']